@@ -0,0 +1,3 @@
+"""
+Benchmarks package - Performance and memory measurements (run with python -m)
+"""
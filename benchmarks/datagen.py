@@ -0,0 +1,114 @@
+"""
+Data Generator - Writes synthetic events.json and users.json for benchmarks
+
+Popularity is skewed on both sides: attendee counts follow a Pareto
+distribution (most events are small, a few fill up) and attendees are
+drawn from a Zipf-like user ranking (a few users register for a lot).
+
+Usage:
+    python -m benchmarks.datagen --events 100000 --users 20000 --out /tmp/cems
+"""
+
+import argparse
+import itertools
+import json
+import os
+import random
+
+ROLES = ["Admin", "Organizer", "Student", "Visitor"]
+ROLE_WEIGHTS = [1, 5, 80, 14]
+LOCATIONS = ["Main Hall", "Computer Lab A", "Sports Complex", "Library", "Auditorium"]
+WORDS = ["Workshop", "Seminar", "Hackathon", "Concert", "Lecture", "Meetup", "Fair"]
+
+
+def user_weights(count, skew=1.1):
+    """Cumulative Zipf-like weights for users ranked by activity"""
+    return list(itertools.accumulate(1 / (rank + 1) ** skew for rank in range(count)))
+
+
+def generate(event_count, user_count, organizers=None, seed=1, skew=1.1):
+    """Return (event records, user records) with consistent registrations"""
+    rng = random.Random(seed)
+    organizers = organizers or max(1, user_count // 20)
+    usernames = [f"user{i}" for i in range(user_count)]
+    roles = [
+        "Organizer" if i < organizers else rng.choices(ROLES, ROLE_WEIGHTS)[0]
+        for i in range(user_count)
+    ]
+    # Shuffle who is popular so ranking does not follow the username order
+    ranking = list(range(user_count))
+    rng.shuffle(ranking)
+    weights = user_weights(user_count, skew)
+
+    registered = [[] for _ in range(user_count)]
+    events = []
+    for event_id in range(1, event_count + 1):
+        capacity = rng.choice((20, 50, 100, 200, 500))
+        wanted = min(capacity, int(3 * (rng.paretovariate(1.2) - 1)), user_count)
+        attendees = set()
+        while len(attendees) < wanted:
+            attendees.update(
+                ranking[i]
+                for i in rng.choices(
+                    range(user_count), cum_weights=weights, k=wanted - len(attendees)
+                )
+            )
+        for user in attendees:
+            registered[user].append(event_id)
+
+        events.append(
+            {
+                "id": event_id,
+                "name": f"{rng.choice(WORDS)} {event_id}",
+                "date": f"{rng.choice((2025, 2026))}-{rng.randint(1, 12):02d}"
+                f"-{rng.randint(1, 28):02d}",
+                "capacity": capacity,
+                "location": rng.choice(LOCATIONS),
+                "description": f"Synthetic event number {event_id}",
+                "organizer": usernames[rng.randrange(organizers)],
+                "attendees": [usernames[user] for user in sorted(attendees)],
+            }
+        )
+
+    users = [
+        {
+            "username": username,
+            "password": "123",
+            "role": role,
+            "email": f"{username}@campus.edu",
+            "full_name": f"User {i}",
+            "registered_events": registered[i],
+        }
+        for i, (username, role) in enumerate(zip(usernames, roles))
+    ]
+    return events, users
+
+
+def write(directory, event_count, user_count, seed=1, skew=1.1):
+    """Write data/events.json and users.json under directory, return their paths"""
+    events, users = generate(event_count, user_count, seed=seed, skew=skew)
+    events_file = os.path.join(directory, "data", "events.json")
+    users_file = os.path.join(directory, "users.json")
+    os.makedirs(os.path.dirname(events_file), exist_ok=True)
+    with open(events_file, "w", encoding="utf-8") as f:
+        json.dump(events, f)
+    with open(users_file, "w", encoding="utf-8") as f:
+        json.dump(users, f)
+    return events_file, users_file
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate synthetic data")
+    parser.add_argument("--events", type=int, default=1000)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--skew", type=float, default=1.1, help="Zipf exponent")
+    parser.add_argument("--out", required=True, help="target directory")
+    args = parser.parse_args(argv)
+
+    paths = write(args.out, args.events, args.users, args.seed, args.skew)
+    print(f"Wrote {args.events} events and {args.users} users to {', '.join(paths)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Memory Benchmark - Reports bytes per Event and per User
+
+Compares the slotted models against the original dict-based layout.
+
+Usage:
+    python -m benchmarks.memory_benchmark [--events N] [--users N] [--attendees N]
+"""
+
+import argparse
+import json
+import random
+import tracemalloc
+
+from models.event import Event
+from models.user import User
+
+ROLES = ["Admin", "Organizer", "Student", "Visitor"]
+LOCATIONS = ["Main Hall", "Computer Lab A", "Sports Complex", "Library", "Auditorium"]
+
+
+class LegacyEvent:
+    """Original Event layout with a per-instance __dict__"""
+
+    def __init__(self, data):
+        self.id = data.get("id")
+        self.name = data.get("name")
+        self.date = data.get("date")
+        self.capacity = data.get("capacity")
+        self.location = data.get("location")
+        self.description = data.get("description")
+        self.organizer = data.get("organizer")
+        self.attendees = data.get("attendees", [])
+
+
+class LegacyUser:
+    """Original User layout with a per-instance __dict__"""
+
+    def __init__(self, data):
+        self.username = data.get("username")
+        self.password = data.get("password")
+        self.role = data.get("role")
+        self.email = data.get("email")
+        self.full_name = data.get("full_name")
+        self.registered_events = data.get("registered_events", [])
+
+
+def make_event_records(count, organizers=50, attendees=0, users=1000, seed=1):
+    rng = random.Random(seed)
+    return [
+        {
+            "id": i,
+            "name": f"Event {i}",
+            "date": f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+            "capacity": rng.randint(10, 500),
+            "location": rng.choice(LOCATIONS),
+            "description": f"Description for event {i}",
+            "organizer": f"organizer{rng.randrange(organizers)}",
+            "attendees": [
+                f"user{u}" for u in rng.sample(range(users), min(attendees, users))
+            ],
+        }
+        for i in range(1, count + 1)
+    ]
+
+
+def make_user_records(count, seed=1):
+    rng = random.Random(seed)
+    return [
+        {
+            "username": f"user{i}",
+            "password": "123",
+            "role": rng.choice(ROLES),
+            "email": f"user{i}@campus.edu",
+            "full_name": f"User {i}",
+            "registered_events": rng.sample(range(1, 1000), 5),
+        }
+        for i in range(count)
+    ]
+
+
+def measure(factory, text):
+    """Return bytes retained per object loaded from JSON text"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    # Decoded records are dropped after loading, as in the services
+    objects = [factory(r) for r in json.loads(text)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    # Exclude the list holding the objects
+    return (after - before - objects.__sizeof__()) / len(objects)
+
+
+def run(event_count, user_count, attendees=0):
+    event_text = json.dumps(
+        make_event_records(event_count, attendees=attendees, users=user_count)
+    )
+    user_text = json.dumps(make_user_records(user_count))
+
+    results = {
+        "events": event_count,
+        "users": user_count,
+        "attendees_per_event": attendees,
+        "bytes_per_event_before": measure(LegacyEvent, event_text),
+        "bytes_per_event_after": measure(Event.from_dict, event_text),
+        "bytes_per_user_before": measure(LegacyUser, user_text),
+        "bytes_per_user_after": measure(User.from_dict, user_text),
+    }
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure model memory usage")
+    parser.add_argument("--events", type=int, default=100000)
+    parser.add_argument("--users", type=int, default=100000)
+    parser.add_argument("--attendees", type=int, default=20, help="per event")
+    args = parser.parse_args(argv)
+
+    results = run(args.events, args.users, args.attendees)
+    print(
+        f"Events: {results['events']}, Users: {results['users']}, "
+        f"Attendees per event: {results['attendees_per_event']}"
+    )
+    print(
+        f"Event: {results['bytes_per_event_before']:.0f} -> "
+        f"{results['bytes_per_event_after']:.0f} bytes"
+    )
+    print(
+        f"User:  {results['bytes_per_user_before']:.0f} -> "
+        f"{results['bytes_per_user_after']:.0f} bytes"
+    )
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+"""
+Service Benchmark - Times the main service operations on synthetic data
+
+Results are written as JSON. With --baseline each timing is compared to a
+saved result and the run fails when one is slower than the threshold.
+
+Usage:
+    python -m benchmarks.service_benchmark --events 100000 --users 20000
+    python -m benchmarks.service_benchmark --output baseline.json
+    python -m benchmarks.service_benchmark --baseline baseline.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+from benchmarks import datagen
+from services.event_service import EventService
+from services.user_service import UserService
+
+# Number of calls timed per repeat for the cheap per-item operations
+LOOKUPS = 1000
+QUERIES = 20
+
+
+def timed(function, calls=1):
+    """Return seconds per call of function()"""
+    start = time.perf_counter()
+    for _ in range(calls):
+        function()
+    return (time.perf_counter() - start) / calls
+
+
+def run_once(directory, events_file, users_file, rng, storage="json"):
+    """Time every operation once and return {name: seconds per call}"""
+    results = {}
+    holder = {}
+
+    def load():
+        holder["events"] = EventService(data_file=events_file, storage=storage)
+
+    results["load_events"] = timed(load)
+    events = holder["events"]
+    results["save_events"] = timed(events.save_events)
+
+    # Loaded events only: partitioned storage keeps past months archived
+    ids = [rng.choice(events.events).id for _ in range(LOOKUPS)]
+    lookups = iter(ids)
+    results["get_event_by_id"] = timed(
+        lambda: events.get_event_by_id(next(lookups)), LOOKUPS
+    )
+
+    keywords = iter(rng.choice(datagen.WORDS).lower() for _ in range(QUERIES))
+
+    def search():
+        # Time the search itself, not a QueryCache hit on a repeated keyword
+        events.query_cache.clear()
+        events.search_events(keyword=next(keywords))
+
+    results["search_events"] = timed(search, QUERIES)
+
+    # Users have no partitioned format
+    user_storage = storage if storage in UserService.STORAGE_FORMATS else "json"
+
+    def load_users():
+        holder["users"] = UserService(data_file=users_file, storage=user_storage)
+
+    results["load_users"] = timed(load_users)
+    users = holder["users"].users
+    sample = [rng.choice(users) for _ in range(QUERIES)]
+
+    usernames = iter(user.username for user in sample)
+    results["get_user_registered_events"] = timed(
+        lambda: events.get_user_registered_events(next(usernames)), QUERIES
+    )
+    results["get_statistics"] = timed(events.get_statistics)
+
+    csv_file = os.path.join(directory, "reports", "events_report.csv")
+    results["export_to_csv"] = timed(lambda: events.export_to_csv(csv_file))
+
+    credentials = iter((user.username, user.password) for user in sample)
+    results["authenticate_without_role"] = timed(
+        lambda: holder["users"].authenticate_without_role(*next(credentials)),
+        QUERIES,
+    )
+    return results
+
+
+def run(event_count, user_count, repeat=3, seed=1, storage="json"):
+    """Generate data, run every operation repeat times and return the report"""
+    with tempfile.TemporaryDirectory() as directory:
+        events_file, users_file = datagen.write(
+            directory, event_count, user_count, seed=seed
+        )
+        rng = random.Random(seed)
+        samples = [
+            run_once(directory, events_file, users_file, rng, storage)
+            for _ in range(repeat)
+        ]
+
+    return {
+        "config": {
+            "events": event_count,
+            "users": user_count,
+            "repeat": repeat,
+            "seed": seed,
+            "storage": storage,
+            "python": platform.python_version(),
+        },
+        "seconds": {
+            name: statistics.median(sample[name] for sample in samples)
+            for name in samples[0]
+        },
+    }
+
+
+def compare(report, baseline, threshold=0.2):
+    """Return {name: current / baseline} and the names slower than threshold"""
+    ratios = {}
+    regressions = []
+    for name, seconds in report["seconds"].items():
+        before = baseline["seconds"].get(name)
+        if not before:
+            continue
+        ratios[name] = seconds / before
+        if ratios[name] > 1 + threshold:
+            regressions.append(name)
+    return ratios, regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark service operations")
+    parser.add_argument("--events", type=int, default=10000)
+    parser.add_argument("--users", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument(
+        "--storage", choices=EventService.STORAGE_FORMATS, default="json"
+    )
+    parser.add_argument("--output", help="write the JSON report to this file")
+    parser.add_argument("--baseline", help="compare against a saved report")
+    parser.add_argument(
+        "--threshold", type=float, default=0.2, help="allowed slowdown (0.2 = 20%%)"
+    )
+    args = parser.parse_args(argv)
+
+    report = run(args.events, args.users, args.repeat, args.seed, args.storage)
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline["config"] != report["config"]:
+            print(
+                "Warning: baseline was recorded with a different configuration",
+                file=sys.stderr,
+            )
+        ratios, regressions = compare(report, baseline, args.threshold)
+        report["baseline"] = {
+            "file": args.baseline,
+            "ratios": ratios,
+            "regressions": regressions,
+        }
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+    print(text)
+
+    if regressions:
+        print(f"Regressions: {', '.join(regressions)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,156 @@
+"""
+Startup Benchmark - Reports time to first frame and to an interactive dashboard
+
+Each run starts a fresh interpreter so module imports are included. The
+"preloaded" mode is the normal startup path; "blocking" loads everything
+on the main thread first, as the application did before the preloader.
+Needs a display (or Xvfb).
+
+Usage:
+    python -m benchmarks.startup_benchmark [--runs N] [--role ROLE] [--think SECONDS]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+MODES = ("preloaded", "blocking")
+
+
+def wait(root, seconds):
+    """Keep the event loop running for a while, like a user typing"""
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        root.update()
+        time.sleep(0.01)
+
+
+def find_user(users, role):
+    for user in users:
+        if user.role == role:
+            return user
+    raise ValueError(f"No user with role {role}")
+
+
+def open_window(role, root, user, **services):
+    if role == "Admin":
+        from ui.admin_ui import AdminWindow
+
+        return AdminWindow(root, user, **services)
+    if role == "Organizer":
+        from ui.organizer_ui import OrganizerWindow
+
+        return OrganizerWindow(root, user, **services)
+    from ui.student_ui import StudentWindow
+
+    return StudentWindow(root, user, **services)
+
+
+def run_once(mode, role, think):
+    """Start the application in this process and return timings in seconds"""
+    start = time.perf_counter()
+    import tkinter as tk
+
+    if mode == "preloaded":
+        from ui.login_ui import LoginWindow
+        from ui.preloader import Preloader
+
+        preloader = Preloader().start()
+        root = tk.Tk()
+        login = LoginWindow(root, preloader)
+        root.update()
+        first_frame = time.perf_counter() - start
+
+        wait(root, think)
+        clicked = time.perf_counter()
+        login.user_service = preloader.get("user_service")
+        user = find_user(login.user_service.users, role)
+        new_root = login.create_dashboard(user)
+    else:
+        from services.user_service import UserService
+
+        user_service = UserService()
+        root = tk.Tk()
+        root.title("Campus Event Management - Login")
+        root.update()
+        first_frame = time.perf_counter() - start
+
+        wait(root, think)
+        clicked = time.perf_counter()
+        user = find_user(user_service.users, role)
+        root.destroy()
+        new_root = tk.Tk()
+        open_window(role, new_root, user)
+
+    new_root.update()
+    dashboard = time.perf_counter() - clicked
+    new_root.destroy()
+    return {"first_frame": first_frame, "login_to_dashboard": dashboard}
+
+
+def run(runs, role, think):
+    """Run every mode in fresh interpreters and return median timings"""
+    results = {}
+    for mode in MODES:
+        samples = []
+        for _ in range(runs):
+            output = subprocess.run(
+                [
+                    sys.executable,
+                    "-m",
+                    "benchmarks.startup_benchmark",
+                    "--child",
+                    mode,
+                    "--role",
+                    role,
+                    "--think",
+                    str(think),
+                ],
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout
+            samples.append(json.loads(output.strip().splitlines()[-1]))
+        results[mode] = {
+            key: statistics.median(sample[key] for sample in samples)
+            for key in samples[0]
+        }
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure application startup")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--role", default="Admin")
+    parser.add_argument(
+        "--think", type=float, default=1.0, help="seconds spent on the login form"
+    )
+    parser.add_argument("--child", choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        print(json.dumps(run_once(args.child, args.role, args.think)))
+        return None
+
+    import tkinter as tk
+
+    try:
+        tk.Tk().destroy()
+    except tk.TclError as e:
+        print(f"No display available: {e}")
+        return None
+
+    results = run(args.runs, args.role, args.think)
+    for mode, timings in results.items():
+        print(
+            f"{mode:<10} first frame: {timings['first_frame'] * 1000:7.1f} ms   "
+            f"login to dashboard: {timings['login_to_dashboard'] * 1000:7.1f} ms"
+        )
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,98 @@
+import argparse
 import tkinter as tk
 from ui.login_ui import LoginWindow
+from ui.preloader import Preloader
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Campus Event Management System")
+    parser.add_argument(
+        "--metrics",
+        metavar="FILE",
+        help="collect service metrics and write them to FILE periodically",
+    )
+    parser.add_argument(
+        "--metrics-interval",
+        type=float,
+        default=60.0,
+        metavar="SECONDS",
+        help="how often the metrics file is rewritten",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="profiles",
+        metavar="DIR",
+        help="sample the UI and write per-action flamegraph stacks to DIR on exit",
+    )
+    parser.add_argument(
+        "--no-watchdog",
+        action="store_true",
+        help="do not monitor the UI for stalls",
+    )
+    parser.add_argument(
+        "--stall-threshold",
+        type=float,
+        default=250,
+        metavar="MS",
+        help="event-loop delay reported as a stall (default 250)",
+    )
+    parser.add_argument(
+        "--storage",
+        choices=("json", "snapshot", "partitioned"),
+        default="json",
+        help="event storage format (users use snapshot or json)",
+    )
+    parser.add_argument(
+        "--lazy",
+        action="store_true",
+        help="keep only list-view event fields in memory (snapshot storage)",
+    )
+    return parser.parse_args(argv)
+
+
+def service_options(args):
+    """Return the EventService and UserService kwargs for the parsed arguments"""
+    event_options = {"columnar": True, "storage": args.storage, "lazy": args.lazy}
+    user_storage = "snapshot" if args.storage == "snapshot" else "json"
+    return event_options, {"storage": user_storage}
+
 
 if __name__ == "__main__":
-    root = tk.Tk()
-    app = LoginWindow(root)
-    root.mainloop()
+    args = parse_args()
+    if args.metrics:
+        from services import instrumentation
+
+        instrumentation.enable(dump_file=args.metrics, interval=args.metrics_interval)
+    if args.profile:
+        from ui import callbacks
+        from ui.profiler import SamplingProfiler
+
+        # Must run before any widget registers a callback
+        callbacks.install()
+        profiler = SamplingProfiler().start()
+    if not args.no_watchdog:
+        from ui.watchdog import Watchdog
+
+        # Windows attach their Tk root as they are created
+        threshold = args.stall_threshold / 1000
+        watchdog = Watchdog(interval=min(0.1, threshold / 2), threshold=threshold)
+        watchdog.start()
+
+    # Start loading data right away so it overlaps with creating the window
+    event_options, user_options = service_options(args)
+    preloader = Preloader(event_options, user_options).start()
+    try:
+        root = tk.Tk()
+        app = LoginWindow(root, preloader)
+        root.mainloop()
+    finally:
+        if not args.no_watchdog:
+            watchdog.stop()
+        if args.profile:
+            profiler.stop()
+            profiler.write(args.profile)
+            print(profiler.summary())
+            print(f"Collapsed stacks written to {args.profile}/")
+        if args.metrics:
+            instrumentation.disable()
@@ -0,0 +1,39 @@
+"""
+Date helpers shared by the models
+"""
+from datetime import date, datetime
+
+DATE_FORMAT = "%Y-%m-%d"
+# Distinct date strings are few, but bound the cache against junk input
+MAX_CACHED_DATES = 100000
+
+_parsed = {}  # Date string -> (canonical text, day ordinal)
+
+
+def parse_date(value):
+    """
+    Return the canonical YYYY-MM-DD text and day ordinal of a date (cached).
+
+    Unpadded input such as "2030-1-5" becomes "2030-01-05"; invalid dates
+    keep their text and get ordinal 0.
+    """
+    parsed = _parsed.get(value)
+    if parsed is None:
+        try:
+            day = datetime.strptime(value, DATE_FORMAT).date()
+            parsed = (day.isoformat(), day.toordinal())
+        except (TypeError, ValueError):
+            parsed = (value, 0)
+        if len(_parsed) < MAX_CACHED_DATES:
+            _parsed[value] = parsed
+    return parsed
+
+
+def date_ordinal(value):
+    """Return the day ordinal of a YYYY-MM-DD string, 0 if invalid (cached)"""
+    return parse_date(value)[1]
+
+
+def today_ordinal():
+    """Return the day ordinal of the current local date"""
+    return date.today().toordinal()
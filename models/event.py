@@ -1,9 +1,31 @@
 """
 Event Model - Represents campus events
 """
+import heapq
+import time
 from datetime import datetime
+from .dates import parse_date, today_ordinal
+from .strings import intern_str
+from .symbols import NameList
+
+# Share of seats taken from which an event counts as almost full
+ALMOST_FULL = 0.9
 
 class Event:
+    # Slots drop the per-instance __dict__; large catalogs hold many events
+    __slots__ = (
+        "id",
+        "name",
+        "_date",
+        "date_ordinal",
+        "capacity",
+        "location",
+        "description",
+        "organizer",
+        "attendees",
+        "waitlist",
+    )
+
     def __init__(
         self,
         event_id,
@@ -18,10 +40,37 @@ class Event:
         self.name = name
         self.date = date  # Format: YYYY-MM-DD
         self.capacity = capacity
-        self.location = location
+        self.location = intern_str(location)
         self.description = description
-        self.organizer = organizer  # Username of organizer
-        self.attendees = []  # List of attendee usernames
+        self.organizer = intern_str(organizer)  # Username of organizer
+        self.attendees = NameList()  # Attendee usernames, stored as symbol ids
+        self.waitlist = []  # Heap of [priority, joined_at, username]
+
+    @property
+    def date(self):
+        return self._date
+
+    @date.setter
+    def date(self, value):
+        # Parse once here so date filters compare plain integers, and keep
+        # one spelling per day so text and ordinal order agree
+        text, self.date_ordinal = parse_date(value)  # Ordinal 0 if invalid
+        self._date = intern_str(text)
+
+    def copy(self):
+        """Return a copy that shares no mutable state with this event"""
+        event = Event(
+            self.id,
+            self.name,
+            self.date,
+            self.capacity,
+            self.location,
+            self.description,
+            self.organizer,
+        )
+        event.attendees = self.attendees.copy()
+        event.waitlist = list(self.waitlist)  # Entries are never changed in place
+        return event
 
     def to_dict(self):
         """Convert event object to dictionary for JSON storage"""
@@ -33,28 +82,54 @@ class Event:
             "location": self.location,
             "description": self.description,
             "organizer": self.organizer,
-            "attendees": self.attendees,
+            "attendees": self.attendees.to_list(),
+            "waitlist": self.waitlist_to_list(),
         }
 
+    def waitlist_to_list(self):
+        """Return the waitlist in promotion order as JSON-ready dicts"""
+        return [
+            {"username": username, "priority": priority, "joined_at": joined_at}
+            for priority, joined_at, username in sorted(self.waitlist)
+        ]
+
     @staticmethod
     def from_dict(data):
         """Create event object from dictionary"""
         event = Event(
             data.get("id"), data.get("name"), data.get("date"), data.get("capacity")
         )
-        event.location = data.get("location")
+        event.location = intern_str(data.get("location"))
         event.description = data.get("description")
-        event.organizer = data.get("organizer")
-        event.attendees = data.get("attendees", [])
+        event.organizer = intern_str(data.get("organizer"))
+        event.attendees = NameList(data.get("attendees", []))
+        event.waitlist = [
+            [w.get("priority", 0), w.get("joined_at", 0), intern_str(w["username"])]
+            for w in data.get("waitlist", [])
+        ]
+        heapq.heapify(event.waitlist)
         return event
 
+    def attendee_count(self):
+        """Return number of registered attendees"""
+        return len(self.attendees)
+
+    def has_attendee(self, username):
+        """Check if a user is registered"""
+        return username in self.attendees
+
     def is_full(self):
         """Check if event has reached capacity"""
-        return len(self.attendees) >= self.capacity
+        return self.attendee_count() >= self.capacity
 
     def available_slots(self):
         """Return number of available slots"""
-        return self.capacity - len(self.attendees)
+        return self.capacity - self.attendee_count()
+
+    def is_almost_full(self, threshold=ALMOST_FULL):
+        """Check if event has free slots but at least threshold of them are taken"""
+        count = self.attendee_count()
+        return count < self.capacity and count >= threshold * self.capacity
 
     def add_attendee(self, username):
         """Add an attendee to the event"""
@@ -65,18 +140,112 @@ class Event:
         self.attendees.append(username)
 
     def remove_attendee(self, username):
-        """Remove an attendee from the event"""
+        """Remove an attendee and return usernames promoted from the waitlist"""
         if username not in self.attendees:
             raise ValueError("User not registered")
         self.attendees.remove(username)
+        return self.promote_waitlist()
+
+    def add_attendees(self, usernames):
+        """
+        Register several users at once and return the newly added usernames.
+
+        Users already registered are skipped. Nobody is added if the new
+        attendees do not all fit.
+        """
+        registered = set(self.attendees)
+        added = []
+        for username in usernames:
+            if username not in registered:
+                registered.add(username)
+                added.append(username)
+        if len(added) > self.available_slots():
+            raise ValueError(
+                f"Only {self.available_slots()} slots left for {len(added)} attendees"
+            )
+
+        self.attendees.extend(added)
+        if self.waitlist:
+            # Registered users no longer wait for a seat
+            added_set = set(added)
+            self.waitlist[:] = [w for w in self.waitlist if w[2] not in added_set]
+            heapq.heapify(self.waitlist)
+        return added
+
+    def remove_attendees(self, usernames):
+        """
+        Unregister several users at once.
+
+        Returns the usernames that were removed and those promoted from the
+        waitlist into the freed seats. Users not registered are skipped.
+        """
+        registered = set(self.attendees)
+        removed = [u for u in dict.fromkeys(usernames) if u in registered]
+        if not removed:
+            return [], []
+        self.attendees.remove_many(removed)
+        return removed, self.promote_waitlist()
+
+    def is_waitlisted(self, username):
+        """Check if user is on the waitlist"""
+        return any(entry[2] == username for entry in self.waitlist)
+
+    def join_waitlist(self, username, priority=0):
+        """
+        Add a user to the waitlist and return their position.
+
+        Lower priority values are promoted first; users in the same
+        priority class are promoted in the order they joined.
+        """
+        if username in self.attendees:
+            raise ValueError("User already registered")
+        if self.is_waitlisted(username):
+            raise ValueError("User already on waitlist")
+        if not self.is_full():
+            raise ValueError("Event still has available slots")
+        entry = [priority, time.time(), intern_str(username)]
+        heapq.heappush(self.waitlist, entry)
+        return self.waitlist_position(username)
+
+    def leave_waitlist(self, username):
+        """Remove a user from the waitlist"""
+        for i, entry in enumerate(self.waitlist):
+            if entry[2] == username:
+                self.waitlist[i] = self.waitlist[-1]
+                self.waitlist.pop()
+                heapq.heapify(self.waitlist)
+                return
+        raise ValueError("User not on waitlist")
+
+    def waitlist_position(self, username):
+        """Return 1-based waitlist position of a user, or None"""
+        for position, entry in enumerate(sorted(self.waitlist), 1):
+            if entry[2] == username:
+                return position
+        return None
+
+    def promote_waitlist(self):
+        """Move waitlisted users into free seats and return their usernames"""
+        promoted = []
+        while self.waitlist and not self.is_full():
+            username = heapq.heappop(self.waitlist)[2]
+            self.attendees.append(username)
+            promoted.append(username)
+        return promoted
 
     def validate_date(self):
         """Validate if event date is in the future"""
-        try:
-            event_date = datetime.strptime(self.date, "%Y-%m-%d")
-            return event_date >= datetime.now()
-        except ValueError:
+        if not self.date_ordinal:
             return False
+        return datetime.fromordinal(self.date_ordinal) >= datetime.now()
+
+    def is_upcoming(self, today=None):
+        """Check if the event is after today (today is a day ordinal)"""
+        return self.date_ordinal > (today or today_ordinal())
+
+    def is_past(self, today=None):
+        """Check if the event was before today (today is a day ordinal)"""
+        return 0 < self.date_ordinal < (today or today_ordinal())
 
     def __str__(self):
-        return f"{self.name} on {self.date} ({len(self.attendees)}/{self.capacity})"
+        return f"{self.name} on {self.date} ({self.attendee_count()}/{self.capacity})"
@@ -0,0 +1,9 @@
+"""
+String helpers shared by the models
+"""
+import sys
+
+
+def intern_str(value):
+    """Intern repeated strings (roles, organizers, locations) so copies share memory"""
+    return sys.intern(value) if isinstance(value, str) else value
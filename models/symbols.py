@@ -0,0 +1,125 @@
+"""
+Symbol Tables - Integer surrogate keys for repeated names
+"""
+from array import array
+
+
+class SymbolTable:
+    """Maps names to small integer ids and back"""
+
+    def __init__(self):
+        self.names = []  # Id -> name
+        self.ids = {}  # Name -> id
+
+    def __len__(self):
+        return len(self.names)
+
+    def intern(self, name):
+        """Return the id of a name, assigning a new one if needed"""
+        symbol = self.ids.get(name)
+        if symbol is None:
+            symbol = len(self.names)
+            self.names.append(name)
+            self.ids[name] = symbol
+        return symbol
+
+    def lookup(self, name):
+        """Return the id of a name, or None if it was never interned"""
+        return self.ids.get(name)
+
+    def name(self, symbol):
+        """Return the name behind an id"""
+        return self.names[symbol]
+
+
+# Shared by every attendee list so a username is stored once per process
+USERNAMES = SymbolTable()
+
+
+class NameList:
+    """
+    List of usernames stored as a compact array of symbol ids.
+
+    Behaves like the list of strings it replaces (iteration, membership,
+    append/remove, indexing) and converts back to a plain list at the
+    JSON edges through to_list().
+    """
+
+    __slots__ = ("ids", "symbols")
+
+    def __init__(self, names=(), symbols=USERNAMES):
+        self.symbols = symbols
+        self.ids = array("i", map(symbols.intern, names)) if names else array("i")
+
+    @classmethod
+    def from_ids(cls, ids, symbols=USERNAMES):
+        """Build a list straight from an array of symbol ids"""
+        names = cls.__new__(cls)
+        names.symbols = symbols
+        names.ids = ids
+        return names
+
+    def copy(self):
+        """Return an independent copy"""
+        return NameList.from_ids(self.ids[:], self.symbols)
+
+    def to_list(self):
+        """Return the usernames as a plain list"""
+        return list(map(self.symbols.names.__getitem__, self.ids))
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __iter__(self):
+        return map(self.symbols.names.__getitem__, self.ids)
+
+    def __contains__(self, name):
+        symbol = self.symbols.lookup(name)
+        return symbol is not None and symbol in self.ids
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.to_list()[index]
+        return self.symbols.names[self.ids[index]]
+
+    def __eq__(self, other):
+        if isinstance(other, NameList):
+            if other.symbols is self.symbols:
+                return self.ids == other.ids
+            return self.to_list() == other.to_list()
+        if isinstance(other, list):
+            return self.to_list() == other
+        return NotImplemented
+
+    def __repr__(self):
+        return f"NameList({self.to_list()!r})"
+
+    def append(self, name):
+        """Add a username"""
+        self.ids.append(self.symbols.intern(name))
+
+    def extend(self, names):
+        """Add several usernames"""
+        self.ids.extend(map(self.symbols.intern, names))
+
+    def index(self, name):
+        """Return the position of a username"""
+        symbol = self.symbols.lookup(name)
+        if symbol is None:
+            raise ValueError(f"{name!r} is not in list")
+        return self.ids.index(symbol)
+
+    def remove(self, name):
+        """Remove the first occurrence of a username"""
+        del self.ids[self.index(name)]
+
+    def remove_many(self, names):
+        """Remove every occurrence of the given usernames in one pass"""
+        symbols = {self.symbols.lookup(name) for name in names}
+        kept = (i for i in self.ids if i not in symbols)
+        self.ids[:] = array(self.ids.typecode, kept)
+
+    def count(self, name):
+        """Return number of occurrences of a username"""
+        symbol = self.symbols.lookup(name)
+        return 0 if symbol is None else self.ids.count(symbol)
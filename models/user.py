@@ -1,14 +1,27 @@
 """
 User Model - Represents users with different roles
 """
+from array import array
+from .strings import intern_str
+
 class User:
+    # Slots drop the per-instance __dict__; large user bases hold many users
+    __slots__ = (
+        "username",
+        "password",
+        "role",
+        "email",
+        "full_name",
+        "registered_events",
+    )
+
     def __init__(self, username, password, role, email=None, full_name=None):
-        self.username = username
+        self.username = intern_str(username)
         self.password = password
-        self.role = role  # Admin, Organizer, Student
+        self.role = intern_str(role)  # Admin, Organizer, Student
         self.email = email
         self.full_name = full_name
-        self.registered_events = []  # List of event IDs
+        self.registered_events = array("q")  # Compact array of event IDs
 
     def to_dict(self):
         """Convert user object to dictionary for JSON storage"""
@@ -18,7 +31,7 @@ class User:
             "role": self.role,
             "email": self.email,
             "full_name": self.full_name,
-            "registered_events": self.registered_events,
+            "registered_events": list(self.registered_events),
         }
 
     @staticmethod
@@ -27,7 +40,7 @@ class User:
         user = User(data.get("username"), data.get("password"), data.get("role"))
         user.email = data.get("email")
         user.full_name = data.get("full_name")
-        user.registered_events = data.get("registered_events", [])
+        user.registered_events = array("q", data.get("registered_events", []))
         return user
 
     def can_manage_events(self):
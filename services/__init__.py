@@ -4,5 +4,6 @@ Services package - Contains all business logic services
 
 from .event_service import EventService
 from .user_service import UserService
+from .registration_batcher import RegistrationBatcher
 
-__all__ = ["EventService", "UserService"]
+__all__ = ["EventService", "UserService", "RegistrationBatcher"]
@@ -0,0 +1,68 @@
+"""
+Availability Index - Events with free seats, ordered by date
+"""
+
+from bisect import bisect_left, insort
+
+from models.dates import date_ordinal
+from models.event import ALMOST_FULL
+
+
+class AvailabilityIndex:
+    """
+    Sorted (day ordinal, id) keys of every event that still has free seats.
+
+    update() is called whenever capacity, attendance or the date of an
+    event changes, so listing open events costs O(log n + k) for k results
+    instead of a scan of the whole catalog.
+    """
+
+    def __init__(self, events=()):
+        self._events = {}  # Event ID -> open Event
+        self._keys = []  # Sorted (day ordinal, id) of open events
+        open_events = [e for e in events if e.available_slots() > 0]
+        for event in open_events:
+            self._events[event.id] = event
+        self._keys = sorted(self._key(e) for e in open_events)
+        self._key_of = {key[1]: key for key in self._keys}  # Event ID -> key
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __contains__(self, event_id):
+        return event_id in self._events
+
+    @staticmethod
+    def _key(event):
+        # Invalid dates have ordinal 0 and come first
+        return (event.date_ordinal, event.id)
+
+    def update(self, event):
+        """Add, move or drop an event after its seats or date changed"""
+        self.remove(event.id)
+        if event.available_slots() > 0:
+            key = self._key(event)
+            insort(self._keys, key)
+            self._key_of[event.id] = key
+            self._events[event.id] = event
+
+    def remove(self, event_id):
+        """Drop an event from the index"""
+        key = self._key_of.pop(event_id, None)
+        if key is None:
+            return
+        del self._keys[bisect_left(self._keys, key)]
+        del self._events[event_id]
+
+    def open_events(self, start_date=None, limit=None):
+        """Return open events in date order, from start_date on if given"""
+        if start_date:
+            start = bisect_left(self._keys, (date_ordinal(start_date), -1))
+        else:
+            start = 0
+        end = len(self._keys) if limit is None else start + limit
+        return [self._events[event_id] for _, event_id in self._keys[start:end]]
+
+    def almost_full(self, threshold=ALMOST_FULL):
+        """Return open events with at least threshold of their seats taken"""
+        return [e for e in self.open_events() if e.is_almost_full(threshold)]
@@ -0,0 +1,208 @@
+"""
+Bulk Import - Loads events and users from CSV or JSON Lines files
+
+Rows are read and validated one at a time, so a bad row only produces an
+error entry. The valid rows are then added through the services in one
+step: indexes are rebuilt once and the data file is written once.
+
+Usage:
+    python -m services.bulk_import events semester.csv
+    python -m services.bulk_import users students.jsonl --dry-run
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+
+from services.event_service import EventService
+from services.user_service import UserService
+
+EVENT_COLUMNS = ("name", "date", "capacity", "location", "description", "organizer")
+USER_COLUMNS = ("username", "password", "role", "email", "full_name")
+
+
+class ImportResult:
+    """Outcome of a bulk import"""
+
+    def __init__(self):
+        self.created = []  # Created events or users
+        self.errors = []  # (row number, message) for rejected rows
+        self.rows = 0
+
+    def summary(self):
+        """Return a one-line summary"""
+        return (
+            f"{self.rows} rows: {len(self.created)} imported, "
+            f"{len(self.errors)} rejected"
+        )
+
+
+def read_rows(path):
+    """
+    Yield (row number, fields) from a .csv or .jsonl file.
+
+    Row numbers are file line numbers. A JSON line that cannot be parsed
+    is yielded as a ValueError instead of a dict.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".csv":
+        return _read_csv(path)
+    if extension in (".jsonl", ".ndjson"):
+        return _read_jsonl(path)
+    raise ValueError(f"Unsupported file type: {extension or path}")
+
+
+def _read_csv(path):
+    with open(path, "r", newline="", encoding="utf-8-sig") as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            yield reader.line_num, row
+
+
+def _read_jsonl(path):
+    with open(path, "r", encoding="utf-8") as f:
+        for line, text in enumerate(f, 1):
+            if not text.strip():
+                continue
+            try:
+                row = json.loads(text)
+            except json.JSONDecodeError as e:
+                yield line, ValueError(f"Invalid JSON: {e.msg}")
+                continue
+            if not isinstance(row, dict):
+                row = ValueError("Row must be a JSON object")
+            yield line, row
+
+
+def _fields(row, columns, numbers=()):
+    """
+    Pick known columns, turning empty strings into None.
+
+    Values must be text (or missing); columns in numbers may also hold
+    JSON integers.
+    """
+    if isinstance(row, ValueError):
+        raise row
+    values = {}
+    for column in columns:
+        value = row.get(column)
+        if isinstance(value, str):
+            value = value.strip() or None
+        elif value is not None and not (
+            column in numbers and isinstance(value, int) and not isinstance(value, bool)
+        ):
+            kind = "a whole number" if column in numbers else "text"
+            raise ValueError(f"{column} must be {kind}")
+        values[column] = value
+    return values
+
+
+def import_events(event_service, path, dry_run=False, strict=False):
+    """
+    Create events from a file.
+
+    With strict=True nothing is imported if any row is invalid; with
+    dry_run=True rows are only validated.
+    """
+    result = ImportResult()
+    valid = []
+    for line, row in read_rows(path):
+        result.rows += 1
+        try:
+            fields = _fields(row, EVENT_COLUMNS, numbers=("capacity",))
+            fields["capacity"] = event_service.validate_event(
+                fields["name"], fields["date"], fields["capacity"]
+            )
+        except ValueError as e:
+            result.errors.append((line, str(e)))
+        else:
+            valid.append(fields)
+
+    if not dry_run and not (strict and result.errors):
+        result.created = event_service.add_events(valid)
+    return result
+
+
+def import_users(user_service, path, dry_run=False, strict=False):
+    """
+    Create users from a file.
+
+    With strict=True nothing is imported if any row is invalid; with
+    dry_run=True rows are only validated.
+    """
+    result = ImportResult()
+    valid = []
+    seen = set()
+    for line, row in read_rows(path):
+        result.rows += 1
+        try:
+            fields = _fields(row, USER_COLUMNS)
+            user_service.validate_user(
+                fields["username"], fields["password"], fields["role"]
+            )
+            if fields["username"] in seen:
+                raise ValueError("Username appears more than once in the file")
+        except ValueError as e:
+            result.errors.append((line, str(e)))
+        else:
+            seen.add(fields["username"])
+            valid.append(fields)
+
+    if not dry_run and not (strict and result.errors):
+        result.created = user_service.add_users(valid)
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m services.bulk_import",
+        description="Import events or users from a CSV or JSON Lines file.",
+    )
+    parser.add_argument("kind", choices=("events", "users"))
+    parser.add_argument("file", help="Input file (.csv or .jsonl)")
+    parser.add_argument(
+        "--data",
+        help="Data file to import into (default: data/events.json or users.json)",
+    )
+    parser.add_argument(
+        "--storage",
+        choices=EventService.STORAGE_FORMATS,
+        default="json",
+        help="Storage format of the data file (users: json or snapshot)",
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Validate rows without saving"
+    )
+    parser.add_argument(
+        "--strict",
+        action="store_true",
+        help="Import nothing if any row is invalid",
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        if args.kind == "events":
+            data_file = args.data or "data/events.json"
+            service = EventService(data_file, storage=args.storage)
+            result = import_events(service, args.file, args.dry_run, args.strict)
+        else:
+            service = UserService(args.data or "users.json", args.storage)
+            result = import_users(service, args.file, args.dry_run, args.strict)
+    except (OSError, ValueError) as e:
+        print(f"Error importing {args.file}: {e}", file=sys.stderr)
+        return 2
+
+    for line, message in result.errors:
+        print(f"{args.file}:{line}: {message}", file=sys.stderr)
+    print(result.summary())
+    if args.dry_run:
+        print("Dry run, nothing saved")
+    elif args.strict and result.errors:
+        print("Strict mode, nothing saved")
+    return 1 if result.errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
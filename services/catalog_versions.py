@@ -0,0 +1,132 @@
+"""
+Catalog Versions - Immutable, structurally shared versions of the event catalog
+
+Every commit of an EventService with versioned=True publishes a new
+CatalogVersion. A version stores copies of the events in fixed-size
+chunks of tuples; the next version copies only the chunks holding events
+that changed and shares all others. Readers take the current version with
+a single attribute read and never need a lock: nothing they hold changes
+after publication.
+"""
+
+CHUNK_SIZE = 256
+
+
+class CatalogVersion:
+    """
+    Read-only view of the catalog as of one commit.
+
+    Events are copies owned by the version and must not be modified.
+    Iteration yields them in catalog order.
+    """
+
+    def __init__(self, number, chunks, positions, count):
+        self.number = number
+        self._chunks = chunks  # Tuple of tuples of Event (None for deleted)
+        self._positions = positions  # Event ID -> slot, shared between versions
+        self._slots = sum(len(chunk) for chunk in chunks)
+        self._count = count
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        for chunk in self._chunks:
+            for event in chunk:
+                if event is not None:
+                    yield event
+
+    def get_event_by_id(self, event_id):
+        """Get event by ID as of this version"""
+        slot = self._positions.get(event_id)
+        if slot is None or slot >= self._slots:
+            return None  # Added by a later version
+        return self._chunks[slot // CHUNK_SIZE][slot % CHUNK_SIZE]
+
+
+class VersionedCatalog:
+    """
+    Publishes catalog versions that share unchanged chunks.
+
+    Slots of deleted events stay empty until more than half of the slots
+    are empty; the next publish then builds a compact version.
+    """
+
+    def __init__(self):
+        self.current = None
+        self._positions = {}
+
+    def rebuild(self, events):
+        """Publish a version holding copies of all events"""
+        self._positions = {}
+        chunks = []
+        for slot, event in enumerate(events):
+            if slot % CHUNK_SIZE == 0:
+                chunks.append([])
+            chunks[-1].append(event.copy())
+            self._positions[event.id] = slot
+        number = self.current.number + 1 if self.current is not None else 1
+        self.current = CatalogVersion(
+            number, tuple(map(tuple, chunks)), self._positions, len(self._positions)
+        )
+        return self.current
+
+    def publish(self, changed, removed, events=None):
+        """
+        Publish a version with copies of the changed events.
+
+        changed holds added or modified events, removed the IDs of deleted
+        ones. events is the full live list, used when compacting.
+        """
+        current = self.current
+        if current is None:
+            return self.rebuild(events or changed)
+
+        chunks = list(current._chunks)
+        copied = {}  # Chunk index -> list copy of that chunk
+        slots = current._slots
+        count = current._count
+
+        def writable(index):
+            chunk = copied.get(index)
+            if chunk is None:
+                chunk = list(chunks[index]) if index < len(chunks) else []
+                copied[index] = chunk
+            return chunk
+
+        for event in changed:
+            slot = self._positions.get(event.id)
+            if slot is None or slot >= slots:
+                # New event: append a slot; older versions bound-check it away
+                slot = slots
+                slots += 1
+                count += 1
+                self._positions[event.id] = slot
+                writable(slot // CHUNK_SIZE).append(event.copy())
+            else:
+                chunk = writable(slot // CHUNK_SIZE)
+                if chunk[slot % CHUNK_SIZE] is None:
+                    count += 1
+                chunk[slot % CHUNK_SIZE] = event.copy()
+
+        for event_id in removed:
+            slot = self._positions.get(event_id)
+            if slot is None or slot >= slots:
+                continue
+            chunk = writable(slot // CHUNK_SIZE)
+            if chunk[slot % CHUNK_SIZE] is not None:
+                chunk[slot % CHUNK_SIZE] = None
+                count -= 1
+
+        if events is not None and count * 2 < slots:
+            return self.rebuild(events)
+
+        for index in sorted(copied):
+            if index < len(chunks):
+                chunks[index] = tuple(copied[index])
+            else:
+                chunks.append(tuple(copied[index]))
+        self.current = CatalogVersion(
+            current.number + 1, tuple(chunks), self._positions, count
+        )
+        return self.current
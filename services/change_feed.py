@@ -0,0 +1,222 @@
+"""
+Change Feed - Versioned log of catalog mutations for delta sync
+
+Every mutation gets the next version number. Changes are staged by
+record() and only published by commit(), which the services call after
+the data file was saved, so the feed never announces changes that did
+not reach disk. Committed changes are kept in a bounded in-memory ring
+and appended to a JSON Lines journal. A client remembers the last
+version it has seen and asks for changes_since(version) instead of
+pulling the whole catalog again.
+
+Change entries look like:
+
+    {"version": 42, "op": "put", "id": 7, "data": {"attendees": [...]}}
+    {"version": 43, "op": "delete", "id": 9, "data": null}
+
+"put" carries only the fields that changed (all fields for new records).
+"""
+
+import json
+import os
+import threading
+from collections import deque
+
+from services.instrumentation import track_io
+
+# Bytes read from the end of the journal per step when looking for its last line
+TAIL_CHUNK = 64 * 1024
+
+
+class ChangeFeed:
+    """
+    Monotonic change versions with recent history in memory and on disk.
+
+    keep bounds the ring; the journal is trimmed back to keep entries once
+    it holds four times as many. Opening a feed reads only the first and
+    last journal entries; older history is read from the journal when a
+    client asks for it.
+    """
+
+    def __init__(self, journal_file=None, keep=10000):
+        if keep <= 0:
+            raise ValueError("keep must be positive")
+
+        self.journal_file = journal_file
+        self.keep = keep
+        self.version = 0  # Latest committed version
+        self._last_recorded = 0  # Latest version handed out by record()
+        self._pending = []  # Recorded changes waiting for commit()
+        self._ring = deque(maxlen=keep)
+        self._first_journaled = None  # Oldest version in the journal
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        """Restore the version from the journal, repairing a torn last line"""
+        if not self.journal_file or not os.path.exists(self.journal_file):
+            return
+        try:
+            with track_io("changes.load_journal", self.journal_file, "read"):
+                first, last = _journal_bounds(self.journal_file)
+        except OSError as e:
+            print(f"Error loading change journal: {e}")
+            return
+        if last is not None:
+            self.version = self._last_recorded = last["version"]
+            self._first_journaled = first["version"]
+
+    def record(self, op, key, data=None):
+        """Stage a change and return its version; clients see it after commit()"""
+        with self._lock:
+            self._last_recorded += 1
+            self._pending.append(
+                {"version": self._last_recorded, "op": op, "id": key, "data": data}
+            )
+            return self._last_recorded
+
+    def commit(self):
+        """Publish the staged changes once the data they describe was saved"""
+        with self._lock:
+            if not self._pending:
+                return self.version
+            changes, self._pending = self._pending, []
+            if self.journal_file:
+                self._append(changes)
+            self._ring.extend(changes)
+            self.version = changes[-1]["version"]
+            return self.version
+
+    def rollback(self):
+        """Drop staged changes, e.g. after the data was reloaded from disk"""
+        with self._lock:
+            self._pending = []
+            self._last_recorded = self.version
+
+    def _append(self, changes):
+        try:
+            with open(self.journal_file, "a", encoding="utf-8") as f:
+                f.write(
+                    "".join(json.dumps(c, ensure_ascii=False) + "\n" for c in changes)
+                )
+        except OSError as e:
+            print(f"Error writing change journal: {e}")
+            return
+        if self._first_journaled is None:
+            self._first_journaled = changes[0]["version"]
+        if changes[-1]["version"] - self._first_journaled + 1 >= 4 * self.keep:
+            self._trim()
+
+    def _trim(self):
+        """Rewrite the journal with only its last keep changes"""
+        temp_path = self.journal_file + ".tmp"
+        with track_io("changes.save_journal", self.journal_file, "write"):
+            recent = deque(_read_journal(self.journal_file), maxlen=self.keep)
+            with open(temp_path, "w", encoding="utf-8") as f:
+                for change in recent:
+                    f.write(json.dumps(change, ensure_ascii=False) + "\n")
+            os.replace(temp_path, self.journal_file)
+        self._first_journaled = recent[0]["version"] if recent else None
+
+    def changes_since(self, version):
+        """
+        Return the committed changes after version, oldest first.
+
+        Returns None when that history is no longer available (or version
+        is from another journal); the caller then reloads everything.
+        """
+        with self._lock:
+            current = self.version
+            if version == current:
+                return []
+            if version > current or version < 0:
+                return None
+            if self._ring and self._ring[0]["version"] <= version + 1:
+                # Walk back from the newest change: O(number of changes)
+                changes = []
+                for change in reversed(self._ring):
+                    if change["version"] <= version:
+                        break
+                    changes.append(change)
+                changes.reverse()
+                return changes
+
+        if not self.journal_file or not os.path.exists(self.journal_file):
+            return None
+        changes = []
+        with track_io("changes.load_journal", self.journal_file, "read"):
+            for change in _read_journal(self.journal_file):
+                if change["version"] > current:
+                    break
+                if change["version"] > version:
+                    changes.append(change)
+        if not changes or changes[0]["version"] != version + 1:
+            return None
+        return changes
+
+
+def _read_journal(path):
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                yield json.loads(line)
+            except ValueError:
+                continue  # Blank line or a write torn by a crash
+
+
+def _journal_bounds(path):
+    """Return the first and last entries of a journal (None, None if empty)"""
+    _repair_tail(path)
+    first = next(_read_journal(path), None)
+    if first is None:
+        return None, None
+
+    with open(path, "rb") as f:
+        end = f.seek(0, os.SEEK_END)
+        chunk = TAIL_CHUNK
+        while True:
+            start = max(0, end - chunk)
+            f.seek(start)
+            lines = f.read(end - start).split(b"\n")
+            if start:
+                lines = lines[1:]  # May begin mid-line
+            for line in reversed(lines):
+                try:
+                    return first, json.loads(line)
+                except ValueError:
+                    continue
+            if not start:
+                return first, first
+            chunk *= 2
+
+
+def _repair_tail(path):
+    """
+    End the journal with a newline so the next append starts its own line.
+
+    A last line torn by a crash is cut off; a complete one that only lacks
+    its newline is kept.
+    """
+    with open(path, "r+b") as f:
+        end = f.seek(0, os.SEEK_END)
+        if not end:
+            return
+        f.seek(end - 1)
+        if f.read(1) == b"\n":
+            return
+        start = end  # Becomes the offset of the last line
+        while start:
+            step = min(TAIL_CHUNK, start)
+            f.seek(start - step)
+            cut = f.read(step).rfind(b"\n")
+            if cut >= 0:
+                start = start - step + cut + 1
+                break
+            start -= step
+        f.seek(start)
+        try:
+            json.loads(f.read(end - start))
+        except ValueError:
+            f.truncate(start)
+        else:
+            f.write(b"\n")
@@ -0,0 +1,219 @@
+"""
+Delta Export - Incremental CSV reports built from the change feed
+
+The first export writes a full base report. Later exports write only the
+events created, changed or deleted since the previous export, using the
+versions of EventService.changes_since(). manifest.json lists the base
+and the deltas in order; merge() replays them into a full report.
+
+A delta file has the report columns plus "Version" (the last change of
+the event) and "Change" ("upsert" or "delete"; deleted rows only carry
+the ID).
+
+Usage:
+    python -m services.delta_export export
+    python -m services.delta_export merge --output reports/events_report.csv
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+
+from services.event_service import CSV_COLUMNS, EventService, csv_row
+
+DELTA_COLUMNS = CSV_COLUMNS + ("Version", "Change")
+MANIFEST = "manifest.json"
+
+
+def read_manifest(directory):
+    """Return the manifest of an export directory, or None"""
+    path = os.path.join(directory, MANIFEST)
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _write_manifest(directory, manifest):
+    path = os.path.join(directory, MANIFEST)
+    temp_path = path + ".tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(temp_path, path)
+
+
+def export(event_service, directory="reports/deltas", full=False):
+    """
+    Write a delta (or a new base) report and return its path.
+
+    A new base is written on the first export, with full=True, or when the
+    change history no longer reaches back to the last export. Returns None
+    if nothing changed.
+    """
+    os.makedirs(directory, exist_ok=True)
+    manifest = read_manifest(directory)
+    version = event_service.version
+
+    changes = None
+    if manifest is not None and not full:
+        changes = event_service.changes_since(manifest["version"])
+    if changes is None:
+        return _export_base(event_service, directory, version)
+    if not changes:
+        return None
+
+    # Last change per event decides whether it is upserted or deleted
+    latest = {}
+    for change in changes:
+        latest[change["id"]] = change
+
+    events = {}
+    for event_id, change in latest.items():
+        if change["op"] != "delete":
+            event = event_service.get_event_by_id(event_id)
+            if event is not None:
+                events[event_id] = event
+    missing = {i for i, c in latest.items() if c["op"] != "delete"} - events.keys()
+    if missing:
+        # Changed events that moved to the partition archive since
+        for event in event_service.iter_archived_events():
+            if event.id in missing:
+                events[event.id] = event
+
+    filename = f"delta-{manifest['version']:08d}-{version:08d}.csv"
+    path = os.path.join(directory, filename)
+    upserts = deletes = 0
+    empty = [""] * (len(CSV_COLUMNS) - 1)
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(DELTA_COLUMNS)
+        for event_id, change in latest.items():
+            event = events.get(event_id)
+            if event is None:
+                writer.writerow([event_id] + empty + [change["version"], "delete"])
+                deletes += 1
+            else:
+                writer.writerow(csv_row(event) + [change["version"], "upsert"])
+                upserts += 1
+
+    manifest["deltas"].append(
+        {
+            "file": filename,
+            "from_version": manifest["version"],
+            "to_version": version,
+            "upserts": upserts,
+            "deletes": deletes,
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        }
+    )
+    manifest["version"] = version
+    _write_manifest(directory, manifest)
+    return path
+
+
+def _export_base(event_service, directory, version):
+    """Write a full report and start a new manifest"""
+    old = read_manifest(directory)
+    filename = f"base-{version:08d}.csv"
+    path = event_service.export_to_csv(
+        os.path.join(directory, filename), include_archive=True
+    )
+    _write_manifest(
+        directory,
+        {
+            "base": filename,
+            "version": version,
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "deltas": [],
+        },
+    )
+    # Files of the previous chain are superseded by the new base
+    if old is not None:
+        for name in [old["base"]] + [d["file"] for d in old["deltas"]]:
+            if name != filename and os.path.exists(os.path.join(directory, name)):
+                os.remove(os.path.join(directory, name))
+    return path
+
+
+def merge(directory="reports/deltas", output="reports/events_report.csv"):
+    """Rebuild the full report from the base and all deltas"""
+    manifest = read_manifest(directory)
+    if manifest is None:
+        raise ValueError(f"No export manifest in {directory}")
+
+    rows = {}  # Event ID -> report row, in report order
+    for row in _read_rows(os.path.join(directory, manifest["base"])):
+        rows[row[0]] = row
+
+    width = len(CSV_COLUMNS)
+    for delta in manifest["deltas"]:
+        for row in _read_rows(os.path.join(directory, delta["file"])):
+            if row[-1] == "delete":
+                rows.pop(row[0], None)
+            else:
+                rows[row[0]] = row[:width]
+
+    folder = os.path.dirname(output)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    with open(output, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(CSV_COLUMNS)
+        writer.writerows(rows.values())
+    return output
+
+
+def _read_rows(path):
+    """Yield the rows of a CSV file after its header"""
+    with open(path, "r", newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        next(reader, None)
+        yield from reader
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m services.delta_export",
+        description="Incremental CSV export of events and merge of the deltas.",
+    )
+    parser.add_argument("command", choices=("export", "merge"))
+    parser.add_argument(
+        "--dir", default="reports/deltas", help="Directory of the base and deltas"
+    )
+    parser.add_argument(
+        "--data", default="data/events.json", help="Events data file (export)"
+    )
+    parser.add_argument(
+        "--storage",
+        choices=EventService.STORAGE_FORMATS,
+        default="json",
+        help="Storage format of the data file (export)",
+    )
+    parser.add_argument(
+        "--full", action="store_true", help="Write a new full base report (export)"
+    )
+    parser.add_argument(
+        "--output",
+        default="reports/events_report.csv",
+        help="Merged report file (merge)",
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        if args.command == "export":
+            service = EventService(args.data, storage=args.storage)
+            path = export(service, args.dir, args.full)
+            print(path or f"No changes since version {service.version}")
+        else:
+            print(merge(args.dir, args.output))
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,35 +4,440 @@ Event Service - Handles all event-related business logic
 
 import json
 import os
-from models.event import Event
-from datetime import datetime
+from models.dates import date_ordinal, parse_date, today_ordinal
+from models.event import ALMOST_FULL, Event
+from models.strings import intern_str
+from models.symbols import USERNAMES
+from services.availability_index import AvailabilityIndex
+from services.catalog_versions import VersionedCatalog
+from services.change_feed import ChangeFeed
+from services.event_table import EventTable
+from services.id_sequence import IdSequence
+from services.instrumentation import track_io
+from services.lazy_catalog import LazyCatalog
+from services.partitioned_store import PartitionedStore
+from services.query_cache import MEMBERSHIP, QueryCache
+from services.shared_catalog import SharedCatalogWriter
+from services.snapshot import is_newer, load_events_snapshot, save_events_snapshot
+
+# Fields that touch_event() can report as changed
+EVENT_FIELDS = (
+    "name",
+    "date",
+    "capacity",
+    "location",
+    "description",
+    "organizer",
+    "attendees",
+    "waitlist",
+)
+SEARCH_FIELDS = ("name", "description", "location")
+AVAILABILITY_FIELDS = ("capacity", "attendees", "date")
+
+
+def _search_text(event):
+    """Lowercase name, description and location joined for keyword search"""
+    fields = (event.name, event.description, event.location)
+    return "\0".join(field for field in fields if field).lower()
+
+
+# Columns of the CSV report
+CSV_COLUMNS = (
+    "ID",
+    "Name",
+    "Date",
+    "Capacity",
+    "Attendees",
+    "Available Slots",
+    "Location",
+    "Organizer",
+)
+
+
+def csv_row(event):
+    """Return the CSV report row of an event"""
+    attendees = event.attendee_count()
+    return [
+        event.id,
+        event.name,
+        event.date,
+        event.capacity,
+        attendees,
+        event.capacity - attendees,
+        event.location or "",
+        event.organizer or "",
+    ]
+
+
+def _change_data(event, fields):
+    """Changed field values for the change feed"""
+    data = {}
+    for field in fields:
+        if field == "attendees":
+            data[field] = event.attendees.to_list()
+        elif field == "waitlist":
+            data[field] = event.waitlist_to_list()
+        else:
+            data[field] = getattr(event, field)
+    return data
 
 
 class EventService:
-    def __init__(self, data_file="data/events.json"):
+    STORAGE_FORMATS = ("json", "snapshot", "partitioned")
+
+    def __init__(
+        self,
+        data_file="data/events.json",
+        columnar=False,
+        storage="json",
+        lazy=False,
+        max_materialized=1000,
+        cache_size=256,
+        id_block=1,
+        compact_after=100,
+        compress_archive=True,
+        versioned=False,
+        shared=False,
+    ):
+        if storage not in self.STORAGE_FORMATS:
+            raise ValueError(f"Unknown storage format: {storage}")
+        if versioned and lazy:
+            raise ValueError("Catalog versions need an in-memory catalog (lazy=False)")
+        if lazy:
+            # Lazy catalogs read rows straight from the mapped snapshot
+            storage = "snapshot"
+
         self.data_file = data_file
+        # Binary snapshot next to the JSON file, used when storage="snapshot"
+        self.snapshot_file = os.path.splitext(data_file)[0] + ".snap"
+        # Next free event ID, shared with other processes using the same data
+        self.id_sequence = IdSequence(os.path.splitext(data_file)[0] + ".seq", id_block)
+        # Month partitions in a directory next to the JSON file, used when
+        # storage="partitioned"; only current and upcoming months are loaded
+        self.partitions = None
+        if storage == "partitioned":
+            self.partitions = PartitionedStore(
+                os.path.splitext(data_file)[0], compress_archive
+            )
+        # Deleted event IDs, one per line, not yet compacted out of the data file
+        self.tombstone_file = os.path.splitext(data_file)[0] + ".tombstones"
+        self.storage = storage
+        self.compact_after = compact_after
+        self._tombstones = set()  # IDs listed in the tombstone file
         self.events = []
+        self._by_id = {}  # Event ID -> Event, rebuilt on every load
+        self._search_text = None  # Event ID -> search text, built on first search
+        self._availability = None  # AvailabilityIndex, built on first use
+        # Optional columnar view kept in sync for analytics queries
+        self.table = EventTable() if columnar else None
+        self.promotion_listeners = []  # Called as listener(event_id, username)
+        # Keeps registered_events of users in step with waitlist promotions
+        self.user_service = None
+        self.lazy = lazy
+        self.max_materialized = max_materialized
+        self.catalog = None  # LazyCatalog when lazy=True
+        # Results of repeated queries, invalidated through touch_event()
+        self.query_cache = QueryCache(cache_size)
+        # Versioned log of event changes for delta sync
+        self.changes = ChangeFeed(os.path.splitext(data_file)[0] + ".changes.jsonl")
+        # Immutable catalog versions published on every commit (versioned mode)
+        # Shared mode publishes these versions, they never change underneath
+        self.versions = None
+        if versioned or (shared and not lazy):
+            self.versions = VersionedCatalog()
+        self._unpublished = {}  # Event ID -> Event changed since the last publish
+        self._unpublished_removals = set()
+        # Read-only catalog for worker processes, republished after commits
+        self.shared = None
+        self._shared_version = None  # Change version last handed to self.shared
+        if shared:
+            self.shared = SharedCatalogWriter(
+                os.path.splitext(data_file)[0] + ".shared"
+            )
         self.load_events()
 
+    @property
+    def events(self):
+        """Event list, purged of events deleted since the last access"""
+        if self._deleted:
+            deleted = self._deleted
+            self._events = [e for e in self._events if e.id not in deleted]
+            self._deleted = set()
+        return self._events
+
+    @events.setter
+    def events(self, events):
+        self._events = events
+        self._deleted = set()  # IDs still to be purged from _events
+
     def load_events(self):
-        """Load events from JSON file"""
-        if os.path.exists(self.data_file):
+        """
+        Load events from the snapshot or JSON file, whichever is newer.
+
+        Event objects from before the reload are no longer part of the
+        catalog: changes to them are not saved. In lazy mode the previous
+        catalog is closed, and reading their unloaded description or
+        attendees raises ValueError. Look events up again after a reload.
+        """
+        # Changes that were never saved are gone with the reload
+        self.changes.rollback()
+        if self.lazy:
+            self._load_lazy()
+            return
+        if self.partitions is not None:
+            self._load_partitioned()
+            return
+
+        self.events = None
+        if is_newer(self.snapshot_file, self.data_file):
+            self.events = self._load_snapshot()
+            if self.storage == "json":
+                # Migrate back to JSON and drop the stale snapshot
+                self.export_json()
+                os.remove(self.snapshot_file)
+
+        if self.events is None:
+            if os.path.exists(self.data_file):
+                try:
+                    with track_io("events.load_json", self.data_file, "read"):
+                        with open(self.data_file, "r", encoding="utf-8") as f:
+                            data = json.load(f)
+                            self.events = [Event.from_dict(e) for e in data]
+                    if self.storage == "snapshot":
+                        self._save_snapshot()
+                except Exception as e:
+                    print(f"Error loading events: {e}")
+                    self.events = []
+            else:
+                self.events = []
+        self._rebuild_indexes()
+
+    def _load_snapshot(self):
+        """
+        Read the events snapshot.
+
+        The snapshot is newer than the JSON file, so a failure is raised
+        instead of falling back: saving the older JSON data would overwrite
+        the only copy of the latest changes.
+        """
+        try:
+            with track_io("events.load_snapshot", self.snapshot_file, "read"):
+                return load_events_snapshot(self.snapshot_file)
+        except Exception as e:
+            raise self._snapshot_error(e) from e
+
+    def _snapshot_error(self, error):
+        return ValueError(
+            f"Events snapshot {self.snapshot_file} could not be loaded ({error}); "
+            f"repair or remove it to fall back to {self.data_file}"
+        )
+
+    def _load_lazy(self):
+        """Open the snapshot as a lazy catalog, importing JSON first if newer"""
+        if self.catalog is not None:
+            self.catalog.close()
+            self.catalog = None
+        if not is_newer(self.snapshot_file, self.data_file):
             try:
-                with open(self.data_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    self.events = [Event.from_dict(e) for e in data]
+                with track_io("events.load_json", self.data_file, "read"):
+                    with open(self.data_file, "r", encoding="utf-8") as f:
+                        events = [Event.from_dict(e) for e in json.load(f)]
             except Exception as e:
                 print(f"Error loading events: {e}")
                 self.events = []
-        else:
+                self._rebuild_indexes()
+                return
+            with track_io("events.save_snapshot", self.snapshot_file, "write"):
+                save_events_snapshot(self.snapshot_file, events)
+        try:
+            with track_io("events.load_snapshot", self.snapshot_file, "read"):
+                self.catalog = LazyCatalog(self.snapshot_file, self.max_materialized)
+        except Exception as e:
+            # Same as _load_snapshot(): never replace the newer data
+            raise self._snapshot_error(e) from e
+        self.events = self.catalog.events
+        self._rebuild_indexes()
+
+    def _load_partitioned(self):
+        """Load the active month partitions, splitting the JSON file on first use"""
+        try:
+            if not self.partitions.exists() and os.path.exists(self.data_file):
+                with track_io("events.load_json", self.data_file, "read"):
+                    with open(self.data_file, "r", encoding="utf-8") as f:
+                        events = [Event.from_dict(e) for e in json.load(f)]
+                self.partitions.reset(events)
+                self.partitions.save()
+            self.events = self.partitions.load()
+        except Exception as e:
+            print(f"Error loading events: {e}")
             self.events = []
+        self._rebuild_indexes()
+
+    def _rebuild_indexes(self):
+        """Rebuild lookup structures after the event list was replaced"""
+        self._tombstones = self._read_tombstones()
+        self._deleted = set(self._tombstones)
+        self._by_id = {e.id: e for e in self.events}
+        # IDs of deleted events must not come back either
+        newest = max(self._by_id.keys() | self._tombstones, default=0)
+        if self.partitions is not None:
+            for event_id in self._tombstones:
+                self.partitions.forget(event_id)
+            newest = max(newest, self.partitions.max_archived_id())
+        self.id_sequence.advance_past(newest)
+        self._search_text = None
+        self._availability = None
+        self.query_cache.clear()
+        self.query_cache.bump(MEMBERSHIP)
+        if self.versions is not None:
+            self._unpublished = {}
+            self._unpublished_removals = set()
+            self.versions.rebuild(self.events)
+        if self.table is not None:
+            self.table = EventTable(self.events)
+        if self.shared is not None:
+            self._shared_version = None
+            self._publish_shared()
 
     def save_events(self):
-        """Save events to JSON file"""
-        os.makedirs(os.path.dirname(self.data_file), exist_ok=True)
-        with open(self.data_file, "w", encoding="utf-8") as f:
-            data = [e.to_dict() for e in self.events]
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        """Save events in the configured storage format"""
+        if self.catalog is not None:
+            with track_io("events.save_snapshot", self.snapshot_file, "write"):
+                self.catalog.save(self.events)
+        elif self.partitions is not None:
+            self.partitions.save()
+        elif self.storage == "snapshot":
+            self._save_snapshot()
+        else:
+            self.export_json()
+        # The changes are on disk now, so clients may see them
+        self.changes.commit()
+        # The full write no longer contains deleted events
+        self._clear_tombstones()
+        self.publish()
+
+    def publish(self):
+        """Publish the changes made so far as a new catalog version"""
+        if self.versions is not None and (
+            self._unpublished or self._unpublished_removals
+        ):
+            self.versions.publish(
+                self._unpublished.values(), self._unpublished_removals, self.events
+            )
+            self._unpublished = {}
+            self._unpublished_removals = set()
+        if self.shared is not None:
+            self._publish_shared()
+
+    def _publish_shared(self):
+        """Hand the catalog to worker processes if it changed since last time"""
+        if self._shared_version == self.version:
+            return
+        self._shared_version = self.version
+        if self.versions is not None:
+            # Immutable, so it can be encoded off this thread
+            self.shared.publish_later(self.versions.current)
+        elif self.catalog is not None:
+            # Read unloaded attendee lists from the snapshot instead of
+            # materializing every LazyEvent; must run on this thread
+            self.shared.publish(self.events, self.catalog.heavy_fields)
+        else:
+            self.shared.publish(self.events)
+
+    def catalog_version(self):
+        """
+        Return a consistent read-only version of the catalog.
+
+        In versioned mode this is the last published version and costs
+        nothing; otherwise a one-off copy of the current events is made.
+        """
+        if self.versions is not None:
+            return self.versions.current
+        return VersionedCatalog().rebuild(self.events)
+
+    def compact(self):
+        """Rewrite the data file without deleted events and drop the tombstones"""
+        self.save_events()
+
+    def _read_tombstones(self):
+        if not os.path.exists(self.tombstone_file):
+            return set()
+        try:
+            with open(self.tombstone_file, "r", encoding="ascii") as f:
+                return {int(line) for line in f if line.strip()}
+        except (OSError, ValueError) as e:
+            print(f"Error loading tombstones: {e}")
+            return set()
+
+    def _add_tombstone(self, event_id):
+        """Record a deletion by appending to the tombstone file"""
+        with track_io("events.save_tombstone", self.tombstone_file, "write"):
+            with open(self.tombstone_file, "a", encoding="ascii") as f:
+                f.write(f"{event_id}\n")
+        self._tombstones.add(event_id)
+
+    def _clear_tombstones(self):
+        if self._tombstones or os.path.exists(self.tombstone_file):
+            try:
+                os.remove(self.tombstone_file)
+            except FileNotFoundError:
+                pass
+        self._tombstones = set()
+
+    def _save_snapshot(self):
+        with track_io("events.save_snapshot", self.snapshot_file, "write"):
+            save_events_snapshot(self.snapshot_file, self.events)
+
+    def export_json(self, filename=None):
+        """Write events to a JSON file (the data file by default)"""
+        filename = filename or self.data_file
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        with track_io("events.save_json", filename, "write"):
+            with open(filename, "w", encoding="utf-8") as f:
+                data = [e.to_dict() for e in self.events]
+                json.dump(data, f, indent=2, ensure_ascii=False)
+        return filename
+
+    def touch_event(self, event, *fields):
+        """
+        Refresh derived indexes after an event was changed in place.
+
+        fields names what changed (see EVENT_FIELDS); none means anything.
+        """
+        fields = fields or EVENT_FIELDS
+        self.changes.record("put", event.id, _change_data(event, fields))
+        self.query_cache.bump(*fields)
+        if self.catalog is not None:
+            self.catalog.touch(event)
+        if self.partitions is not None:
+            self.partitions.mark(event)
+        if self.versions is not None:
+            self._unpublished[event.id] = event
+        if self.table is not None:
+            self.table.upsert(event)
+        if self._search_text is not None and not set(fields).isdisjoint(
+            SEARCH_FIELDS
+        ):
+            self._search_text[event.id] = _search_text(event)
+        if self._availability is not None and not set(fields).isdisjoint(
+            AVAILABILITY_FIELDS
+        ):
+            self._availability.update(event)
+
+    @property
+    def version(self):
+        """Version of the latest saved event change"""
+        return self.changes.version
+
+    def changes_since(self, version):
+        """
+        Return event changes after version, oldest first.
+
+        Clients keep the version they last saw and apply the returned
+        entries instead of reloading the catalog; None means the history
+        is gone and a full reload (get_all_events) is needed.
+        """
+        return self.changes.changes_since(version)
 
     def get_all_events(self):
         """Get all events"""
@@ -41,40 +446,78 @@ class EventService:
 
     def get_event_by_id(self, event_id):
         """Get event by ID"""
-        for event in self.events:
-            if event.id == event_id:
-                return event
-        return None
+        return self._by_id.get(event_id)
 
     def create_event(
         self, name, date, capacity, location=None, description=None, organizer=None
     ):
         """Create a new event"""
-        # Validate inputs
+        capacity = self.validate_event(name, date, capacity)
+        new_id = self.id_sequence.next_id()
+
+        # Create event
+        event = Event(new_id, name, date, capacity, location, description, organizer)
+        self.events.append(event)
+        self._by_id[new_id] = event
+        self.query_cache.bump(MEMBERSHIP)
+        self.touch_event(event)
+        self.save_events()
+        return event
+
+    def validate_event(self, name, date, capacity):
+        """Check the fields of a new event and return the capacity as int"""
         if not name or not date:
             raise ValueError("Name and date are required")
+        if not isinstance(name, str) or not isinstance(date, str):
+            raise ValueError("Name and date must be text")
+        if isinstance(capacity, bool) or not isinstance(capacity, (int, str)):
+            # int() would also truncate floats and accept booleans
+            raise ValueError("Capacity must be a valid number")
 
         try:
             capacity = int(capacity)
             if capacity <= 0:
                 raise ValueError("Capacity must be positive")
-        except ValueError:
+        except (TypeError, ValueError):
             raise ValueError("Capacity must be a valid number")
 
-        # Validate date format
-        try:
-            datetime.strptime(date, "%Y-%m-%d")
-        except ValueError:
+        # Validate date format (parsed once per distinct string)
+        if not date_ordinal(date):
             raise ValueError("Date must be in YYYY-MM-DD format")
-
-        # Generate new ID
-        new_id = max([e.id for e in self.events], default=0) + 1
-
-        # Create event
-        event = Event(new_id, name, date, capacity, location, description, organizer)
-        self.events.append(event)
+        return capacity
+
+    def add_events(self, rows):
+        """
+        Create many events from validated field dicts with a single save.
+
+        Rows hold the create_event() arguments and must have passed
+        validate_event(). Indexes are rebuilt once at the end.
+        """
+        rows = list(rows)
+        if not rows:
+            return []
+
+        ids = self.id_sequence.next_ids(len(rows))
+        events = [
+            Event(
+                event_id,
+                row["name"],
+                row["date"],
+                row["capacity"],
+                row.get("location"),
+                row.get("description"),
+                row.get("organizer"),
+            )
+            for event_id, row in zip(ids, rows)
+        ]
+        self.events.extend(events)
+        for event in events:
+            self.changes.record("put", event.id, _change_data(event, EVENT_FIELDS))
+            if self.partitions is not None:
+                self.partitions.mark(event)
+        self._rebuild_indexes()
         self.save_events()
-        return event
+        return events
 
     def update_event(
         self,
@@ -90,40 +533,86 @@ class EventService:
         if not event:
             raise ValueError("Event not found")
 
-        if name:
-            event.name = name
-        if date:
-            try:
-                datetime.strptime(date, "%Y-%m-%d")
+        changed = []
+        try:
+            if name:
+                event.name = name
+                changed.append("name")
+            if date:
+                if not date_ordinal(date):
+                    raise ValueError("Date must be in YYYY-MM-DD format")
                 event.date = date
-            except ValueError:
-                raise ValueError("Date must be in YYYY-MM-DD format")
-        if capacity is not None:
-            try:
-                capacity = int(capacity)
-                if capacity < len(event.attendees):
-                    raise ValueError(
-                        f"Capacity cannot be less than current attendees ({len(event.attendees)})"
-                    )
-                event.capacity = capacity
-            except ValueError as e:
-                raise ValueError(str(e))
-        if location is not None:
-            event.location = location
-        if description is not None:
-            event.description = description
-
+                changed.append("date")
+            if capacity is not None:
+                try:
+                    capacity = int(capacity)
+                    if capacity < event.attendee_count():
+                        raise ValueError(
+                            f"Capacity cannot be less than current attendees ({event.attendee_count()})"
+                        )
+                    event.capacity = capacity
+                except ValueError as e:
+                    raise ValueError(str(e))
+                # A capacity increase may free seats for waitlisted users
+                self.notify_promotions(event, event.promote_waitlist())
+                changed.extend(("capacity", "attendees", "waitlist"))
+            if location is not None:
+                event.location = intern_str(location)
+                changed.append("location")
+            if description is not None:
+                event.description = description
+                changed.append("description")
+        finally:
+            # Keep indexes in sync even if a later field was invalid
+            if changed:
+                self.touch_event(event, *changed)
         self.save_events()
         return event
 
-    def delete_event(self, event_id):
-        """Delete an event"""
+    def delete_event(self, event_id, user_service=None):
+        """
+        Delete an event.
+
+        The deletion is appended to the tombstone file instead of rewriting
+        the catalog; compact() runs once compact_after deletions piled up.
+        With user_service (the one from set_user_service() by default)
+        the event is also dropped from the registered_events of its
+        attendees.
+        """
         event = self.get_event_by_id(event_id)
         if not event:
             raise ValueError("Event not found")
 
-        self.events = [e for e in self.events if e.id != event_id]
-        self.save_events()
+        attendees = list(event.attendees)
+        del self._by_id[event_id]
+        # Purged from the event list on its next access
+        self._deleted.add(event_id)
+        if self.catalog is not None:
+            self.catalog.forget(event_id)
+        if self.partitions is not None:
+            self.partitions.forget(event_id)
+        if self.table is not None:
+            self.table.remove(event_id)
+        if self._search_text is not None:
+            self._search_text.pop(event_id, None)
+        if self._availability is not None:
+            self._availability.remove(event_id)
+        self.query_cache.bump(MEMBERSHIP)
+
+        if self.versions is not None:
+            self._unpublished.pop(event_id, None)
+            self._unpublished_removals.add(event_id)
+        self.changes.record("delete", event_id)
+
+        self._add_tombstone(event_id)
+        self.changes.commit()
+        user_service = user_service or self.user_service
+        if user_service is not None:
+            user_service.remove_registrations(event_id, attendees)
+        if len(self._tombstones) >= self.compact_after:
+            self.compact()
+        else:
+            self.publish()
         return True
 
     def register_attendee(self, event_id, username):
@@ -133,6 +622,7 @@ class EventService:
             raise ValueError("Event not found")
 
         event.add_attendee(username)
+        self.touch_event(event, "attendees")
         self.save_events()
         return True
 
@@ -142,39 +632,241 @@ class EventService:
         if not event:
             raise ValueError("Event not found")
 
-        event.remove_attendee(username)
+        promoted = event.remove_attendee(username)
+        self.touch_event(event, "attendees", "waitlist")
+        self.save_events()
+        self.notify_promotions(event, promoted)
+        return True
+
+    def register_attendees(self, event_id, usernames):
+        """
+        Register many users for an event with a single save.
+
+        Returns the usernames that were added; nobody is added if they do
+        not all fit. With a user service attached, their registered_events
+        are updated in one users save.
+        """
+        event = self.get_event_by_id(event_id)
+        if not event:
+            raise ValueError("Event not found")
+
+        added = event.add_attendees(usernames)
+        if added:
+            self.touch_event(event, "attendees", "waitlist")
+            self.save_events()
+            if self.user_service is not None:
+                self.user_service.add_registrations(event_id, added)
+        return added
+
+    def unregister_attendees(self, event_id, usernames):
+        """
+        Unregister many users from an event with a single save.
+
+        With a user service attached, the removed and the promoted users
+        are updated in one users save as well.
+        """
+        event = self.get_event_by_id(event_id)
+        if not event:
+            raise ValueError("Event not found")
+
+        removed, promoted = event.remove_attendees(usernames)
+        if removed:
+            self.touch_event(event, "attendees", "waitlist")
+            self.save_events()
+            if self.user_service is not None:
+                self.user_service.update_registrations(event_id, promoted, removed)
+            self.notify_promotions(event, promoted, record=False)
+        return removed
+
+    def join_waitlist(self, event_id, username, priority=0):
+        """Put a user on the waitlist of a full event and return their position"""
+        event = self.get_event_by_id(event_id)
+        if not event:
+            raise ValueError("Event not found")
+
+        position = event.join_waitlist(username, priority)
+        self.touch_event(event, "waitlist")
+        self.save_events()
+        return position
+
+    def leave_waitlist(self, event_id, username):
+        """Remove a user from an event waitlist"""
+        event = self.get_event_by_id(event_id)
+        if not event:
+            raise ValueError("Event not found")
+
+        event.leave_waitlist(username)
+        self.touch_event(event, "waitlist")
         self.save_events()
         return True
 
-    def search_events(self, keyword=None, date=None):
-        """Search events by keyword or date"""
-        results = self.events
+    def get_waitlist_position(self, event_id, username):
+        """Get 1-based waitlist position of a user, or None"""
+        event = self.get_event_by_id(event_id)
+        if not event:
+            raise ValueError("Event not found")
+        return event.waitlist_position(username)
+
+    def get_user_waitlisted_events(self, username):
+        """Get all events a user is waitlisted for"""
+        return [e for e in self.events if e.is_waitlisted(username)]
+
+    def set_user_service(self, user_service):
+        """Record waitlist promotions and deletions on the users of user_service"""
+        self.user_service = user_service
+
+    def add_promotion_listener(self, listener):
+        """Register a callback run for every user promoted off a waitlist"""
+        self.promotion_listeners.append(listener)
+
+    def notify_promotions(self, event, promoted, record=True):
+        """
+        Handle users promoted off an event waitlist.
+
+        A promoted user is registered for the event: with record=True the
+        event is added to their registered_events in one save. Listeners
+        are informed either way.
+        """
+        if not promoted:
+            return
+        if record and self.user_service is not None:
+            self.user_service.add_registrations(event.id, promoted)
+        for username in promoted:
+            for listener in self.promotion_listeners:
+                listener(event.id, username)
+
+    def search_events(self, keyword=None, date=None, within=None, open_only=False):
+        """
+        Search events by keyword or date.
+
+        within limits the search to a previous result, e.g. to refine it
+        while the user keeps typing. open_only keeps events with free seats,
+        in date order. Whole-catalog searches are cached; callers must not
+        modify the returned list.
+        """
+        if within is not None or not (keyword or date):
+            return self._search(keyword, date, within, open_only)
+
+        key = ("search", keyword.lower() if keyword else None, date or None, open_only)
+        fields = (MEMBERSHIP,)
+        if keyword:
+            fields += SEARCH_FIELDS
+        if date:
+            fields += ("date",)
+        if open_only:
+            fields += AVAILABILITY_FIELDS
+        results = self.query_cache.get(key, fields)
+        if results is QueryCache.MISS:
+            results = self.query_cache.put(
+                key, fields, self._search(keyword, date, within, open_only)
+            )
+        return results
+
+    def _search(self, keyword, date, within, open_only):
+        if within is not None:
+            # Events deleted since the earlier search are gone from the indexes
+            results = [e for e in within if e.id in self._by_id]
+            if open_only:
+                available = self._availability_index()
+                results = [e for e in results if e.id in available]
+        elif open_only:
+            results = self._availability_index().open_events()
+        else:
+            results = self.events
 
         if keyword:
             keyword = keyword.lower()
-            results = [
-                e
-                for e in results
-                if keyword in e.name.lower()
-                or (e.description and keyword in e.description.lower())
-                or (e.location and keyword in e.location.lower())
-            ]
+            if self.catalog is not None:
+                # Keep lazy descriptions out of memory
+                results = [e for e in results if keyword in _search_text(e)]
+            else:
+                texts = self._search_texts()
+                results = [e for e in results if keyword in texts[e.id]]
 
         if date:
+            # Events store the canonical spelling of their date
+            date = parse_date(date)[0]
             results = [e for e in results if e.date == date]
 
         return results
 
+    def _search_texts(self):
+        """Return the search text index, building it if needed"""
+        if self._search_text is None:
+            self._search_text = {e.id: _search_text(e) for e in self.events}
+        return self._search_text
+
     def get_events_by_organizer(self, organizer):
         """Get all events organized by a specific organizer"""
-        return [e for e in self.events if e.organizer == organizer]
+        key = ("organizer", organizer)
+        fields = (MEMBERSHIP, "organizer")
+        results = self.query_cache.get(key, fields)
+        if results is QueryCache.MISS:
+            results = self.query_cache.put(
+                key, fields, [e for e in self.events if e.organizer == organizer]
+            )
+        return results
+
+    def _availability_index(self):
+        """Return the availability index, building it if needed"""
+        if self._availability is None:
+            self._availability = AvailabilityIndex(self.events)
+        return self._availability
+
+    def get_available_events(self, start_date=None, limit=None):
+        """Get events with free seats in date order, optionally from start_date"""
+        return self._availability_index().open_events(start_date, limit)
+
+    def get_almost_full_events(self, threshold=ALMOST_FULL):
+        """Get events with free seats but at least threshold of them taken"""
+        return self._availability_index().almost_full(threshold)
+
+    def get_upcoming_events(self):
+        """Get events after today in date order"""
+        return self._events_by_day("upcoming")
+
+    def get_past_events(self):
+        """Get events before today in date order"""
+        return self._events_by_day("past")
+
+    def _events_by_day(self, when):
+        today = today_ordinal()
+        key = (when, today)
+        fields = (MEMBERSHIP, "date")
+        results = self.query_cache.get(key, fields)
+        if results is not QueryCache.MISS:
+            return results
+
+        if self.table is not None:
+            # Compare the date ordinal column instead of looping over events
+            if when == "upcoming":
+                ids = self.table.upcoming_ids(today)
+            else:
+                ids = self.table.past_ids(today)
+            results = [self._by_id[event_id] for event_id in ids]
+        elif when == "upcoming":
+            results = [e for e in self.events if e.is_upcoming(today)]
+        else:
+            results = [e for e in self.events if e.is_past(today)]
+        results.sort(key=lambda e: (e.date_ordinal, e.id))
+        return self.query_cache.put(key, fields, results)
 
     def get_user_registered_events(self, username):
         """Get all events a user is registered for"""
-        return [e for e in self.events if username in e.attendees]
+        if self.catalog is not None:
+            return [e for e in self.events if e.has_attendee(username)]
+
+        # Resolve the username once, then scan the compact id arrays
+        symbol = USERNAMES.lookup(username)
+        if symbol is None:
+            return []
+        return [e for e in self.events if symbol in e.attendees.ids]
 
     def get_statistics(self):
         """Get event statistics"""
+        if self.table is not None:
+            return self._table_statistics()
+
         if not self.events:
             return {
                 "total_events": 0,
@@ -185,16 +877,16 @@ class EventService:
                 "full_events": 0,
             }
 
-        total_attendees = sum(len(e.attendees) for e in self.events)
-        events_with_attendees = [e for e in self.events if e.attendees]
+        total_attendees = sum(e.attendee_count() for e in self.events)
+        events_with_attendees = [e for e in self.events if e.attendee_count()]
 
         highest = (
-            max(self.events, key=lambda e: len(e.attendees))
+            max(self.events, key=lambda e: e.attendee_count())
             if events_with_attendees
             else None
         )
         lowest = (
-            min(events_with_attendees, key=lambda e: len(e.attendees))
+            min(events_with_attendees, key=lambda e: e.attendee_count())
             if events_with_attendees
             else None
         )
@@ -206,51 +898,87 @@ class EventService:
                 total_attendees / len(self.events) if self.events else 0
             ),
             "highest_attendance": (
-                {"name": highest.name, "attendees": len(highest.attendees)}
+                {"name": highest.name, "attendees": highest.attendee_count()}
                 if highest
                 else None
             ),
             "lowest_attendance": (
-                {"name": lowest.name, "attendees": len(lowest.attendees)}
+                {"name": lowest.name, "attendees": lowest.attendee_count()}
                 if lowest
                 else None
             ),
             "full_events": len([e for e in self.events if e.is_full()]),
         }
 
-    def export_to_csv(self, filename="reports/events_report.csv"):
-        """Export events to CSV file"""
+    def _table_statistics(self):
+        """Get event statistics from the columnar view"""
+        table = self.table
+        total_events = len(table)
+        total_attendees = table.total_attendees()
+        highest = self.get_event_by_id(table.highest_attendance())
+        lowest = self.get_event_by_id(table.lowest_attendance())
+
+        return {
+            "total_events": total_events,
+            "total_attendees": total_attendees,
+            "average_attendance": (
+                total_attendees / total_events if total_events else 0
+            ),
+            "highest_attendance": (
+                {"name": highest.name, "attendees": highest.attendee_count()}
+                if highest
+                else None
+            ),
+            "lowest_attendance": (
+                {"name": lowest.name, "attendees": lowest.attendee_count()}
+                if lowest
+                else None
+            ),
+            "full_events": table.full_count(),
+        }
+
+    def get_statistics_by_day(self):
+        """Get capacity and attendance totals per event date"""
+        table = self.table if self.table is not None else EventTable(self.events)
+        return table.by_day()
+
+    def get_statistics_by_organizer(self):
+        """Get capacity and attendance totals per organizer"""
+        table = self.table if self.table is not None else EventTable(self.events)
+        return table.by_organizer()
+
+    def iter_archived_events(self, months=None):
+        """
+        Yield events of archived past months (storage="partitioned" only).
+
+        months is a list of YYYY-MM keys, all archived months by default.
+        Partitions are read one at a time and not kept in memory.
+        """
+        if self.partitions is None:
+            return
+        for event in self.partitions.iter_archived(months):
+            if event.id not in self._by_id:  # Loaded copies are newer
+                yield event
+
+    def export_to_csv(
+        self, filename="reports/events_report.csv", include_archive=False
+    ):
+        """Export events to CSV file, optionally with archived past events"""
         import csv
+        from itertools import chain
 
-        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        # A snapshot keeps the export consistent while registrations go on
+        events = self.catalog_version() if self.versions is not None else self.events
+        if include_archive:
+            events = chain(self.iter_archived_events(), events)
 
-        with open(filename, "w", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-            writer.writerow(
-                [
-                    "ID",
-                    "Name",
-                    "Date",
-                    "Capacity",
-                    "Attendees",
-                    "Available Slots",
-                    "Location",
-                    "Organizer",
-                ]
-            )
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
 
-            for event in self.events:
-                writer.writerow(
-                    [
-                        event.id,
-                        event.name,
-                        event.date,
-                        event.capacity,
-                        len(event.attendees),
-                        event.available_slots(),
-                        event.location or "",
-                        event.organizer or "",
-                    ]
-                )
+        with track_io("events.export_csv", filename, "write"):
+            with open(filename, "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(CSV_COLUMNS)
+                for event in events:
+                    writer.writerow(csv_row(event))
 
         return filename
@@ -0,0 +1,217 @@
+"""
+Event Table - Columnar view of the event catalog for analytics queries
+"""
+
+from array import array
+from datetime import datetime
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, the array module is the fallback
+    np = None
+
+
+class EventTable:
+    """
+    Column arrays of capacity, attendee count, date ordinal and organizer id.
+
+    One row per event, addressed through the event ID. Rows are removed by
+    moving the last row into the gap, so every update is O(1). Aggregates
+    run over the flat columns with NumPy when it is installed.
+    """
+
+    def __init__(self, events=()):
+        self.ids = array("q")
+        self.capacity = array("q")
+        self.attendee_count = array("q")
+        self.date_ordinal = array("q")
+        self.organizer_id = array("q")
+        self.organizers = []  # Organizer id -> organizer username
+        self._organizer_ids = {}
+        self._rows = {}  # Event ID -> row
+        for event in events:
+            self.upsert(event)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def _organizer(self, organizer):
+        organizer_id = self._organizer_ids.get(organizer)
+        if organizer_id is None:
+            organizer_id = len(self.organizers)
+            self.organizers.append(organizer)
+            self._organizer_ids[organizer] = organizer_id
+        return organizer_id
+
+    def upsert(self, event):
+        """Insert or refresh the row of an event"""
+        values = (
+            event.capacity,
+            event.attendee_count(),
+            event.date_ordinal,
+            self._organizer(event.organizer),
+        )
+        row = self._rows.get(event.id)
+        if row is None:
+            self._rows[event.id] = len(self.ids)
+            self.ids.append(event.id)
+            for column, value in zip(self._columns(), values):
+                column.append(value)
+        else:
+            for column, value in zip(self._columns(), values):
+                column[row] = value
+
+    def remove(self, event_id):
+        """Remove the row of an event"""
+        row = self._rows.pop(event_id, None)
+        if row is None:
+            return
+
+        last = len(self.ids) - 1
+        if row != last:
+            moved_id = self.ids[last]
+            self.ids[row] = moved_id
+            for column in self._columns():
+                column[row] = column[last]
+            self._rows[moved_id] = row
+        self.ids.pop()
+        for column in self._columns():
+            column.pop()
+
+    def _columns(self):
+        return (
+            self.capacity,
+            self.attendee_count,
+            self.date_ordinal,
+            self.organizer_id,
+        )
+
+    def _view(self, column):
+        """Zero-copy NumPy view of a column (must not outlive the call)"""
+        return np.frombuffer(column, dtype=np.int64)
+
+    def total_capacity(self):
+        """Sum of capacity over all events"""
+        if np is not None and self.ids:
+            return int(self._view(self.capacity).sum())
+        return sum(self.capacity)
+
+    def total_attendees(self):
+        """Sum of attendees over all events"""
+        if np is not None and self.ids:
+            return int(self._view(self.attendee_count).sum())
+        return sum(self.attendee_count)
+
+    def full_count(self):
+        """Number of events at capacity"""
+        if np is not None and self.ids:
+            counts = self._view(self.attendee_count)
+            return int((counts >= self._view(self.capacity)).sum())
+        return sum(map(int.__ge__, self.attendee_count, self.capacity))
+
+    def fill_rate(self):
+        """Overall share of seats taken"""
+        capacity = self.total_capacity()
+        return self.total_attendees() / capacity if capacity else 0
+
+    def fill_rates(self):
+        """Return {event_id: attendees / capacity}"""
+        if np is not None and self.ids:
+            capacity = self._view(self.capacity)
+            rates = self._view(self.attendee_count) / np.maximum(capacity, 1)
+            return dict(zip(self.ids, rates.tolist()))
+        return {
+            event_id: count / capacity if capacity else 0
+            for event_id, count, capacity in zip(
+                self.ids, self.attendee_count, self.capacity
+            )
+        }
+
+    def upcoming_ids(self, today):
+        """Return IDs of events dated after the day ordinal today"""
+        if np is not None and self.ids:
+            rows = np.flatnonzero(self._view(self.date_ordinal) > today)
+            return [self.ids[row] for row in rows.tolist()]
+        return [
+            event_id
+            for event_id, ordinal in zip(self.ids, self.date_ordinal)
+            if ordinal > today
+        ]
+
+    def past_ids(self, today):
+        """Return IDs of events dated before the day ordinal today"""
+        if np is not None and self.ids:
+            ordinals = self._view(self.date_ordinal)
+            rows = np.flatnonzero((ordinals > 0) & (ordinals < today))
+            return [self.ids[row] for row in rows.tolist()]
+        return [
+            event_id
+            for event_id, ordinal in zip(self.ids, self.date_ordinal)
+            if 0 < ordinal < today
+        ]
+
+    def highest_attendance(self):
+        """Return ID of the event with the most attendees, or None"""
+        if not self.ids:
+            return None
+        if np is not None:
+            counts = self._view(self.attendee_count)
+            row = int(counts.argmax())
+        else:
+            counts = self.attendee_count
+            row = max(range(len(counts)), key=counts.__getitem__)
+        return self.ids[row] if counts[row] > 0 else None
+
+    def lowest_attendance(self):
+        """Return ID of the event with the fewest (but some) attendees, or None"""
+        if np is not None and self.ids:
+            counts = self._view(self.attendee_count)
+            rows = np.flatnonzero(counts > 0)
+            if not len(rows):
+                return None
+            return self.ids[int(rows[counts[rows].argmin()])]
+
+        rows = [row for row, count in enumerate(self.attendee_count) if count > 0]
+        if not rows:
+            return None
+        return self.ids[min(rows, key=self.attendee_count.__getitem__)]
+
+    def group_by(self, key_column):
+        """Return {key: {"events", "capacity", "attendees"}} grouped on a column"""
+        if np is not None and self.ids:
+            keys, inverse = np.unique(self._view(key_column), return_inverse=True)
+            events = np.bincount(inverse)
+            capacity = np.bincount(inverse, weights=self._view(self.capacity))
+            attendees = np.bincount(inverse, weights=self._view(self.attendee_count))
+            return {
+                key: {"events": int(n), "capacity": int(c), "attendees": int(a)}
+                for key, n, c, a in zip(
+                    keys.tolist(), events, capacity.tolist(), attendees.tolist()
+                )
+            }
+
+        groups = {}
+        for key, capacity, count in zip(
+            key_column, self.capacity, self.attendee_count
+        ):
+            group = groups.get(key)
+            if group is None:
+                group = groups[key] = {"events": 0, "capacity": 0, "attendees": 0}
+            group["events"] += 1
+            group["capacity"] += capacity
+            group["attendees"] += count
+        return groups
+
+    def by_day(self):
+        """Aggregate per event date, keyed by YYYY-MM-DD ("" for invalid dates)"""
+        return {
+            datetime.fromordinal(ordinal).strftime("%Y-%m-%d") if ordinal else "": group
+            for ordinal, group in self.group_by(self.date_ordinal).items()
+        }
+
+    def by_organizer(self):
+        """Aggregate per organizer username"""
+        return {
+            self.organizers[organizer_id]: group
+            for organizer_id, group in self.group_by(self.organizer_id).items()
+        }
@@ -0,0 +1,141 @@
+"""
+ID Sequence - Persistent monotonic ID allocation shared between processes
+
+The sequence file holds the next ID that no process has claimed yet.
+Processes reserve IDs in blocks while holding a lock file, then hand them
+out from memory, so IDs are never reused even after the newest event is
+deleted. IDs left in a block when a process exits are skipped.
+"""
+
+import os
+import time
+
+
+class LockFile:
+    """
+    Exclusive lock held by creating a file with O_EXCL.
+
+    Works on every platform without fcntl/msvcrt. A lock older than stale
+    seconds is assumed to belong to a crashed process and is broken.
+    """
+
+    def __init__(self, path, timeout=5.0, stale=30.0, poll=0.01):
+        self.path = path
+        self.timeout = timeout
+        self.stale = stale
+        self.poll = poll
+
+    def acquire(self):
+        """Wait until the lock file could be created"""
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                fd = os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                if self._break_stale():
+                    continue
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(f"Could not lock {self.path}")
+                time.sleep(self.poll)
+            else:
+                os.write(fd, str(os.getpid()).encode("ascii"))
+                os.close(fd)
+                return
+
+    def _break_stale(self):
+        try:
+            age = time.time() - os.path.getmtime(self.path)
+            if age < self.stale:
+                return False
+            os.remove(self.path)
+        except OSError:
+            pass  # Released or broken by someone else meanwhile
+        return True
+
+    def release(self):
+        """Remove the lock file"""
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
+
+
+class IdSequence:
+    """
+    Hands out increasing integer IDs backed by a sequence file.
+
+    block is how many IDs are reserved per file access: 1 keeps IDs dense,
+    larger blocks let several processes create events without contending
+    for the lock on every ID.
+    """
+
+    def __init__(self, path, block=1):
+        if block <= 0:
+            raise ValueError("Block size must be positive")
+
+        self.path = path
+        self.block = block
+        self.lock = LockFile(path + ".lock")
+        self._next = 0  # Next ID of the reserved block
+        self._limit = 0  # End of the reserved block (exclusive)
+        self._floor = 1  # Lowest ID that may still be handed out
+
+    def advance_past(self, event_id):
+        """Make sure IDs handed out later are larger than event_id"""
+        if event_id >= self._floor:
+            self._floor = event_id + 1
+        if self._next <= event_id:
+            # Drop a reserved block that overlaps IDs already in use
+            self._next = self._limit = 0
+
+    def next_id(self):
+        """Return a new ID"""
+        if self._next >= self._limit:
+            self._reserve()
+        event_id = self._next
+        self._next += 1
+        return event_id
+
+    def next_ids(self, count):
+        """Return a range of count consecutive new IDs"""
+        if self._limit - self._next < count:
+            self._reserve(max(count, self.block))
+        start = self._next
+        self._next += count
+        return range(start, start + count)
+
+    def _reserve(self, size=None):
+        """Claim the next block of IDs from the sequence file"""
+        size = size or self.block
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self.lock:
+            start = max(self._read(), self._floor)
+            self._write(start + size)
+        self._next = start
+        self._limit = start + size
+        self._floor = self._limit
+
+    def _read(self):
+        try:
+            with open(self.path, "r", encoding="ascii") as f:
+                return int(f.read().strip() or 1)
+        except FileNotFoundError:
+            return 1
+        except ValueError:
+            print(f"Error reading ID sequence {self.path}, rebuilding it")
+            return 1
+
+    def _write(self, value):
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "w", encoding="ascii") as f:
+            f.write(f"{value}\n")
+        os.replace(temp_path, self.path)
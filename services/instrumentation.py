@@ -0,0 +1,273 @@
+"""
+Instrumentation - Opt-in call counts, latency histograms and I/O metrics
+
+Nothing is measured until enable() is called. Enabling wraps every public
+method of the instrumented service classes; disable() puts the original
+methods back, so the services run unwrapped when instrumentation is off.
+File I/O is reported by the services through track_io(), which returns a
+shared no-op context while disabled.
+"""
+
+import functools
+import inspect
+import json
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+# Latency buckets grow by 10% from 0.1 microseconds
+BUCKET_BASE = 1e-7
+BUCKET_GROWTH = 1.1
+_LOG_GROWTH = math.log(BUCKET_GROWTH)
+PERCENTILES = (50, 95, 99)
+
+_NOOP = nullcontext()
+
+metrics = None  # Active Metrics while instrumentation is enabled
+_patched = []  # (class, attribute, original) of wrapped methods
+_dumper = None
+
+
+class Histogram:
+    """Log-bucketed latency histogram with about 5% percentile error"""
+
+    def __init__(self):
+        self.buckets = {}  # Bucket index -> count
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds):
+        """Record one duration"""
+        if seconds > BUCKET_BASE:
+            index = math.ceil(math.log(seconds / BUCKET_BASE) / _LOG_GROWTH)
+        else:
+            index = 0
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, percent):
+        """Return the upper bound of the bucket holding a percentile"""
+        if not self.count:
+            return 0.0
+        rank = percent / 100 * self.count
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                return min(BUCKET_BASE * BUCKET_GROWTH**index, self.max)
+        return self.max
+
+    def summary(self):
+        """Return count, total, mean, max and percentiles in seconds"""
+        result = {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.total / self.count if self.count else 0.0,
+            "max": self.max,
+        }
+        for percent in PERCENTILES:
+            result[f"p{percent}"] = self.percentile(percent)
+        return result
+
+
+class Metrics:
+    """Thread-safe registry of method and I/O measurements"""
+
+    def __init__(self):
+        self.started = time.time()
+        self.methods = {}  # "Class.method" -> Histogram
+        self.io = {}  # Operation -> Histogram
+        self.bytes_read = {}  # Method or operation -> bytes
+        self.bytes_written = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _stack(self):
+        """Instrumented methods currently running on this thread"""
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def record_call(self, name, seconds):
+        """Record one call of an instrumented method"""
+        with self._lock:
+            histogram = self.methods.get(name)
+            if histogram is None:
+                histogram = self.methods[name] = Histogram()
+            histogram.add(seconds)
+
+    def record_io(self, operation, direction, size, seconds):
+        """Record a file read or write and charge it to the running methods"""
+        counters = self.bytes_read if direction == "read" else self.bytes_written
+        with self._lock:
+            histogram = self.io.get(operation)
+            if histogram is None:
+                histogram = self.io[operation] = Histogram()
+            histogram.add(seconds)
+            for name in {operation, *self._stack()}:
+                counters[name] = counters.get(name, 0) + size
+
+    @contextmanager
+    def track_io(self, operation, path, direction):
+        """Time a block that reads or writes path"""
+        start = time.perf_counter()
+        size = _file_size(path) if direction == "read" else 0
+        yield
+        if direction == "write":
+            size = _file_size(path)
+        self.record_io(operation, direction, size, time.perf_counter() - start)
+
+    def wrap(self, name, function):
+        """Return function wrapped to record its calls under name"""
+        stack = self._stack
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            running = stack()
+            running.append(name)
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self.record_call(name, time.perf_counter() - start)
+                running.pop()
+
+        return wrapper
+
+    def report(self):
+        """Return all measurements as a JSON-serializable dict"""
+        with self._lock:
+
+            def section(histograms):
+                result = {}
+                for name, histogram in sorted(histograms.items()):
+                    entry = histogram.summary()
+                    entry["bytes_read"] = self.bytes_read.get(name, 0)
+                    entry["bytes_written"] = self.bytes_written.get(name, 0)
+                    result[name] = entry
+                return result
+
+            return {
+                "started": self.started,
+                "uptime": time.time() - self.started,
+                "methods": section(self.methods),
+                "io": section(self.io),
+            }
+
+
+def _file_size(path):
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+def _default_classes():
+    from services.event_service import EventService
+    from services.user_service import UserService
+
+    return (EventService, UserService)
+
+
+def enable(classes=None, dump_file=None, interval=60.0):
+    """
+    Start collecting metrics and return the registry.
+
+    Public methods of classes (EventService and UserService by default)
+    are wrapped in place. With dump_file the report is rewritten every
+    interval seconds and once more on disable().
+    """
+    global metrics, _dumper
+    if metrics is not None:
+        return metrics
+
+    metrics = Metrics()
+    for cls in classes or _default_classes():
+        for attribute, value in list(vars(cls).items()):
+            if attribute.startswith("_") or not inspect.isfunction(value):
+                continue
+            _patched.append((cls, attribute, value))
+            setattr(cls, attribute, metrics.wrap(f"{cls.__name__}.{attribute}", value))
+
+    if dump_file:
+        _dumper = _Dumper(dump_file, interval)
+        _dumper.start()
+    return metrics
+
+
+def disable():
+    """Stop collecting, restore the original methods and write a last dump"""
+    global metrics, _dumper
+    if metrics is None:
+        return
+    while _patched:
+        cls, attribute, original = _patched.pop()
+        setattr(cls, attribute, original)
+    if _dumper is not None:
+        _dumper.stop()
+        _dumper = None
+    metrics = None
+
+
+def is_enabled():
+    """Check if instrumentation is collecting"""
+    return metrics is not None
+
+
+def report():
+    """Return the current measurements, or None when disabled"""
+    return metrics.report() if metrics is not None else None
+
+
+def track_io(operation, path, direction):
+    """Context manager timing a file read ("read") or write ("write")"""
+    if metrics is None:
+        return _NOOP
+    return metrics.track_io(operation, path, direction)
+
+
+def dump(filename):
+    """Write the current report to a JSON file atomically"""
+    data = report()
+    if data is None:
+        return None
+    temp_path = filename + ".tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+    os.replace(temp_path, filename)
+    return filename
+
+
+class _Dumper:
+    """Background thread writing the report every interval seconds"""
+
+    def __init__(self, filename, interval):
+        self.filename = filename
+        self.interval = interval
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        self._thread.join()
+        self._write()
+
+    def _run(self):
+        while not self._stopped.wait(self.interval):
+            self._write()
+
+    def _write(self):
+        try:
+            dump(self.filename)
+        except Exception as e:
+            print(f"Error writing metrics: {e}")
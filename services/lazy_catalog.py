@@ -0,0 +1,308 @@
+"""
+Lazy Catalog - Row index over a snapshot with on-demand Event materialization
+"""
+
+from array import array
+from collections import OrderedDict
+
+from models.event import Event
+from models.symbols import NameList, USERNAMES
+from services.snapshot import (
+    SnapshotReader,
+    encode_events,
+    paused_gc,
+    write_snapshot,
+)
+
+# Slot descriptors of the fields that are loaded on demand
+_DESCRIPTION = Event.__dict__["description"]
+_ATTENDEES = Event.__dict__["attendees"]
+_WAITLIST = Event.__dict__["waitlist"]
+
+
+def _lazy_field(slot, loader):
+    """Property that reads a slot and falls back to loader while it is unset"""
+
+    def get(self):
+        try:
+            return slot.__get__(self, Event)
+        except AttributeError:
+            return loader(self)
+
+    def set(self, value):
+        slot.__set__(self, value)
+
+    return property(get, set)
+
+
+class LazyEvent(Event):
+    """
+    Event that holds only its list-view fields until more is needed.
+
+    id, name, date, capacity, location and organizer are always loaded.
+    The description is read from the snapshot on access; attendees and
+    waitlist are materialized on first access and may be released again
+    by the catalog's LRU once the event is saved.
+    """
+
+    __slots__ = ("_catalog", "_row", "_count")
+
+    description = _lazy_field(
+        _DESCRIPTION, lambda self: self._catalog.description(self)
+    )
+    attendees = _lazy_field(
+        _ATTENDEES, lambda self: self._catalog.materialize(self)[0]
+    )
+    waitlist = _lazy_field(_WAITLIST, lambda self: self._catalog.materialize(self)[1])
+
+    def is_materialized(self):
+        """Check if attendees and waitlist are loaded"""
+        try:
+            _ATTENDEES.__get__(self, Event)
+            return True
+        except AttributeError:
+            return False
+
+    def attendee_count(self):
+        """Return number of registered attendees"""
+        if self.is_materialized():
+            return len(self.attendees)
+        return self._count
+
+    def has_attendee(self, username):
+        """Check if a user is registered"""
+        if self.is_materialized():
+            return username in self.attendees
+        return self._catalog.row_has_attendee(self._row, username)
+
+    def is_waitlisted(self, username):
+        """Check if user is on the waitlist"""
+        if not self.is_materialized() and not self._catalog.waitlist_size(self._row):
+            return False
+        return Event.is_waitlisted(self, username)
+
+
+class LazyCatalog:
+    """
+    Events backed by a memory-mapped snapshot.
+
+    Only the list-view fields are decoded at load time; the remaining
+    columns stay in the mapped file. At most max_materialized events keep
+    their attendee lists in memory; changed events are pinned until the
+    next save.
+    """
+
+    def __init__(self, path, max_materialized=1000):
+        if max_materialized <= 0:
+            raise ValueError("max_materialized must be positive")
+
+        self.path = path
+        self.max_materialized = max_materialized
+        self._lru = OrderedDict()  # Event ID -> materialized LazyEvent
+        self._dirty = set()  # IDs of changed events
+        self.reader = None
+        self.closed = False
+        self._open()
+        with paused_gc():
+            self.events = self._build_events()
+
+    def _open(self):
+        self.reader = SnapshotReader(self.path)
+        self.strings = self.reader.string_table(mapped=True)
+        self._description = self.reader.raw("description")
+        self._attendee_start = self.reader.raw("attendee_start")
+        self._attendees = self.reader.raw("attendees")
+        self._waitlist_start = self.reader.raw("waitlist_start")
+        self._symbols = {}  # Snapshot string index -> USERNAMES id
+        self._sids = None  # Username -> snapshot string index
+
+    def close(self):
+        """
+        Release the mapped snapshot.
+
+        Events of a closed catalog keep the fields already in memory, but
+        reading an unloaded description or attendee list raises ValueError.
+        """
+        self.closed = True
+        self._release()
+
+    def _check_open(self):
+        if self.closed:
+            raise ValueError(
+                "Event belongs to a closed catalog (the events were reloaded); "
+                "look it up again"
+            )
+
+    def _release(self):
+        if self.reader is None:
+            return
+        for view in (
+            self.strings.blob,
+            self._description,
+            self._attendee_start,
+            self._attendees,
+            self._waitlist_start,
+        ):
+            view.release()
+        self.reader.close()
+        self.reader = None
+
+    def _build_events(self):
+        """Create LazyEvents from the light columns"""
+        reader = self.reader
+        columns = ("name", "date", "location", "organizer")
+        sids = {name: reader.raw(name).tolist() for name in columns}
+        # Decode only the strings the light columns refer to
+        used = sorted(set().union(*sids.values()))
+        text = dict(zip(used, self.strings.get_many(used)))
+        text[-1] = None
+
+        starts = self._attendee_start.tolist()
+        events = []
+        for row, (event_id, name, date, capacity, location, organizer) in enumerate(
+            zip(
+                reader.raw("id").tolist(),
+                map(text.__getitem__, sids["name"]),
+                map(text.__getitem__, sids["date"]),
+                reader.raw("capacity").tolist(),
+                map(text.__getitem__, sids["location"]),
+                map(text.__getitem__, sids["organizer"]),
+            )
+        ):
+            event = LazyEvent.__new__(LazyEvent)
+            event.id = event_id
+            event.name = name
+            event.date = date
+            event.capacity = capacity
+            event.location = location
+            event.organizer = organizer
+            event._catalog = self
+            event._row = row
+            event._count = starts[row + 1] - starts[row]
+            events.append(event)
+        return events
+
+    def _symbol(self, sid):
+        symbol = self._symbols.get(sid)
+        if symbol is None:
+            symbol = self._symbols[sid] = USERNAMES.intern(self.strings.get(sid))
+        return symbol
+
+    def _raw_attendees(self, row):
+        start, end = self._attendee_start[row], self._attendee_start[row + 1]
+        return array("i", map(self._symbol, self._attendees[start:end]))
+
+    def _raw_waitlist(self, row):
+        start, end = self._waitlist_start[row], self._waitlist_start[row + 1]
+        if start == end:
+            return []
+        priority = self.reader.raw("waitlist_prio")
+        joined = self.reader.raw("waitlist_joined")
+        user = self.reader.raw("waitlist_user")
+        try:
+            return [
+                [priority[i], joined[i], self.strings.get(user[i])]
+                for i in range(start, end)
+            ]
+        finally:
+            for view in (priority, joined, user):
+                view.release()
+
+    def description(self, event):
+        """Read the description of an event from the snapshot"""
+        self._check_open()
+        return self.strings.get(self._description[event._row])
+
+    def waitlist_size(self, row):
+        """Return waitlist length of a row in the snapshot"""
+        self._check_open()
+        return self._waitlist_start[row + 1] - self._waitlist_start[row]
+
+    def row_has_attendee(self, row, username):
+        """Check the snapshot attendee list of a row for a username"""
+        self._check_open()
+        if self._sids is None:
+            self._sids = {
+                self.strings.get(sid): sid for sid in set(self._attendees.tolist())
+            }
+        sid = self._sids.get(username)
+        if sid is None:
+            return False
+        start, end = self._attendee_start[row], self._attendee_start[row + 1]
+        return sid in self._attendees[start:end]
+
+    def materialize(self, event):
+        """Load attendees, waitlist and description of an event"""
+        self._check_open()
+        attendees = NameList.from_ids(self._raw_attendees(event._row))
+        waitlist = self._raw_waitlist(event._row)
+        _ATTENDEES.__set__(event, attendees)
+        _WAITLIST.__set__(event, waitlist)
+        try:
+            _DESCRIPTION.__get__(event, Event)
+        except AttributeError:
+            _DESCRIPTION.__set__(event, self.description(event))
+
+        self._lru[event.id] = event
+        self._evict()
+        return attendees, waitlist
+
+    def touch(self, event):
+        """Mark an event as changed so it stays loaded until saved"""
+        if isinstance(event, LazyEvent):
+            self._dirty.add(event.id)
+            if event.id in self._lru:
+                self._lru.move_to_end(event.id)
+
+    def forget(self, event_id):
+        """Drop a deleted event from the LRU"""
+        self._lru.pop(event_id, None)
+        self._dirty.discard(event_id)
+
+    def materialized_count(self):
+        """Return number of events currently holding their attendee lists"""
+        return len(self._lru)
+
+    def _evict(self):
+        """Release least recently used clean events beyond the bound"""
+        excess = len(self._lru) - self.max_materialized
+        if excess <= 0:
+            return
+        for event_id in list(self._lru):
+            if excess <= 0:
+                break
+            if event_id in self._dirty:
+                continue
+            event = self._lru.pop(event_id)
+            _ATTENDEES.__delete__(event)
+            _WAITLIST.__delete__(event)
+            _DESCRIPTION.__delete__(event)
+            excess -= 1
+
+    def heavy_fields(self, event):
+        """Heavy fields for saving, read from the snapshot when not loaded"""
+        if isinstance(event, LazyEvent) and not event.is_materialized():
+            return (
+                event.description,
+                self._raw_attendees(event._row),
+                self._raw_waitlist(event._row),
+            )
+        return event.description, event.attendees.ids, event.waitlist
+
+    def save(self, events):
+        """Write events to the snapshot and re-point rows at the new file"""
+        sections = encode_events(events, self.heavy_fields)
+        # The old mapping must be closed before the file is replaced
+        self._release()
+        try:
+            write_snapshot(self.path, sections)
+        finally:
+            # Maps the old file again if the write failed; it is intact
+            self._open()
+
+        for row, event in enumerate(events):
+            if isinstance(event, LazyEvent):
+                event._count = event.attendee_count()
+                event._row = row
+        self._dirty.clear()
+        self._evict()
@@ -0,0 +1,261 @@
+"""
+Partitioned Store - Month-partitioned event files with a compressed archive
+
+Events are stored in one JSON file per month of their date:
+
+    data/events/2025-03.json          current and upcoming months
+    data/events/undated.json          events without a valid date
+    data/events/archive/2024-11.json.gz   past months
+    data/events/archive/index.json    per archived month: event count, max ID
+
+Only the active months are loaded. When a month is over its file moves to
+the archive, which is read on demand for reports. Saving rewrites only the
+months whose events changed since the last save.
+"""
+
+import gzip
+import json
+import os
+from datetime import date
+
+from models.event import Event
+from services.instrumentation import track_io
+
+UNDATED = "undated"
+
+
+def partition_key(event):
+    """Return the YYYY-MM month an event is stored under"""
+    if not event.date_ordinal:
+        return UNDATED
+    day = date.fromordinal(event.date_ordinal)
+    return f"{day.year:04d}-{day.month:02d}"
+
+
+def current_key():
+    """Return the YYYY-MM key of the current month"""
+    today = date.today()
+    return f"{today.year:04d}-{today.month:02d}"
+
+
+def is_past(key, current=None):
+    """Check if a partition key names a month that is over"""
+    return key != UNDATED and key < (current or current_key())
+
+
+class PartitionedStore:
+    """
+    Active event partitions on disk plus the archive of past months.
+
+    mark() and forget() record which months changed; save() writes just
+    those. Events moved into a past month are merged into its archive, and
+    events deleted from or moved out of an archived month are removed from
+    it.
+    """
+
+    def __init__(self, directory, compress=True):
+        self.directory = directory
+        self.archive_dir = os.path.join(directory, "archive")
+        self.compress = compress
+        self._members = {}  # Partition key -> {event ID: Event}
+        self._partition_of = {}  # Event ID -> partition key
+        self._dirty = set()  # Partition keys changed since the last save
+        self._removed = {}  # Partition key -> IDs deleted or moved out of it
+        self._unplaced = set()  # Deleted IDs of events that are not loaded
+        self._index = None  # Archive index, read on first use
+
+    def exists(self):
+        """Check if the partition directory has been created"""
+        return os.path.isdir(self.directory)
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.json")
+
+    def _archive_path(self, key):
+        extension = ".json.gz" if self.compress else ".json"
+        return os.path.join(self.archive_dir, key + extension)
+
+    def _active_keys(self):
+        if not self.exists():
+            return []
+        return sorted(
+            name[:-5]
+            for name in os.listdir(self.directory)
+            if name.endswith(".json")
+        )
+
+    def load(self):
+        """Archive months that are over and return the events of the rest"""
+        self.rollover()
+        self._members = {}
+        self._partition_of = {}
+        self._dirty = set()
+        self._removed = {}
+        self._unplaced = set()
+        events = []
+        for key in self._active_keys():
+            path = self._path(key)
+            with track_io("events.load_partition", path, "read"):
+                partition = _read_events(path)
+            self._members[key] = {e.id: e for e in partition}
+            for event in partition:
+                self._partition_of[event.id] = key
+            events.extend(partition)
+        return events
+
+    def reset(self, events):
+        """Place events into partitions, all to be written on the next save"""
+        self._members = {}
+        self._partition_of = {}
+        for event in events:
+            self.mark(event)
+
+    def mark(self, event):
+        """Record that an event was added or changed"""
+        key = partition_key(event)
+        old_key = self._partition_of.get(event.id)
+        if old_key is not None and old_key != key:
+            # The date moved the event to another month
+            self._members[old_key].pop(event.id, None)
+            self._removed.setdefault(old_key, set()).add(event.id)
+            self._dirty.add(old_key)
+        members = self._members.get(key)
+        if members is None:
+            members = self._members[key] = {}
+        members[event.id] = event
+        self._partition_of[event.id] = key
+        self._dirty.add(key)
+
+    def forget(self, event_id):
+        """Record that an event was deleted"""
+        key = self._partition_of.pop(event_id, None)
+        if key is None:
+            # Not loaded, e.g. archived since: looked up in the archive on save
+            self._unplaced.add(event_id)
+            return
+        self._members[key].pop(event_id, None)
+        self._removed.setdefault(key, set()).add(event_id)
+        self._dirty.add(key)
+
+    def save(self):
+        """Write the partitions that changed since the last save"""
+        os.makedirs(self.directory, exist_ok=True)
+        current = current_key()
+        self._place_unplaced()
+        for key in sorted(self._dirty):
+            events = list(self._members.get(key, {}).values())
+            if is_past(key, current):
+                removed = self._removed.get(key, ())
+                if events or removed:
+                    self._archive(key, events, removed)
+                path = self._path(key)
+                if os.path.exists(path):
+                    os.remove(path)
+            elif events:
+                path = self._path(key)
+                with track_io("events.save_partition", path, "write"):
+                    _write_events(path, events)
+            elif os.path.exists(self._path(key)):
+                os.remove(self._path(key))
+        self._dirty = set()
+        self._removed = {}
+
+    def _place_unplaced(self):
+        """Find the archived months holding deleted events that are not loaded"""
+        if not self._unplaced:
+            return
+        index = self.archive_index()
+        for key in self.archived_months():
+            # IDs above the largest one archived in a month cannot be in it
+            candidates = {i for i in self._unplaced if i <= index[key]["max_id"]}
+            if not candidates:
+                continue
+            found = candidates.intersection(e.id for e in self._read_archive(key))
+            if found:
+                self._removed.setdefault(key, set()).update(found)
+                self._dirty.add(key)
+        self._unplaced = set()
+
+    def rollover(self):
+        """Move active partitions of months that are over into the archive"""
+        current = current_key()
+        for key in self._active_keys():
+            if not is_past(key, current):
+                continue
+            path = self._path(key)
+            with track_io("events.load_partition", path, "read"):
+                events = _read_events(path)
+            self._archive(key, events)
+            os.remove(path)
+
+    def _archive(self, key, events, removed=()):
+        """Merge events into the archived partition of a month, dropping removed"""
+        os.makedirs(self.archive_dir, exist_ok=True)
+        path = self._archive_path(key)
+        merged = {e.id: e for e in self._read_archive(key)}
+        for event_id in removed:
+            merged.pop(event_id, None)
+        merged.update((e.id, e) for e in events)
+
+        index = self.archive_index()
+        if merged:
+            with track_io("events.archive_partition", path, "write"):
+                _write_events(path, list(merged.values()))
+            index[key] = {"events": len(merged), "max_id": max(merged)}
+        else:
+            if os.path.exists(path):
+                os.remove(path)
+            index.pop(key, None)
+        _write_json(os.path.join(self.archive_dir, "index.json"), index)
+
+    def _read_archive(self, key):
+        path = self._archive_path(key)
+        if not os.path.exists(path):
+            return []
+        with track_io("events.load_archive", path, "read"):
+            return _read_events(path)
+
+    def archive_index(self):
+        """Return {month: {"events": count, "max_id": ID}} of the archive"""
+        if self._index is None:
+            path = os.path.join(self.archive_dir, "index.json")
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    self._index = json.load(f)
+            except FileNotFoundError:
+                self._index = {}
+        return self._index
+
+    def archived_months(self):
+        """Return the archived YYYY-MM keys in order"""
+        return sorted(self.archive_index())
+
+    def max_archived_id(self):
+        """Return the largest event ID in the archive, 0 if empty"""
+        return max((m["max_id"] for m in self.archive_index().values()), default=0)
+
+    def iter_archived(self, months=None):
+        """Yield archived events month by month, reading one file at a time"""
+        for key in self.archived_months() if months is None else months:
+            yield from self._read_archive(key)
+
+
+def _read_events(path):
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8") as f:
+        return [Event.from_dict(e) for e in json.load(f)]
+
+
+def _write_events(path, events):
+    opener = gzip.open if path.endswith(".gz") else open
+    temp_path = path + ".tmp"
+    with opener(temp_path, "wt", encoding="utf-8") as f:
+        json.dump([e.to_dict() for e in events], f, ensure_ascii=False)
+    os.replace(temp_path, path)
+
+
+def _write_json(path, data):
+    temp_path = path + ".tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+    os.replace(temp_path, path)
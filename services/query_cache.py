@@ -0,0 +1,66 @@
+"""
+Query Cache - LRU cache of query results invalidated by field generations
+"""
+
+from collections import OrderedDict
+
+# Generation bumped when events are added, removed or reloaded
+MEMBERSHIP = "events"
+
+_MISS = object()
+
+
+class QueryCache:
+    """
+    Bounded LRU cache for results that depend on a few event fields.
+
+    Every field has a generation counter that mutations bump. A result is
+    stored with the generations of the fields it was computed from and is
+    served only while all of them are unchanged, so an edit only evicts
+    the queries that could see it.
+    """
+
+    MISS = _MISS
+
+    def __init__(self, max_entries=256):
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+
+        self.max_entries = max_entries
+        self.generations = {}  # Field -> generation
+        self._entries = OrderedDict()  # Key -> (generations, result)
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _stamp(self, fields):
+        return tuple(self.generations.get(field, 0) for field in fields)
+
+    def bump(self, *fields):
+        """Invalidate results that depend on any of the fields"""
+        for field in fields:
+            self.generations[field] = self.generations.get(field, 0) + 1
+
+    def get(self, key, fields):
+        """Return a cached result, or QueryCache.MISS"""
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == self._stamp(fields):
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        return _MISS
+
+    def put(self, key, fields, result):
+        """Store a result computed from the current generations of fields"""
+        self._entries[key] = (self._stamp(fields), result)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return result
+
+    def clear(self):
+        """Drop every cached result"""
+        self._entries.clear()
@@ -0,0 +1,227 @@
+"""
+Registration Batcher - Coalesces bursts of registration requests into batches
+"""
+
+import threading
+
+
+class RegistrationRequest:
+    """A queued registration or unregistration waiting for its batch"""
+
+    def __init__(self, action, event_id, username):
+        self.action = action  # "register" or "unregister"
+        self.event_id = event_id
+        self.username = username
+        self.outcome = None
+        self._done = threading.Event()
+
+    def done(self):
+        """Check if the request has been applied"""
+        return self._done.is_set()
+
+    def wait(self, timeout=None):
+        """Block until the request has been applied and return its outcome"""
+        self._done.wait(timeout)
+        return self.outcome
+
+
+class RegistrationBatcher:
+    """
+    Collects registration requests and applies them in batches.
+
+    Requests are applied in arrival order against event capacity and the
+    data files are written once per batch instead of once per request.
+    A batch is flushed when it reaches max_batch requests or when the
+    window (in seconds) expires. With window=None the caller flushes.
+    """
+
+    ACTIONS = ("register", "unregister")
+
+    def __init__(self, event_service, user_service=None, max_batch=100, window=0.05):
+        if max_batch <= 0:
+            raise ValueError("Batch size must be positive")
+
+        self.event_service = event_service
+        self.user_service = user_service
+        self.max_batch = max_batch
+        self.window = window
+        self._pending = []
+        self._timer = None
+        self._lock = threading.Lock()
+        self._apply_lock = threading.Lock()
+
+    def register(self, event_id, username):
+        """Queue a registration request"""
+        return self.submit("register", event_id, username)
+
+    def unregister(self, event_id, username):
+        """Queue an unregistration request"""
+        return self.submit("unregister", event_id, username)
+
+    def submit(self, action, event_id, username):
+        """Queue a request and flush if the batch is full"""
+        if action not in self.ACTIONS:
+            raise ValueError(f"Unknown action: {action}")
+
+        request = RegistrationRequest(action, event_id, username)
+        with self._lock:
+            self._pending.append(request)
+            batch_full = len(self._pending) >= self.max_batch
+            if not batch_full and self.window is not None and self._timer is None:
+                self._timer = threading.Timer(self.window, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+        if batch_full:
+            self.flush()
+        return request
+
+    def pending_count(self):
+        """Return number of requests waiting for the next batch"""
+        with self._lock:
+            return len(self._pending)
+
+    def flush(self):
+        """Apply all pending requests as one batch and return their outcomes"""
+        with self._lock:
+            batch = self._pending
+            self._pending = []
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+        if not batch:
+            return []
+        return self.process(batch)
+
+    def process(self, requests):
+        """
+        Apply requests in order, persist once and return per-request outcomes.
+
+        If saving fails the registrations of the batch are undone in memory,
+        every request is reported as failed and the error is raised; waiting
+        callers are released either way.
+        """
+        try:
+            with self._apply_lock:
+                events_changed = False
+                users_changed = False
+                # State before the batch, restored if saving fails
+                undo = {"events": {}, "users": {}}
+                promotions = []  # (event, promoted usernames), announced on save
+
+                for request in requests:
+                    try:
+                        users_touched = self._apply(request, undo, promotions)
+                        events_changed = True
+                        users_changed = users_changed or users_touched
+                        request.outcome = self._outcome(request, True)
+                    except ValueError as e:
+                        request.outcome = self._outcome(request, False, str(e))
+
+                # One write per batch instead of one per request
+                events_saved = False
+                try:
+                    if events_changed:
+                        self.event_service.save_events()
+                        events_saved = True
+                    if users_changed:
+                        self.user_service.save_users()
+                except Exception as e:
+                    self._undo(undo, events_saved)
+                    for request in requests:
+                        request.outcome = self._outcome(
+                            request, False, f"Could not save registrations: {e}"
+                        )
+                    raise
+
+                for event, promoted in promotions:
+                    self.event_service.notify_promotions(event, promoted, record=False)
+        finally:
+            for request in requests:
+                request._done.set()
+        return [request.outcome for request in requests]
+
+    def _apply(self, request, undo, promotions):
+        """Apply a single request in memory, return True if a user was changed"""
+        event = self.event_service.get_event_by_id(request.event_id)
+        if not event:
+            raise ValueError("Event not found")
+
+        user = None
+        if self.user_service is not None:
+            user = self.user_service.get_user(request.username)
+            if not user:
+                raise ValueError("User not found")
+
+        if event.id not in undo["events"]:
+            undo["events"][event.id] = (
+                event, event.attendees.copy(), event.waitlist[:]
+            )
+        if request.action == "register":
+            event.add_attendee(request.username)
+            self.event_service.touch_event(event, "attendees")
+            if user and request.event_id not in user.registered_events:
+                self._remember(user, undo)
+                user.registered_events.append(request.event_id)
+                self.user_service.touch_user(user, "registered_events")
+                return True
+        else:
+            promoted = event.remove_attendee(request.username)
+            self.event_service.touch_event(event, "attendees", "waitlist")
+            # Saved with the batch instead of by the event service
+            users_changed = self._register_promoted(event, promoted, undo)
+            promotions.append((event, promoted))
+            if user and request.event_id in user.registered_events:
+                self._remember(user, undo)
+                user.registered_events.remove(request.event_id)
+                self.user_service.touch_user(user, "registered_events")
+                return True
+            return users_changed
+        return False
+
+    def _register_promoted(self, event, promoted, undo):
+        """Record waitlist promotions on the promoted users"""
+        if self.user_service is None:
+            return False
+
+        changed = False
+        for username in promoted:
+            promoted_user = self.user_service.get_user(username)
+            if promoted_user and event.id not in promoted_user.registered_events:
+                self._remember(promoted_user, undo)
+                promoted_user.registered_events.append(event.id)
+                self.user_service.touch_user(promoted_user, "registered_events")
+                changed = True
+        return changed
+
+    @staticmethod
+    def _remember(user, undo):
+        if user.username not in undo["users"]:
+            undo["users"][user.username] = (user, user.registered_events[:])
+
+    def _undo(self, undo, events_saved):
+        """Restore the registrations a failed batch changed in memory"""
+        for event, attendees, waitlist in undo["events"].values():
+            event.attendees = attendees
+            event.waitlist = waitlist
+            self.event_service.touch_event(event, "attendees", "waitlist")
+        for user, registered_events in undo["users"].values():
+            user.registered_events = registered_events
+            self.user_service.touch_user(user, "registered_events")
+        if events_saved:
+            # Only the users save failed; take the events file back as well
+            try:
+                self.event_service.save_events()
+            except Exception as e:
+                print(f"Error restoring events after a failed save: {e}")
+
+    @staticmethod
+    def _outcome(request, success, error=None):
+        return {
+            "action": request.action,
+            "event_id": request.event_id,
+            "username": request.username,
+            "success": success,
+            "error": error,
+        }
@@ -0,0 +1,429 @@
+"""
+Shared Catalog - Read-only event catalog mapped by many worker processes
+
+One writer process publishes the catalog as a snapshot file per
+generation; any number of reader processes map the newest one and query
+its columns in place. The mapped pages come from the OS page cache and are
+shared by all readers, so adding workers does not add catalog copies.
+
+    data/events.shared/generation                 magic + current generation
+    data/events.shared/catalog-00000042.snap      snapshot of generation 42
+
+Besides the regular snapshot sections a published file has "date_ordinal"
+(day ordinal per row, 0 if invalid) and "id_order" (rows sorted by event
+ID, for lookups by binary search).
+
+Readers check the generation counter, itself a mapped 16-byte file, before
+every query and remap when it moved. The writer keeps the last few
+generations on disk so that readers switching over can still open them,
+and serializes publishes through data/events.shared/publish.lock.
+"""
+
+import mmap
+import os
+import re
+import struct
+import threading
+import time
+from array import array
+
+from models.dates import date_ordinal, today_ordinal
+from models.event import Event
+from models.symbols import NameList
+from services.id_sequence import LockFile
+from services.snapshot import (
+    SnapshotReader,
+    StringTable,
+    encode_events,
+    heavy_fields,
+    write_snapshot,
+)
+
+CONTROL_MAGIC = b"CEMGEN01"
+CONTROL = struct.Struct("<8sQ")
+CONTROL_FILE = "generation"
+CATALOG_FILE = re.compile(r"^catalog-(\d+)\.snap$")
+
+
+def _catalog_path(directory, generation):
+    return os.path.join(directory, f"catalog-{generation:08d}.snap")
+
+
+class _Control:
+    """Mapped generation counter shared by the writer and its readers"""
+
+    def __init__(self, path, writable=False):
+        self.path = path
+        if writable and not os.path.exists(path):
+            temp_path = path + ".tmp"
+            with open(temp_path, "wb") as f:
+                f.write(CONTROL.pack(CONTROL_MAGIC, 0))
+            os.replace(temp_path, path)
+
+        with open(path, "r+b" if writable else "rb") as f:
+            access = mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ
+            self.map = mmap.mmap(f.fileno(), CONTROL.size, access=access)
+        if self.map[:8] != CONTROL_MAGIC:
+            self.map.close()
+            raise ValueError(f"Not a shared catalog control file: {path}")
+
+    def read(self):
+        """Return the current generation"""
+        return CONTROL.unpack_from(self.map, 0)[1]
+
+    def write(self, generation):
+        """Announce a new generation to the readers"""
+        CONTROL.pack_into(self.map, 0, CONTROL_MAGIC, generation)
+
+    def close(self):
+        self.map.close()
+
+
+class SharedCatalogWriter:
+    """
+    Publishes catalog generations for reader processes.
+
+    Each publish holds the directory's lock file while it picks the next
+    generation number, so writers in different processes never reuse one;
+    the newest publish wins. keep is the number of generations left on
+    disk for readers that are still switching over.
+
+    publish_later() encodes on a background thread, at most once per
+    interval seconds and only the newest catalog handed in meanwhile.
+    """
+
+    def __init__(self, directory, keep=3, interval=1.0):
+        if keep <= 0:
+            raise ValueError("keep must be positive")
+
+        self.directory = directory
+        self.keep = keep
+        self.interval = interval
+        os.makedirs(directory, exist_ok=True)
+        self._lock_file = LockFile(os.path.join(directory, "publish.lock"))
+        self._control = _Control(os.path.join(directory, CONTROL_FILE), True)
+        self.generation = self._control.read()
+        self._last_publish = None  # time.monotonic() of the last publish
+        self._pending = None  # Events waiting for the background publish
+        self._thread = None
+        self._condition = threading.Condition()
+
+    def publish(self, events, heavy=heavy_fields):
+        """Write events as the next generation and return its number"""
+        sections = encode_events(events, heavy)
+        ids = sections["id"]
+        sections["date_ordinal"] = array("i", (e.date_ordinal for e in events))
+        sections["id_order"] = array("q", sorted(range(len(ids)), key=ids.__getitem__))
+        with self._lock_file:
+            generation = self._control.read() + 1
+            # The file is complete before the counter points readers at it
+            write_snapshot(_catalog_path(self.directory, generation), sections)
+            self._control.write(generation)
+            self.generation = generation
+            self._remove_old()
+        self._last_publish = time.monotonic()
+        return generation
+
+    def publish_later(self, events):
+        """
+        Publish events from a background thread.
+
+        events must not change afterwards (e.g. a CatalogVersion). The
+        thread exits once nothing is pending, so a pending publish is
+        finished before the interpreter exits.
+        """
+        with self._condition:
+            self._pending = events
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="shared-catalog-publisher"
+                )
+                self._thread.start()
+            self._condition.notify_all()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                if self._pending is None:
+                    self._thread = None
+                    self._condition.notify_all()
+                    return
+                if self._last_publish is not None:
+                    delay = self._last_publish + self.interval - time.monotonic()
+                    if delay > 0:
+                        # Newer catalogs handed in meanwhile replace this one
+                        self._condition.wait(delay)
+                        continue
+                events, self._pending = self._pending, None
+            try:
+                self.publish(events)
+            except Exception as e:
+                print(f"Error publishing shared catalog: {e}")
+                self._last_publish = time.monotonic()
+
+    def flush(self, timeout=None):
+        """Wait until background publishing is done; False on timeout"""
+        with self._condition:
+            return self._condition.wait_for(lambda: self._thread is None, timeout)
+
+    def _remove_old(self):
+        """Delete generations older than the last keep"""
+        for name in os.listdir(self.directory):
+            match = CATALOG_FILE.match(name)
+            if match and int(match.group(1)) <= self.generation - self.keep:
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                except OSError:
+                    pass  # Still mapped by a reader (Windows); retried next time
+
+    def close(self):
+        """Finish background publishing and release the mapped control file"""
+        self.flush()
+        self._control.close()
+
+
+class MappedCatalog:
+    """
+    One published generation, queried straight from the mapped file.
+
+    Events are built on demand for the rows a query returns; they are
+    private copies and may be changed freely without affecting the catalog.
+    """
+
+    def __init__(self, path, generation):
+        self.path = path
+        self.generation = generation
+        self.reader = SnapshotReader(path)
+        raw = self.reader.raw
+        self.strings = StringTable(raw("string_offsets"), raw("strings"))
+        self._ids = raw("id")
+        self._names = raw("name")
+        self._dates = raw("date")
+        self._capacities = raw("capacity")
+        self._locations = raw("location")
+        self._descriptions = raw("description")
+        self._organizers = raw("organizer")
+        self._attendee_start = raw("attendee_start")
+        self._attendees = raw("attendees")
+        self._waitlist_start = raw("waitlist_start")
+        self._waitlist_priority = raw("waitlist_prio")
+        self._waitlist_joined = raw("waitlist_joined")
+        self._waitlist_user = raw("waitlist_user")
+        self._ordinals = raw("date_ordinal")
+        self._id_order = raw("id_order")
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __iter__(self):
+        for row in range(len(self._ids)):
+            yield self.event(row)
+
+    def event(self, row):
+        """Build the Event stored in a row"""
+        text = self.strings.get
+        event = Event(
+            self._ids[row],
+            text(self._names[row]),
+            text(self._dates[row]),
+            self._capacities[row],
+            text(self._locations[row]),
+            text(self._descriptions[row]),
+            text(self._organizers[row]),
+        )
+        start, end = self._attendee_start[row], self._attendee_start[row + 1]
+        event.attendees = NameList(map(text, self._attendees[start:end]))
+        start, end = self._waitlist_start[row], self._waitlist_start[row + 1]
+        event.waitlist = [
+            [self._waitlist_priority[i], self._waitlist_joined[i], text(user)]
+            for i, user in zip(range(start, end), self._waitlist_user[start:end])
+        ]
+        return event
+
+    def find_row(self, event_id):
+        """Return the row of an event ID, None if absent"""
+        ids, order = self._ids, self._id_order
+        low, high = 0, len(order)
+        while low < high:
+            middle = (low + high) // 2
+            if ids[order[middle]] < event_id:
+                low = middle + 1
+            else:
+                high = middle
+        if low < len(order) and ids[order[low]] == event_id:
+            return order[low]
+        return None
+
+    def get_event_by_id(self, event_id):
+        """Get event by ID"""
+        row = self.find_row(event_id)
+        return None if row is None else self.event(row)
+
+    def attendee_count(self, row):
+        """Return the number of attendees of a row"""
+        return self._attendee_start[row + 1] - self._attendee_start[row]
+
+    def has_attendee(self, event_id, username):
+        """Check if a user is registered for an event"""
+        row = self.find_row(event_id)
+        if row is None:
+            return False
+        start, end = self._attendee_start[row], self._attendee_start[row + 1]
+        text = self.strings.get
+        return any(text(sid) == username for sid in self._attendees[start:end])
+
+    def _events(self, rows):
+        return [self.event(row) for row in rows]
+
+    def _date_order(self, rows):
+        ordinals, ids = self._ordinals, self._ids
+        return sorted(rows, key=lambda row: (ordinals[row], ids[row]))
+
+    def get_available_events(self, start_date=None, limit=None):
+        """Get events with free seats in date order, optionally from start_date"""
+        capacities, starts = self._capacities, self._attendee_start
+        rows = [
+            row
+            for row in range(len(self._ids))
+            if starts[row + 1] - starts[row] < capacities[row]
+        ]
+        if start_date:
+            first = date_ordinal(start_date)
+            rows = [row for row in rows if self._ordinals[row] >= first]
+        rows = self._date_order(rows)
+        return self._events(rows if limit is None else rows[:limit])
+
+    def get_upcoming_events(self, today=None):
+        """Get events after today in date order"""
+        today = today or today_ordinal()
+        ordinals = self._ordinals
+        rows = [row for row in range(len(self._ids)) if ordinals[row] > today]
+        return self._events(self._date_order(rows))
+
+    def get_past_events(self, today=None):
+        """Get events before today in date order"""
+        today = today or today_ordinal()
+        ordinals = self._ordinals
+        rows = [row for row in range(len(self._ids)) if 0 < ordinals[row] < today]
+        return self._events(self._date_order(rows))
+
+    def search_events(self, keyword):
+        """Get events whose name, description or location contain keyword"""
+        keyword = keyword.lower()
+        text = self.strings.get
+        rows = []
+        for row in range(len(self._ids)):
+            for column in (self._names, self._descriptions, self._locations):
+                value = text(column[row])
+                if value and keyword in value.lower():
+                    rows.append(row)
+                    break
+        return self._events(rows)
+
+    def get_events_by_organizer(self, organizer):
+        """Get all events organized by a specific organizer"""
+        text = self.strings.get
+        matches = {}  # String index -> equal to organizer
+        rows = []
+        for row, sid in enumerate(self._organizers):
+            match = matches.get(sid)
+            if match is None:
+                match = matches[sid] = text(sid) == organizer
+            if match:
+                rows.append(row)
+        return self._events(rows)
+
+    def close(self):
+        """Release the mapped file; the catalog must not be used afterwards"""
+        if self.reader is None:
+            return
+        for name, value in list(vars(self).items()):
+            if isinstance(value, memoryview):
+                value.release()
+        self.strings.offsets.release()
+        self.strings.blob.release()
+        self.reader.close()
+        self.reader = None
+
+
+class SharedCatalog:
+    """
+    Reader side: the newest published generation of a shared catalog.
+
+    Every query first compares the mapped generation counter with the
+    mapped generation and switches to a newer one if there is one. A
+    sequence of queries that must agree should use view() instead.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self._control = _Control(os.path.join(directory, CONTROL_FILE))
+        self.generation = 0
+        self._catalog = None
+        self.refresh()
+
+    def refresh(self):
+        """Map the newest generation if it changed; return True if it did"""
+        generation = self._control.read()
+        while generation != self.generation:
+            if generation == 0:
+                raise ValueError(f"Nothing published in {self.directory} yet")
+            try:
+                catalog = MappedCatalog(
+                    _catalog_path(self.directory, generation), generation
+                )
+            except FileNotFoundError:
+                # Replaced by an even newer generation while we switched
+                generation = self._control.read()
+                continue
+            # Queries still holding the old generation keep it mapped
+            self._catalog = catalog
+            self.generation = generation
+            return True
+        return False
+
+    def view(self):
+        """Return the newest generation as a consistent MappedCatalog"""
+        self.refresh()
+        return self._catalog
+
+    def __len__(self):
+        return len(self.view())
+
+    def __iter__(self):
+        return iter(self.view())
+
+    def get_event_by_id(self, event_id):
+        """Get event by ID"""
+        return self.view().get_event_by_id(event_id)
+
+    def has_attendee(self, event_id, username):
+        """Check if a user is registered for an event"""
+        return self.view().has_attendee(event_id, username)
+
+    def get_available_events(self, start_date=None, limit=None):
+        """Get events with free seats in date order, optionally from start_date"""
+        return self.view().get_available_events(start_date, limit)
+
+    def get_upcoming_events(self):
+        """Get events after today in date order"""
+        return self.view().get_upcoming_events()
+
+    def get_past_events(self):
+        """Get events before today in date order"""
+        return self.view().get_past_events()
+
+    def search_events(self, keyword):
+        """Get events whose name, description or location contain keyword"""
+        return self.view().search_events(keyword)
+
+    def get_events_by_organizer(self, organizer):
+        """Get all events organized by a specific organizer"""
+        return self.view().get_events_by_organizer(organizer)
+
+    def close(self):
+        """Release the mapped control file and generation"""
+        if self._catalog is not None:
+            self._catalog.close()
+            self._catalog = None
+        self._control.close()
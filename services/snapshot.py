@@ -0,0 +1,427 @@
+"""
+Snapshot - Compact binary format for fast loading of events and users
+
+A snapshot is a directory of typed column sections followed by the data:
+
+    header     magic, section count
+    directory  per section: name, array typecode, offset, byte length
+    sections   struct-packed arrays (8-byte aligned)
+
+Strings live in one shared table: a "strings" section with the UTF-8 text
+of all distinct strings and a "string_offsets" section with byte offsets.
+Single strings can be decoded straight from the mapped file, and ASCII
+tables are decoded with a single call. Other columns refer to strings by
+index (-1 for None). Files are read through mmap.
+"""
+
+import gc
+import mmap
+import os
+import struct
+import sys
+from array import array
+from contextlib import contextmanager
+
+from models.event import Event
+from models.symbols import NameList, USERNAMES
+from models.user import User
+
+MAGIC = b"CEMSNAP1"
+HEADER = struct.Struct("<8sI")
+SECTION = struct.Struct("<16scQQ")
+NAME_SIZE = 16  # Bytes of a section name in the directory
+ALIGNMENT = 8
+
+
+@contextmanager
+def paused_gc():
+    """Skip cyclic GC passes while bulk-allocating acyclic objects"""
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def is_newer(path, other):
+    """Check if path exists and is at least as recent as other (or other is missing)"""
+    if not os.path.exists(path):
+        return False
+    if not os.path.exists(other):
+        return True
+    return os.path.getmtime(path) >= os.path.getmtime(other)
+
+
+class StringTableBuilder:
+    """Collects distinct strings and hands out their indexes"""
+
+    def __init__(self):
+        self.strings = []
+        self.index = {}
+
+    def add(self, value):
+        """Return the index of a string, -1 for None"""
+        if value is None:
+            return -1
+        sid = self.index.get(value)
+        if sid is None:
+            sid = len(self.strings)
+            self.strings.append(value)
+            self.index[value] = sid
+        return sid
+
+    def sections(self):
+        """Return the string table as snapshot sections"""
+        offsets = array("Q", [0])
+        position = 0
+        encoded = []
+        for value in self.strings:
+            data = value.encode("utf-8")
+            position += len(data)
+            offsets.append(position)
+            encoded.append(data)
+        return {"string_offsets": offsets, "strings": b"".join(encoded)}
+
+
+class StringTable:
+    """Strings of a snapshot, decoded from the UTF-8 blob on demand"""
+
+    def __init__(self, offsets, blob):
+        self.offsets = offsets
+        self.blob = blob  # bytes or a memoryview of the mapped file
+
+    def get(self, sid):
+        """Return the string at an index, None for -1"""
+        if sid < 0:
+            return None
+        return str(self.blob[self.offsets[sid] : self.offsets[sid + 1]], "utf-8")
+
+    def all(self):
+        """Return every string as a list"""
+        return self.get_many(range(len(self.offsets) - 1))
+
+    def get_many(self, sids):
+        """Return the strings at several indexes (None for -1)"""
+        offsets = self.offsets
+        text = str(self.blob, "utf-8")
+        if len(text) != len(self.blob):
+            return [self.get(sid) for sid in sids]
+        # ASCII only: byte offsets are character offsets, slice one decode
+        return [
+            text[offsets[sid] : offsets[sid + 1]] if sid >= 0 else None
+            for sid in sids
+        ]
+
+
+def write_snapshot(path, sections):
+    """Write {name: array or bytes} sections to path atomically"""
+    directory = []
+    offset = HEADER.size + SECTION.size * len(sections)
+    for name, data in sections.items():
+        if len(name.encode("ascii")) > NAME_SIZE:
+            raise ValueError(f"Section name longer than {NAME_SIZE} bytes: {name}")
+        offset += -offset % ALIGNMENT
+        typecode = data.typecode if isinstance(data, array) else "B"
+        size = len(data) * data.itemsize if isinstance(data, array) else len(data)
+        directory.append((name, typecode, offset, size, data))
+        offset += size
+
+    folder = os.path.dirname(path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, len(directory)))
+        for name, typecode, offset, size, data in directory:
+            f.write(
+                SECTION.pack(
+                    name.encode("ascii"), typecode.encode("ascii"), offset, size
+                )
+            )
+        for name, typecode, offset, size, data in directory:
+            f.write(b"\0" * (offset - f.tell()))
+            if isinstance(data, array) and sys.byteorder != "little":
+                data = array(data.typecode, data)
+                data.byteswap()
+            f.write(data.tobytes() if isinstance(data, array) else data)
+    os.replace(temp_path, path)
+
+
+class SnapshotReader:
+    """Memory-mapped view of a snapshot file"""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.view = memoryview(self.map)
+
+        if len(self.map) < HEADER.size or self.map[:8] != MAGIC:
+            self.close()
+            raise ValueError(f"Not a snapshot file: {path}")
+        count = HEADER.unpack_from(self.map, 0)[1]
+
+        self.sections = {}
+        for i in range(count):
+            name, typecode, offset, size = SECTION.unpack_from(
+                self.map, HEADER.size + i * SECTION.size
+            )
+            self.sections[name.rstrip(b"\0").decode("ascii")] = (
+                typecode.decode("ascii"),
+                offset,
+                size,
+            )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Release the memory map"""
+        if self.view is not None:
+            self.view.release()
+            self.view = None
+        if self.map is not None:
+            self.map.close()
+            self.map = None
+
+    def has(self, name):
+        """Check if the snapshot contains a section"""
+        return name in self.sections
+
+    def raw(self, name):
+        """Return a zero-copy memoryview of a section"""
+        typecode, offset, size = self.sections[name]
+        section = self.view[offset : offset + size]
+        return section if typecode == "B" else section.cast(typecode)
+
+    def column(self, name):
+        """Return a section copied into an array"""
+        typecode, offset, size = self.sections[name]
+        data = array(typecode)
+        data.frombytes(self.view[offset : offset + size])
+        if sys.byteorder != "little":
+            data.byteswap()
+        return data
+
+    def string_table(self, mapped=False):
+        """
+        Return the shared string table.
+
+        With mapped=True strings are decoded from the mapped file on access
+        and the table must not be used after the reader is closed.
+        """
+        blob = self.raw("strings") if mapped else bytes(self.raw("strings"))
+        return StringTable(self.column("string_offsets"), blob)
+
+
+def _ranges(starts):
+    """Yield (start, end) pairs from a prefix offset column"""
+    return zip(starts, starts[1:])
+
+
+def heavy_fields(event):
+    """Return (description, attendee symbol ids, waitlist) of an event"""
+    return event.description, event.attendees.ids, event.waitlist
+
+
+def save_events_snapshot(path, events):
+    """Write events to a snapshot file"""
+    write_snapshot(path, encode_events(events))
+
+
+def encode_events(events, heavy=heavy_fields):
+    """
+    Encode events into snapshot sections.
+
+    heavy returns the description, attendee symbol ids and waitlist of an
+    event, so callers holding partially loaded events can supply them
+    without building full objects.
+    """
+    strings = StringTableBuilder()
+    columns = {
+        name: array(typecode)
+        for name, typecode in (
+            ("id", "q"),
+            ("name", "i"),
+            ("date", "i"),
+            ("capacity", "q"),
+            ("location", "i"),
+            ("description", "i"),
+            ("organizer", "i"),
+            ("attendee_start", "Q"),
+            ("attendees", "i"),
+            ("waitlist_start", "Q"),
+            ("waitlist_prio", "q"),
+            ("waitlist_joined", "d"),
+            ("waitlist_user", "i"),
+        )
+    }
+    columns["attendee_start"].append(0)
+    columns["waitlist_start"].append(0)
+
+    user_sids = {}  # USERNAMES id -> string table index
+    for event in events:
+        description, attendee_ids, waitlist = heavy(event)
+        columns["id"].append(event.id)
+        columns["name"].append(strings.add(event.name))
+        columns["date"].append(strings.add(event.date))
+        columns["capacity"].append(event.capacity)
+        columns["location"].append(strings.add(event.location))
+        columns["description"].append(strings.add(description))
+        columns["organizer"].append(strings.add(event.organizer))
+
+        for symbol in attendee_ids:
+            sid = user_sids.get(symbol)
+            if sid is None:
+                sid = user_sids[symbol] = strings.add(USERNAMES.name(symbol))
+            columns["attendees"].append(sid)
+        columns["attendee_start"].append(len(columns["attendees"]))
+
+        for priority, joined_at, username in waitlist:
+            columns["waitlist_prio"].append(priority)
+            columns["waitlist_joined"].append(joined_at)
+            columns["waitlist_user"].append(strings.add(username))
+        columns["waitlist_start"].append(len(columns["waitlist_user"]))
+
+    columns.update(strings.sections())
+    return columns
+
+
+def _load_columns(path):
+    """Read all strings and columns of a snapshot into memory"""
+    with SnapshotReader(path) as reader:
+        strings = reader.string_table().all()
+        columns = {
+            name: reader.column(name).tolist()
+            for name in reader.sections
+            if name not in ("strings", "string_offsets")
+        }
+    # Index -1 marks None, so a trailing None resolves it without a branch
+    strings.append(None)
+    return strings, columns
+
+
+def load_events_snapshot(path):
+    """Read events from a snapshot file"""
+    with paused_gc():
+        return _load_events(path)
+
+
+def _load_events(path):
+    strings, columns = _load_columns(path)
+
+    # Map string indexes of attendees to shared username symbols once
+    symbols = {}
+    for sid in set(columns["attendees"]):
+        symbols[sid] = USERNAMES.intern(strings[sid])
+    attendee_ids = array("i", map(symbols.__getitem__, columns["attendees"]))
+
+    events = []
+    new_event = Event.__new__
+    from_ids = NameList.from_ids
+    for (
+        event_id,
+        name,
+        date,
+        capacity,
+        location,
+        description,
+        organizer,
+        (a_start, a_end),
+        (w_start, w_end),
+    ) in zip(
+        columns["id"],
+        map(strings.__getitem__, columns["name"]),
+        map(strings.__getitem__, columns["date"]),
+        columns["capacity"],
+        map(strings.__getitem__, columns["location"]),
+        map(strings.__getitem__, columns["description"]),
+        map(strings.__getitem__, columns["organizer"]),
+        _ranges(columns["attendee_start"]),
+        _ranges(columns["waitlist_start"]),
+    ):
+        # Bypass __init__: every field comes straight from the file and the
+        # string table already shares repeated values
+        event = new_event(Event)
+        event.id = event_id
+        event.name = name
+        event.date = date
+        event.capacity = capacity
+        event.location = location
+        event.description = description
+        event.organizer = organizer
+        event.attendees = from_ids(attendee_ids[a_start:a_end])
+        event.waitlist = (
+            [
+                [
+                    columns["waitlist_prio"][i],
+                    columns["waitlist_joined"][i],
+                    strings[columns["waitlist_user"][i]],
+                ]
+                for i in range(w_start, w_end)
+            ]
+            if w_end > w_start
+            else []
+        )
+        events.append(event)
+    return events
+
+
+def save_users_snapshot(path, users):
+    """Write users to a snapshot file"""
+    strings = StringTableBuilder()
+    columns = {
+        name: array(typecode)
+        for name, typecode in (
+            ("username", "i"),
+            ("password", "i"),
+            ("role", "i"),
+            ("email", "i"),
+            ("full_name", "i"),
+            ("registered_start", "Q"),
+            ("registered", "q"),
+        )
+    }
+    columns["registered_start"].append(0)
+
+    for user in users:
+        columns["username"].append(strings.add(user.username))
+        columns["password"].append(strings.add(user.password))
+        columns["role"].append(strings.add(user.role))
+        columns["email"].append(strings.add(user.email))
+        columns["full_name"].append(strings.add(user.full_name))
+        columns["registered"].extend(user.registered_events)
+        columns["registered_start"].append(len(columns["registered"]))
+
+    columns.update(strings.sections())
+    write_snapshot(path, columns)
+
+
+def load_users_snapshot(path):
+    """Read users from a snapshot file"""
+    with paused_gc():
+        return _load_users(path)
+
+
+def _load_users(path):
+    strings, columns = _load_columns(path)
+
+    users = []
+    registered = array("q", columns["registered"])
+    for username, password, role, email, full_name, (start, end) in zip(
+        map(strings.__getitem__, columns["username"]),
+        map(strings.__getitem__, columns["password"]),
+        map(strings.__getitem__, columns["role"]),
+        map(strings.__getitem__, columns["email"]),
+        map(strings.__getitem__, columns["full_name"]),
+        _ranges(columns["registered_start"]),
+    ):
+        user = User(username, password, role, email, full_name)
+        user.registered_events = registered[start:end]
+        users.append(user)
+    return users
@@ -5,32 +5,127 @@ User Service - Handles all user-related business logic
 import json
 import os
 from models.user import User
+from services.change_feed import ChangeFeed
+from services.instrumentation import track_io
+from services.snapshot import is_newer, load_users_snapshot, save_users_snapshot
+
+
+# Fields that touch_user() can report as changed
+USER_FIELDS = ("password", "role", "email", "full_name", "registered_events")
+
+
+def _change_data(user, fields):
+    """Changed field values for the change feed (passwords are left out)"""
+    data = {}
+    for field in fields:
+        if field == "registered_events":
+            data[field] = list(user.registered_events)
+        elif field != "password":
+            data[field] = getattr(user, field)
+    return data
 
 
 class UserService:
-    def __init__(self, data_file="users.json"):
+    STORAGE_FORMATS = ("json", "snapshot")
+    ROLES = ("Admin", "Organizer", "Student", "Visitor")
+
+    def __init__(self, data_file="users.json", storage="json"):
+        if storage not in self.STORAGE_FORMATS:
+            raise ValueError(f"Unknown storage format: {storage}")
+
         self.data_file = data_file
+        # Binary snapshot next to the JSON file, used when storage="snapshot"
+        self.snapshot_file = os.path.splitext(data_file)[0] + ".snap"
+        self.storage = storage
         self.users = []
+        self._by_username = {}  # Username -> User, rebuilt on every load
+        # Versioned log of user changes for delta sync
+        self.changes = ChangeFeed(os.path.splitext(data_file)[0] + ".changes.jsonl")
         self.load_users()
 
     def load_users(self):
-        """Load users from JSON file"""
-        if os.path.exists(self.data_file):
-            try:
-                with open(self.data_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    self.users = [User.from_dict(u) for u in data]
-            except Exception as e:
-                print(f"Error loading users: {e}")
+        """Load users from the snapshot or JSON file, whichever is newer"""
+        self.users = None
+        if is_newer(self.snapshot_file, self.data_file):
+            self.users = self._load_snapshot()
+            if self.storage == "json":
+                # Migrate back to JSON and drop the stale snapshot
+                self.export_json()
+                os.remove(self.snapshot_file)
+
+        if self.users is None:
+            if os.path.exists(self.data_file):
+                try:
+                    with track_io("users.load_json", self.data_file, "read"):
+                        with open(self.data_file, "r", encoding="utf-8") as f:
+                            data = json.load(f)
+                            self.users = [User.from_dict(u) for u in data]
+                    if self.storage == "snapshot":
+                        self._save_snapshot()
+                except Exception as e:
+                    print(f"Error loading users: {e}")
+                    self.users = []
+            else:
                 self.users = []
-        else:
-            self.users = []
+        self._by_username = {u.username: u for u in self.users}
+        # Changes that were never saved are gone with the reload
+        self.changes.rollback()
 
     def save_users(self):
-        """Save users to JSON file"""
-        with open(self.data_file, "w", encoding="utf-8") as f:
-            data = [u.to_dict() for u in self.users]
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        """Save users in the configured storage format"""
+        if self.storage == "snapshot":
+            self._save_snapshot()
+        else:
+            self.export_json()
+        # The changes are on disk now, so clients may see them
+        self.changes.commit()
+
+    def _load_snapshot(self):
+        """
+        Read the users snapshot.
+
+        The snapshot is newer than the JSON file, so a failure is raised
+        instead of falling back to (and later saving) the older JSON data.
+        """
+        try:
+            with track_io("users.load_snapshot", self.snapshot_file, "read"):
+                return load_users_snapshot(self.snapshot_file)
+        except Exception as e:
+            raise ValueError(
+                f"Users snapshot {self.snapshot_file} could not be loaded ({e}); "
+                f"repair or remove it to fall back to {self.data_file}"
+            ) from e
+
+    def _save_snapshot(self):
+        with track_io("users.save_snapshot", self.snapshot_file, "write"):
+            save_users_snapshot(self.snapshot_file, self.users)
+
+    def export_json(self, filename=None):
+        """Write users to a JSON file (the data file by default)"""
+        filename = filename or self.data_file
+        with track_io("users.save_json", filename, "write"):
+            with open(filename, "w", encoding="utf-8") as f:
+                data = [u.to_dict() for u in self.users]
+                json.dump(data, f, indent=2, ensure_ascii=False)
+        return filename
+
+    def touch_user(self, user, *fields):
+        """
+        Record a change to a user in the change feed (published on save).
+
+        fields names what changed (see USER_FIELDS); none means a new user.
+        """
+        data = _change_data(user, fields or USER_FIELDS)
+        self.changes.record("put", user.username, data)
+
+    @property
+    def version(self):
+        """Version of the latest saved user change"""
+        return self.changes.version
+
+    def changes_since(self, version):
+        """Return user changes after version, or None if a full reload is needed"""
+        return self.changes.changes_since(version)
 
     def authenticate(self, username, password, role):
         """Authenticate a user with role"""
@@ -52,34 +147,74 @@ class UserService:
 
     def get_user(self, username):
         """Get user by username"""
-        for user in self.users:
-            if user.username == username:
-                return user
-        return None
+        return self._by_username.get(username)
 
     def create_user(self, username, password, role, email=None, full_name=None):
         """Create a new user"""
-        if self.get_user(username):
-            raise ValueError("Username already exists")
+        self.validate_user(username, password, role)
 
         user = User(username, password, role, email, full_name)
         self.users.append(user)
+        self._by_username[username] = user
+        self.touch_user(user)
         self.save_users()
         return user
 
+    def validate_user(self, username, password, role):
+        """Check the fields of a new user"""
+        if not username or not password:
+            raise ValueError("Username and password are required")
+        if role not in self.ROLES:
+            raise ValueError(f"Role must be one of: {', '.join(self.ROLES)}")
+        if self.get_user(username):
+            raise ValueError("Username already exists")
+
+    def add_users(self, rows):
+        """
+        Create many users from validated field dicts with a single save.
+
+        Rows hold the create_user() arguments and must have passed
+        validate_user().
+        """
+        users = [
+            User(
+                row["username"],
+                row["password"],
+                row["role"],
+                row.get("email"),
+                row.get("full_name"),
+            )
+            for row in rows
+        ]
+        if not users:
+            return users
+
+        self.users.extend(users)
+        for user in users:
+            self._by_username[user.username] = user
+            self.touch_user(user)
+        self.save_users()
+        return users
+
     def update_user(self, username, password=None, email=None, full_name=None):
         """Update user information"""
         user = self.get_user(username)
         if not user:
             raise ValueError("User not found")
 
+        changed = []
         if password:
             user.password = password
+            changed.append("password")
         if email:
             user.email = email
+            changed.append("email")
         if full_name:
             user.full_name = full_name
+            changed.append("full_name")
 
+        if changed:
+            self.touch_user(user, *changed)
         self.save_users()
         return user
 
@@ -93,6 +228,7 @@ class UserService:
             raise ValueError("Already registered for this event")
 
         user.registered_events.append(event_id)
+        self.touch_user(user, "registered_events")
         self.save_users()
         return True
 
@@ -106,5 +242,32 @@ class UserService:
             raise ValueError("Not registered for this event")
 
         user.registered_events.remove(event_id)
+        self.touch_user(user, "registered_events")
         self.save_users()
         return True
+
+    def add_registrations(self, event_id, usernames):
+        """Record an event on many users with a single save"""
+        self.update_registrations(event_id, added=usernames)
+
+    def remove_registrations(self, event_id, usernames):
+        """Drop an event from many users with a single save"""
+        self.update_registrations(event_id, removed=usernames)
+
+    def update_registrations(self, event_id, added=(), removed=()):
+        """Drop an event from some users and record it on others in one save"""
+        changed = False
+        for username in removed:
+            user = self.get_user(username)
+            if user and event_id in user.registered_events:
+                user.registered_events.remove(event_id)
+                self.touch_user(user, "registered_events")
+                changed = True
+        for username in added:
+            user = self.get_user(username)
+            if user and event_id not in user.registered_events:
+                user.registered_events.append(event_id)
+                self.touch_user(user, "registered_events")
+                changed = True
+        if changed:
+            self.save_users()
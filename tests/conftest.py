@@ -0,0 +1,33 @@
+import json
+
+import pytest
+
+
+def write_json(path, data):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    return str(path)
+
+
+@pytest.fixture
+def events_file(tmp_path):
+    """events.json with five future events of capacity 2"""
+    return write_json(
+        tmp_path / "events.json",
+        [
+            {"id": i, "name": f"Event {i}", "date": "2030-01-0%d" % i, "capacity": 2}
+            for i in range(1, 6)
+        ],
+    )
+
+
+@pytest.fixture
+def users_file(tmp_path):
+    """users.json with four students and no registrations"""
+    return write_json(
+        tmp_path / "users.json",
+        [
+            {"username": name, "password": "pw", "role": "Student"}
+            for name in ("alice", "bob", "carol", "dave")
+        ],
+    )
@@ -0,0 +1,16 @@
+from services.event_service import EventService
+
+
+def test_unpadded_dates_are_ordered_by_day(events_file):
+    service = EventService(events_file)
+    short = service.create_event("Short", "2030-1-5", 3)
+    padded = service.create_event("Padded", "2030-01-10", 3)
+
+    open_ids = [e.id for e in service.get_available_events()]
+    upcoming_ids = [e.id for e in service.get_upcoming_events()]
+
+    assert open_ids.index(short.id) < open_ids.index(padded.id)
+    assert open_ids == upcoming_ids
+    assert [e.id for e in service.get_available_events("2030-01-06")] == [padded.id]
+    from_short = service.get_available_events("2030-1-5")
+    assert [e.id for e in from_short] == [5, short.id, padded.id]  # 5 is that day
@@ -0,0 +1,97 @@
+import csv
+import json
+
+from services import delta_export
+from services.bulk_import import import_events, import_users
+from services.event_service import EventService
+from services.user_service import UserService
+
+
+def write_lines(path, rows):
+    with open(path, "w", encoding="utf-8") as f:
+        for row in rows:
+            f.write((row if isinstance(row, str) else json.dumps(row)) + "\n")
+    return str(path)
+
+
+def test_import_events_from_csv(tmp_path, events_file):
+    path = tmp_path / "events.csv"
+    path.write_text(
+        "name,date,capacity,location\n"
+        "Talk,2030-03-01,10,Hall\n"
+        "No date,,10,Hall\n"
+        "Workshop,2030-03-02,5,\n",
+        encoding="utf-8",
+    )
+    service = EventService(events_file)
+
+    result = import_events(service, str(path))
+
+    assert [e.name for e in result.created] == ["Talk", "Workshop"]
+    assert result.errors == [(3, "Name and date are required")]
+    assert result.created[1].location is None
+    assert len(EventService(events_file).events) == 7
+
+
+def test_import_events_rejects_wrong_json_types(tmp_path, events_file):
+    path = write_lines(
+        tmp_path / "events.jsonl",
+        [
+            {"name": 123, "date": "2030-03-01", "capacity": 5},
+            {"name": "Talk", "date": "2030-03-01", "capacity": 5, "location": 7},
+            {"name": "Talk", "date": "2030-03-01", "capacity": 2.5},
+            {"name": "Talk", "date": "2030-03-01", "capacity": True},
+            {"name": "Talk", "date": "2030-03-01", "capacity": "5"},
+            {"name": "Valid", "date": "2030-03-01", "capacity": 5, "location": "Hall"},
+            "not json",
+        ],
+    )
+    service = EventService(events_file)
+
+    result = import_events(service, path)
+
+    assert [e.name for e in result.created] == ["Talk", "Valid"]
+    assert [line for line, _ in result.errors] == [1, 2, 3, 4, 7]
+    assert service.search_events("hall") == [result.created[1]]
+
+
+def test_strict_and_dry_run_import_nothing(tmp_path, users_file):
+    path = write_lines(
+        tmp_path / "users.jsonl",
+        [
+            {"username": "erin", "password": "pw", "role": "Student"},
+            {"username": "frank", "password": "pw", "role": "Teacher"},
+        ],
+    )
+    service = UserService(users_file)
+
+    assert import_users(service, path, strict=True).created == []
+    assert import_users(service, path, dry_run=True).created == []
+    assert service.get_user("erin") is None
+
+    result = import_users(service, path)
+    assert [u.username for u in result.created] == ["erin"]
+    assert UserService(users_file).get_user("erin") is not None
+
+
+def test_imported_events_reach_the_change_feed(tmp_path, events_file):
+    path = write_lines(
+        tmp_path / "events.jsonl",
+        [
+            {"name": "Talk", "date": "2030-03-01", "capacity": 5},
+            {"name": "Workshop", "date": "2030-03-02", "capacity": 5},
+        ],
+    )
+    service = EventService(events_file)
+    directory = str(tmp_path / "deltas")
+    delta_export.export(service, directory)
+    version = service.version
+
+    created = import_events(service, path).created
+
+    ids = [e.id for e in created]
+    assert [c["id"] for c in service.changes_since(version)] == ids
+    delta = delta_export.export(service, directory)
+    with open(delta, encoding="utf-8") as f:
+        rows = list(csv.reader(f))[1:]
+    assert [(int(row[0]), row[-1]) for row in rows] == [(i, "upsert") for i in ids]
@@ -0,0 +1,33 @@
+import pytest
+
+from services.event_service import EventService
+
+
+def test_published_versions_do_not_change(events_file):
+    service = EventService(events_file, versioned=True)
+    before = service.catalog_version()
+
+    service.register_attendee(1, "alice")
+    service.delete_event(2)
+    after = service.catalog_version()
+
+    assert before.get_event_by_id(1).attendee_count() == 0
+    assert before.get_event_by_id(2) is not None
+    assert after.get_event_by_id(1).attendee_count() == 1
+    assert after.get_event_by_id(2) is None
+    assert after.number > before.number
+    assert len(after) == 4
+
+
+def test_unversioned_service_returns_a_copy(events_file):
+    service = EventService(events_file)
+    version = service.catalog_version()
+    service.register_attendee(1, "alice")
+
+    assert version.get_event_by_id(1).attendee_count() == 0
+    assert len(version) == 5
+
+
+def test_versions_need_an_in_memory_catalog(events_file):
+    with pytest.raises(ValueError):
+        EventService(events_file, versioned=True, lazy=True)
@@ -0,0 +1,99 @@
+import pytest
+
+from services.change_feed import ChangeFeed
+from services.event_service import EventService
+
+
+def journal_versions(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return [int(line.split('"version": ')[1].split(",")[0]) for line in f]
+
+
+def test_failed_save_is_not_announced(events_file, monkeypatch):
+    service = EventService(events_file)
+    version = service.version
+
+    def fail(filename=None):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(service, "export_json", fail)
+    with pytest.raises(OSError):
+        service.register_attendee(1, "alice")
+
+    assert service.version == version
+    assert service.changes_since(version) == []
+
+    monkeypatch.undo()
+    service.register_attendee(2, "bob")
+
+    changes = service.changes_since(version)
+    assert [c["id"] for c in changes] == [1, 2]
+    assert service.version == changes[-1]["version"]
+
+
+def test_reload_drops_unsaved_changes(events_file):
+    service = EventService(events_file)
+    event = service.get_event_by_id(1)
+    event.add_attendee("alice")
+    service.touch_event(event, "attendees")
+
+    service.load_events()
+    service.register_attendee(2, "bob")
+
+    changes = service.changes_since(0)
+    assert [(c["version"], c["id"]) for c in changes] == [(1, 2)]
+
+
+def test_history_survives_a_restart(events_file):
+    service = EventService(events_file)
+    service.register_attendee(1, "alice")
+    service.delete_event(3)
+
+    reopened = EventService(events_file)
+
+    assert reopened.version == 2
+    changes = reopened.changes_since(0)
+    assert [(c["op"], c["id"]) for c in changes] == [("put", 1), ("delete", 3)]
+
+
+def test_torn_last_line_is_cut_off(tmp_path):
+    journal = str(tmp_path / "events.changes.jsonl")
+    feed = ChangeFeed(journal)
+    feed.record("put", 1, {})
+    feed.record("put", 2, {})
+    feed.commit()
+    with open(journal, "a", encoding="utf-8") as f:
+        f.write('{"version": 3, "op": "pu')  # Crash in the middle of a write
+
+    feed = ChangeFeed(journal)
+    assert feed.version == 2
+    feed.record("put", 3, {})
+    feed.commit()
+
+    assert journal_versions(journal) == [1, 2, 3]
+
+
+def test_journal_is_trimmed(tmp_path):
+    journal = str(tmp_path / "events.changes.jsonl")
+    feed = ChangeFeed(journal, keep=2)
+    for key in range(10):
+        feed.record("put", key, {})
+        feed.commit()
+
+    assert len(journal_versions(journal)) < 8
+    reopened = ChangeFeed(journal, keep=2)
+    assert reopened.version == 10
+    assert reopened.changes_since(0) is None
+    assert [c["id"] for c in reopened.changes_since(8)] == [8, 9]
+
+
+def test_index_rebuild_keeps_staged_changes(events_file):
+    service = EventService(events_file)
+    event = service.get_event_by_id(1)
+    event.add_attendee("alice")
+    service.touch_event(event, "attendees")
+
+    service._rebuild_indexes()
+    service.save_events()
+
+    assert [c["id"] for c in service.changes_since(0)] == [1]
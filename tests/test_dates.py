@@ -0,0 +1,42 @@
+import pytest
+
+from models.dates import date_ordinal
+from models.event import Event
+from services.event_service import EventService
+
+
+def test_date_changes_update_the_ordinal():
+    event = Event(1, "Talk", "2030-01-02", 5)
+    assert event.date_ordinal == date_ordinal("2030-01-02") > 0
+
+    event.date = "2030-01-01"
+    assert event.date_ordinal == date_ordinal("2030-01-02") - 1
+
+    event.date = "not a date"
+    assert event.date_ordinal == 0
+    assert not event.is_past() and not event.is_upcoming()
+    assert not event.validate_date()
+
+
+def test_events_are_split_by_day(events_file):
+    service = EventService(events_file)
+    service.update_event(5, date="2000-01-01")
+    service.update_event(4, date="2029-12-31")
+
+    assert [e.id for e in service.get_upcoming_events()] == [4, 1, 2, 3]
+    assert [e.id for e in service.get_past_events()] == [5]
+
+
+def test_invalid_dates_are_rejected(events_file):
+    service = EventService(events_file)
+    with pytest.raises(ValueError):
+        service.create_event("Talk", "2030-02-30", 5)
+
+
+def test_dates_are_stored_in_one_spelling(events_file):
+    service = EventService(events_file)
+    event = service.create_event("Talk", "2030-1-5", 5)
+
+    assert event.date == "2030-01-05"
+    assert EventService(events_file).get_event_by_id(event.id).date == "2030-01-05"
+    assert event in service.search_events(date="2030-1-05")
@@ -0,0 +1,45 @@
+import json
+import os
+
+from services.event_service import EventService
+from services.user_service import UserService
+
+
+def saved_ids(events_file):
+    with open(events_file, encoding="utf-8") as f:
+        return [e["id"] for e in json.load(f)]
+
+
+def test_delete_cleans_up_registrations(events_file, users_file):
+    events = EventService(events_file)
+    users = UserService(users_file)
+    events.set_user_service(users)
+    for event_id in (1, 2):
+        events.register_attendee(event_id, "alice")
+        users.register_event("alice", event_id)
+
+    events.delete_event(1)
+
+    assert list(UserService(users_file).get_user("alice").registered_events) == [2]
+    assert events.get_user_registered_events("alice") == [events.get_event_by_id(2)]
+
+
+def test_delete_appends_a_tombstone_instead_of_rewriting(events_file):
+    service = EventService(events_file)
+
+    service.delete_event(3)
+
+    assert saved_ids(events_file) == [1, 2, 3, 4, 5]
+    assert os.path.exists(service.tombstone_file)
+    assert [e.id for e in EventService(events_file).events] == [1, 2, 4, 5]
+
+
+def test_tombstones_are_compacted(events_file):
+    service = EventService(events_file, compact_after=2)
+
+    service.delete_event(1)
+    service.delete_event(2)
+
+    assert saved_ids(events_file) == [3, 4, 5]
+    assert not os.path.exists(service.tombstone_file)
+    assert EventService(events_file).create_event("New", "2030-02-01", 1).id == 6
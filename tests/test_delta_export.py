@@ -0,0 +1,49 @@
+import csv
+import os
+
+from services import delta_export
+from services.event_service import EventService
+
+
+def read_csv(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        return list(csv.reader(f))
+
+
+def test_merged_deltas_match_a_full_report(events_file, tmp_path):
+    service = EventService(events_file)
+    directory = str(tmp_path / "deltas")
+    base = delta_export.export(service, directory)
+    assert os.path.basename(base).startswith("base-")
+
+    service.register_attendee(1, "alice")
+    service.delete_event(2)
+    first = delta_export.export(service, directory)
+    service.create_event("New", "2030-02-01", 3)
+    service.update_event(1, name="Renamed")
+    second = delta_export.export(service, directory)
+
+    assert len(read_csv(first)) == 3  # Header, one upsert and one delete
+    assert delta_export.export(service, directory) is None  # Nothing changed
+    merged = delta_export.merge(directory, str(tmp_path / "merged.csv"))
+    full = service.export_to_csv(str(tmp_path / "full.csv"))
+    assert sorted(read_csv(merged)) == sorted(read_csv(full))
+    manifest = delta_export.read_manifest(directory)
+    assert [d["file"] for d in manifest["deltas"]] == [
+        os.path.basename(first),
+        os.path.basename(second),
+    ]
+
+
+def test_full_export_starts_a_new_chain(events_file, tmp_path):
+    service = EventService(events_file)
+    directory = str(tmp_path / "deltas")
+    old_base = delta_export.export(service, directory)
+    service.register_attendee(1, "alice")
+    delta = delta_export.export(service, directory)
+
+    new_base = delta_export.export(service, directory, full=True)
+
+    assert not os.path.exists(old_base) and not os.path.exists(delta)
+    assert delta_export.read_manifest(directory)["deltas"] == []
+    assert os.path.basename(new_base).startswith("base-")
@@ -0,0 +1,26 @@
+from services.event_service import EventService
+
+
+def apply_changes(service):
+    service.register_attendee(1, "alice")
+    service.register_attendee(1, "bob")
+    service.register_attendee(3, "carol")
+    service.update_event(4, capacity=6, date="2030-01-03")
+    service.delete_event(5)
+    service.create_event("New", "2030-01-03", 3, organizer="john")
+
+
+def test_columnar_statistics_match_the_event_list(events_file):
+    columnar = EventService(events_file, columnar=True)
+    apply_changes(columnar)
+    plain = EventService(events_file)  # Same saved events, without the table
+
+    assert columnar.get_statistics() == plain.get_statistics()
+    assert columnar.get_statistics()["full_events"] == 1
+    assert columnar.get_statistics_by_day() == plain.get_statistics_by_day()
+    assert columnar.get_statistics_by_day()["2030-01-03"] == {
+        "events": 3,
+        "capacity": 11,
+        "attendees": 1,
+    }
+    assert columnar.get_statistics_by_organizer()["john"]["events"] == 1
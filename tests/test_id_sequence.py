@@ -0,0 +1,44 @@
+import os
+
+import pytest
+
+from services.event_service import EventService
+from services.id_sequence import IdSequence, LockFile
+
+
+def test_ids_are_not_reused_after_a_delete(events_file):
+    service = EventService(events_file)
+    newest = service.create_event("New", "2030-02-01", 10)
+    service.delete_event(newest.id)
+
+    reopened = EventService(events_file)
+    assert reopened.create_event("Next", "2030-02-02", 10).id == newest.id + 1
+
+
+def test_blocks_of_two_processes_do_not_overlap(tmp_path):
+    path = str(tmp_path / "events.seq")
+    first = IdSequence(path, block=10)
+    second = IdSequence(path, block=10)
+
+    ids = [first.next_id(), second.next_id(), first.next_id(), second.next_id()]
+
+    assert ids == [1, 11, 2, 12]
+    assert list(second.next_ids(20)) == list(range(21, 41))
+
+
+def test_held_lock_times_out(tmp_path):
+    path = str(tmp_path / "events.seq.lock")
+    with LockFile(path):
+        with pytest.raises(TimeoutError):
+            LockFile(path, timeout=0.05).acquire()
+    assert not os.path.exists(path)
+
+
+def test_stale_lock_is_broken(tmp_path):
+    path = str(tmp_path / "events.seq")
+    with open(path + ".lock", "w") as f:
+        f.write("12345")  # Left behind by a crashed process
+    os.utime(path + ".lock", (0, 0))
+
+    assert IdSequence(path).next_id() == 1
+    assert not os.path.exists(path + ".lock")
@@ -0,0 +1,49 @@
+import json
+
+import pytest
+
+from services import instrumentation
+from services.event_service import EventService
+
+
+@pytest.fixture
+def metrics():
+    registry = instrumentation.enable()
+    yield registry
+    instrumentation.disable()
+
+
+def test_calls_and_file_io_are_recorded(events_file, metrics):
+    service = EventService(events_file)
+    service.register_attendee(1, "alice")
+    service.get_event_by_id(2)
+
+    report = instrumentation.report()
+    methods = report["methods"]
+    assert methods["EventService.get_event_by_id"]["count"] >= 1
+    register = methods["EventService.register_attendee"]
+    assert register["count"] == 1 and register["bytes_written"] > 0
+    assert report["io"]["events.load_json"]["bytes_read"] > 0
+
+
+def test_disable_restores_the_service(events_file, tmp_path):
+    original = EventService.get_event_by_id
+    instrumentation.enable()
+    EventService(events_file).get_event_by_id(1)
+    dump_file = instrumentation.dump(str(tmp_path / "metrics.json"))
+    instrumentation.disable()
+
+    assert EventService.get_event_by_id is original
+    assert instrumentation.report() is None
+    with open(dump_file, encoding="utf-8") as f:
+        assert "EventService.get_event_by_id" in json.load(f)["methods"]
+
+
+def test_histogram_percentiles_are_close():
+    histogram = instrumentation.Histogram()
+    for millis in range(1, 101):
+        histogram.add(millis / 1000)
+
+    assert histogram.percentile(50) == pytest.approx(0.050, rel=0.1)
+    assert histogram.percentile(99) == pytest.approx(0.099, rel=0.1)
+    assert histogram.summary()["max"] == 0.1
@@ -0,0 +1,56 @@
+import pytest
+
+from services import lazy_catalog
+from services.event_service import EventService
+
+
+def test_attendee_lists_stay_bounded(events_file):
+    service = EventService(events_file, lazy=True, max_materialized=2)
+    for event_id in (1, 2, 3):
+        service.register_attendee(event_id, "alice")
+
+    assert [len(e.attendees) for e in service.events] == [1, 1, 1, 0, 0]
+    assert service.catalog.materialized_count() <= 2
+
+
+def test_reload_closes_the_old_catalog(events_file):
+    service = EventService(events_file, lazy=True)
+    service.register_attendee(1, "alice")
+    service.load_events()
+    stale = service.get_event_by_id(2)
+    service.load_events()
+
+    with pytest.raises(ValueError):
+        stale.attendees
+    assert service.get_event_by_id(2).attendees.to_list() == []
+    assert service.get_event_by_id(1).attendees.to_list() == ["alice"]
+
+
+def test_failed_save_keeps_the_catalog_readable(events_file, monkeypatch):
+    service = EventService(events_file, lazy=True)
+    service.register_attendee(1, "alice")
+
+    def broken_write(path, sections):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(lazy_catalog, "write_snapshot", broken_write)
+    with pytest.raises(OSError):
+        service.register_attendee(2, "bob")
+    monkeypatch.undo()
+
+    # Fields that were never loaded still come from the mapped snapshot
+    assert service.get_event_by_id(3).description is None
+    assert service.get_event_by_id(3).attendees.to_list() == []
+    service.save_events()
+    assert EventService(events_file).get_event_by_id(2).attendees == ["bob"]
+
+
+def test_heavy_fields_of_unloaded_events_come_from_the_snapshot(events_file):
+    service = EventService(events_file, lazy=True)
+    service.register_attendee(1, "alice")
+    service.load_events()
+    event = service.get_event_by_id(1)
+
+    description, attendees, waitlist = service.catalog.heavy_fields(event)
+    assert not event.is_materialized()
+    assert len(attendees) == 1 and waitlist == []
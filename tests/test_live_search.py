@@ -0,0 +1,52 @@
+from services.event_service import EventService
+from ui.live_search import LiveSearch
+
+
+class FakeEntry:
+    """Stands in for a Tk entry whose after() jobs run only on fire()"""
+
+    def __init__(self):
+        self.text = ""
+        self.jobs = {}
+        self._next_job = 0
+
+    def get(self):
+        return self.text
+
+    def after(self, ms, func):
+        self._next_job += 1
+        self.jobs[self._next_job] = func
+        return self._next_job
+
+    def after_cancel(self, job):
+        self.jobs.pop(job, None)
+
+    def fire(self):
+        jobs, self.jobs = self.jobs, {}
+        for func in jobs.values():
+            func()
+
+
+def test_typing_runs_one_search_that_refines_the_last(events_file):
+    service = EventService(events_file)
+    entry = FakeEntry()
+    searches = []
+    shown = []
+
+    def search(query, candidates):
+        searches.append((query, candidates is not None))
+        return service.search_events(query, within=candidates)
+
+    live = LiveSearch(entry, search, lambda events, refined: shown.append(refined))
+    for text in ("e", "ev", "eve"):
+        entry.text = text
+        live.on_key()
+    entry.fire()
+    service.delete_event(1)
+    entry.text = "event"
+    live.on_key()
+    entry.fire()
+
+    assert searches == [("eve", False), ("event", True)]
+    assert shown == [False, True]
+    assert [e.id for e in live.results] == [2, 3, 4, 5]
@@ -0,0 +1,75 @@
+from ui import login_ui
+from ui.login_ui import LoginWindow
+
+
+class FakeRoot:
+    def __init__(self):
+        self.jobs = []
+
+    def after(self, ms, func, *args):
+        self.jobs.append((func, args))
+        return len(self.jobs)
+
+
+class FakeWidget:
+    def __init__(self, text=""):
+        self.text = text
+        self.options = {}
+
+    def get(self):
+        return self.text
+
+    def config(self, **options):
+        self.options.update(options)
+
+
+class FakePreloader:
+    def __init__(self, users):
+        self.ready = {"user_service": False, "event_service": False}
+        self.users = users
+
+    def is_ready(self, name):
+        return self.ready[name]
+
+    def get(self, name):
+        return self.users
+
+
+def login_window(preloader):
+    window = LoginWindow.__new__(LoginWindow)
+    window.root = FakeRoot()
+    window.preloader = preloader
+    window.user_service = None
+    window._opening = None
+    window._login_job = None
+    window.username_entry = FakeWidget("alice")
+    window.password_entry = FakeWidget("pw")
+    window.login_btn = FakeWidget()
+    window.status_label = FakeWidget()
+    window.opened = []
+    window.open_dashboard = window.opened.append
+    return window
+
+
+def test_login_waits_for_the_events_without_blocking(users_file, monkeypatch):
+    from services.user_service import UserService
+
+    monkeypatch.setattr(login_ui.messagebox, "showinfo", lambda *args: None)
+    preloader = FakePreloader(UserService(users_file))
+    window = login_window(preloader)
+
+    window.login()
+    window.login()  # Pressing Enter again before the users are loaded
+    assert len(window.root.jobs) == 1 and window.opened == []
+
+    preloader.ready["user_service"] = True
+    func, args = window.root.jobs.pop()
+    func(*args)
+    assert window.opened == []
+    assert window.login_btn.options["state"] == "disabled"
+    assert window.status_label.options["text"] == "Loading events..."
+
+    preloader.ready["event_service"] = True
+    func, args = window.root.jobs.pop()
+    func(*args)
+    assert [user.username for user in window.opened] == ["alice"]
@@ -0,0 +1,29 @@
+import pytest
+
+from models.event import Event
+from models.user import User
+
+
+def test_models_have_no_instance_dict():
+    event = Event(1, "Talk", "2030-01-01", 10)
+    user = User("alice", "pw", "Student")
+
+    for model in (event, user):
+        assert not hasattr(model, "__dict__")
+        with pytest.raises(AttributeError):
+            model.nickname = "x"
+
+
+def test_models_round_trip_through_dicts():
+    event = Event(1, "Talk", "2030-01-01", 1, "Hall", "About things", "john")
+    event.add_attendee("alice")
+    event.join_waitlist("bob", priority=1)
+    user = User("alice", "pw", "Student", "a@example.com", "Alice A")
+    user.registered_events.append(1)
+
+    event_copy = Event.from_dict(event.to_dict())
+    user_copy = User.from_dict(user.to_dict())
+
+    assert event_copy.to_dict() == event.to_dict()
+    assert user_copy.to_dict() == user.to_dict()
+    assert user_copy.to_dict()["registered_events"] == [1]
@@ -0,0 +1,78 @@
+import csv
+import json
+from datetime import date
+
+from services.event_service import EventService
+
+PAST = "2001-03-15"
+FUTURE = f"{date.today().year + 2}-06-01"
+
+
+def make_service(tmp_path, events):
+    data_file = str(tmp_path / "events.json")
+    rows = [
+        {"id": event_id, "name": f"Event {event_id}", "date": day, "capacity": 5}
+        for event_id, day in events
+    ]
+    with open(data_file, "w", encoding="utf-8") as f:
+        json.dump(rows, f)
+    return EventService(data_file, storage="partitioned")
+
+
+def archived_ids(service):
+    return sorted(e.id for e in service.partitions.iter_archived())
+
+
+def exported_ids(service, tmp_path):
+    path = service.export_to_csv(str(tmp_path / "report.csv"), include_archive=True)
+    with open(path, newline="", encoding="utf-8") as f:
+        return sorted(int(row[0]) for row in list(csv.reader(f))[1:])
+
+
+def test_past_months_are_archived_and_not_loaded(tmp_path):
+    service = make_service(tmp_path, [(1, PAST), (2, FUTURE)])
+
+    assert [e.id for e in service.events] == [2]
+    assert archived_ids(service) == [1]
+    assert exported_ids(service, tmp_path) == [1, 2]
+
+    reloaded = EventService(service.data_file, storage="partitioned")
+    assert [e.id for e in reloaded.events] == [2]
+    assert reloaded.create_event("New", FUTURE, 1).id == 3
+
+
+def test_deleted_archived_event_stays_deleted(tmp_path):
+    service = make_service(tmp_path, [(1, FUTURE), (2, FUTURE)])
+    service.update_event(1, date=PAST)  # Archived on save, still loaded
+    assert archived_ids(service) == [1]
+
+    service.delete_event(1)
+    service.compact()
+
+    reloaded = EventService(service.data_file, storage="partitioned")
+    assert reloaded.get_event_by_id(1) is None
+    assert archived_ids(reloaded) == []
+    assert exported_ids(reloaded, tmp_path) == [2]
+
+
+def test_event_moved_out_of_archive_leaves_no_copy(tmp_path):
+    service = make_service(tmp_path, [(1, FUTURE), (2, FUTURE)])
+    service.update_event(1, date=PAST)
+    service.update_event(1, date=FUTURE, name="Moved back")
+
+    reloaded = EventService(service.data_file, storage="partitioned")
+    assert archived_ids(reloaded) == []
+    assert reloaded.get_event_by_id(1).name == "Moved back"
+    assert exported_ids(reloaded, tmp_path) == [1, 2]
+
+
+def test_tombstone_of_unloaded_archived_event_is_compacted(tmp_path):
+    service = make_service(tmp_path, [(1, PAST), (2, PAST), (3, FUTURE)])
+    with open(service.tombstone_file, "w", encoding="ascii") as f:
+        f.write("1\n")
+
+    reloaded = EventService(service.data_file, storage="partitioned")
+    reloaded.compact()
+
+    assert archived_ids(reloaded) == [2]
+    assert exported_ids(reloaded, tmp_path) == [2, 3]
@@ -0,0 +1,27 @@
+from main import parse_args, service_options
+from ui.preloader import Preloader
+
+
+def test_services_use_the_configured_storage(events_file, users_file):
+    preloader = Preloader(
+        {"data_file": events_file, "storage": "snapshot", "lazy": True},
+        {"data_file": users_file, "storage": "snapshot"},
+    ).start()
+
+    events = preloader.take("event_service", timeout=10)
+    users = preloader.take("user_service", timeout=10)
+
+    assert events.catalog is not None
+    assert [e.id for e in events.events] == [1, 2, 3, 4, 5]
+    assert users.storage == "snapshot"
+    assert users.get_user("alice") is not None
+
+
+def test_command_line_selects_the_storage():
+    event_options, user_options = service_options(
+        parse_args(["--storage", "partitioned"])
+    )
+
+    assert event_options["storage"] == "partitioned"
+    assert event_options["lazy"] is False
+    assert user_options == {"storage": "json"}
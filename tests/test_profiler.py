@@ -0,0 +1,28 @@
+from ui import callbacks
+from ui.profiler import STARTUP, SamplingProfiler
+
+
+class AdminWindow:
+    def __init__(self, profiler):
+        self.profiler = profiler
+
+    def populate_table(self):
+        self.profiler.sample()
+
+
+def test_samples_are_filed_under_the_running_callback(tmp_path):
+    profiler = SamplingProfiler()
+    window = AdminWindow(profiler)
+    callback = callbacks.TrackedCallWrapper(window.populate_table, None, None)
+
+    callback()
+    callback()
+    profiler.sample()  # Outside any callback
+
+    assert profiler.totals() == {"AdminWindow.populate_table": 2, STARTUP: 1}
+    (path,) = [p for p in profiler.write(str(tmp_path)) if "populate_table" in p]
+    with open(path, encoding="utf-8") as f:
+        (line,) = f.read().splitlines()
+    stack, count = line.rsplit(" ", 1)
+    assert stack.endswith("test_profiler:populate_table;profiler:sample")
+    assert count == "2"
@@ -0,0 +1,41 @@
+from services.event_service import EventService
+from services.query_cache import QueryCache
+
+
+def test_edits_only_evict_queries_that_see_them(events_file):
+    service = EventService(events_file)
+    by_name = service.search_events("event 2")
+    open_events = service.search_events("event", open_only=True)
+
+    service.register_attendee(2, "alice")
+    service.register_attendee(2, "bob")
+
+    assert service.search_events("event 2") is by_name
+    still_open = service.search_events("event", open_only=True)
+    assert [e.id for e in still_open] == [1, 3, 4, 5]
+    assert len(open_events) == 5
+
+    service.update_event(2, name="Renamed")
+    assert service.search_events("event 2") == []
+
+
+def test_new_events_show_up_in_cached_lists(events_file):
+    service = EventService(events_file)
+    assert service.get_events_by_organizer("john") == []
+
+    service.create_event("Talk", "2030-02-01", 5, organizer="john")
+
+    assert [e.name for e in service.get_events_by_organizer("john")] == ["Talk"]
+
+
+def test_least_recently_used_entry_is_dropped():
+    cache = QueryCache(max_entries=2)
+    cache.put("a", ("name",), 1)
+    cache.put("b", ("name",), 2)
+    cache.get("a", ("name",))
+    cache.put("c", ("name",), 3)
+
+    assert cache.get("b", ("name",)) is QueryCache.MISS
+    assert cache.get("a", ("name",)) == 1
+    cache.bump("name")
+    assert cache.get("a", ("name",)) is QueryCache.MISS
@@ -0,0 +1,73 @@
+import threading
+
+import pytest
+
+from services.event_service import EventService
+from services.registration_batcher import RegistrationBatcher
+from services.user_service import UserService
+
+
+def test_batch_is_saved_once(events_file, users_file, monkeypatch):
+    events = EventService(events_file)
+    users = UserService(users_file)
+    saves = []
+    monkeypatch.setattr(events, "save_events", lambda: saves.append("events"))
+    monkeypatch.setattr(users, "save_users", lambda: saves.append("users"))
+    batcher = RegistrationBatcher(events, users, window=None)
+
+    requests = [batcher.register(1, name) for name in ("alice", "bob", "carol")]
+    outcomes = batcher.flush()
+
+    assert [o["success"] for o in outcomes] == [True, True, False]
+    assert saves == ["events", "users"]
+    assert all(r.done() for r in requests)
+    assert list(users.get_user("bob").registered_events) == [1]
+
+
+def test_failed_save_releases_waiters_and_fails_the_batch(
+    events_file, users_file, monkeypatch
+):
+    events = EventService(events_file)
+
+    def broken_save():
+        raise OSError("disk full")
+
+    monkeypatch.setattr(events, "save_events", broken_save)
+    batcher = RegistrationBatcher(events, UserService(users_file), window=None)
+    requests = [batcher.register(2, "alice"), batcher.register(2, "bob")]
+
+    waiter = threading.Thread(target=requests[0].wait)
+    waiter.start()
+    with pytest.raises(OSError):
+        batcher.flush()
+    waiter.join(timeout=1)
+
+    assert not waiter.is_alive()
+    assert all(r.done() for r in requests)
+    assert [r.outcome["success"] for r in requests] == [False, False]
+    assert "disk full" in requests[1].outcome["error"]
+
+
+def test_failed_save_undoes_the_registrations(events_file, users_file, monkeypatch):
+    events = EventService(events_file)
+    users = UserService(users_file)
+    batcher = RegistrationBatcher(events, users, window=None)
+
+    def broken_save():
+        raise OSError("disk full")
+
+    monkeypatch.setattr(users, "save_users", broken_save)
+    batcher.register(2, "alice")
+    batcher.register(2, "bob")
+    with pytest.raises(OSError):
+        batcher.flush()
+    monkeypatch.undo()
+
+    assert events.get_event_by_id(2).attendees.to_list() == []
+    assert list(users.get_user("alice").registered_events) == []
+
+    # The next saves must not write the undone registrations
+    events.register_attendee(3, "carol")
+    users.save_users()
+    assert EventService(events_file).get_event_by_id(2).attendees.to_list() == []
+    assert list(UserService(users_file).get_user("bob").registered_events) == []
@@ -0,0 +1,38 @@
+from services.event_service import EventService
+
+
+def test_refining_skips_deleted_events(events_file):
+    service = EventService(events_file)
+    results = service.search_events("event")
+    service.delete_event(2)
+
+    refined = service.search_events("event", within=results)
+    open_refined = service.search_events("event", within=results, open_only=True)
+
+    assert [e.id for e in refined] == [1, 3, 4, 5]
+    assert [e.id for e in open_refined] == [1, 3, 4, 5]
+
+
+def test_open_events_follow_registrations(events_file):
+    service = EventService(events_file)
+    assert [e.id for e in service.get_available_events()] == [1, 2, 3, 4, 5]
+
+    service.register_attendee(2, "alice")
+    service.register_attendee(2, "bob")
+    service.delete_event(4)
+
+    assert [e.id for e in service.get_available_events()] == [1, 3, 5]
+    assert [e.id for e in service.get_available_events("2030-01-03", 1)] == [3]
+
+
+def test_capacity_and_date_changes_reorder_open_events(events_file):
+    service = EventService(events_file)
+    service.register_attendee(1, "alice")
+    service.update_event(1, capacity=1)
+    service.update_event(5, date="2029-12-31")
+    service.update_event(3, capacity=10)
+    for name in ("alice", "bob", "carol", "dave"):
+        service.register_attendee(3, name)
+
+    assert [e.id for e in service.get_available_events()] == [5, 2, 3, 4]
+    assert service.get_almost_full_events(0.4) == [service.get_event_by_id(3)]
@@ -0,0 +1,28 @@
+from benchmarks import service_benchmark
+from services.event_service import EventService
+
+
+def test_timed_calls_do_real_work(monkeypatch):
+    lookups = []
+    searches = []
+    get_event_by_id = EventService.get_event_by_id
+    search = EventService._search
+
+    def counted_lookup(self, event_id):
+        event = get_event_by_id(self, event_id)
+        lookups.append(event)
+        return event
+
+    def counted_search(self, *args):
+        searches.append(args)
+        return search(self, *args)
+
+    monkeypatch.setattr(EventService, "get_event_by_id", counted_lookup)
+    monkeypatch.setattr(EventService, "_search", counted_search)
+    report = service_benchmark.run(300, 50, repeat=1, storage="partitioned")
+
+    assert "search_events" in report["seconds"]
+    # Past months are archived, yet every timed lookup finds its event
+    assert None not in lookups[: service_benchmark.LOOKUPS]
+    # No search is answered from the query cache
+    assert len(searches) == service_benchmark.QUERIES
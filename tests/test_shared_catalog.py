@@ -0,0 +1,113 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from services.event_service import EventService
+from services.shared_catalog import SharedCatalog, SharedCatalogWriter
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def shared_dir(service):
+    return service.shared.directory
+
+
+def shared_service(events_file, **options):
+    service = EventService(events_file, shared=True, **options)
+    service.shared.interval = 0  # Publish every commit right away
+    return service
+
+
+def test_reader_follows_new_generations(events_file):
+    service = shared_service(events_file)
+    service.shared.flush()
+    reader = SharedCatalog(shared_dir(service))
+    assert len(reader) == 5
+    old_view = reader.view()
+
+    service.register_attendee(1, "alice")
+    service.delete_event(2)
+    created = service.create_event("New", "2030-02-01", 3, location="Hall")
+    service.shared.flush()
+
+    assert reader.get_event_by_id(1).attendees.to_list() == ["alice"]
+    assert reader.get_event_by_id(2) is None
+    assert [e.id for e in reader.search_events("hall")] == [created.id]
+    assert reader.generation > old_view.generation
+    assert old_view.get_event_by_id(2) is not None  # Earlier views stay intact
+
+
+def test_commits_are_coalesced_and_unchanged_catalogs_skipped(events_file):
+    service = shared_service(events_file)
+    service.shared.interval = 60
+    service.shared.flush()
+    first = service.shared.generation
+
+    for name in ("alice", "bob"):
+        service.register_attendee(3, name)
+    service.publish()  # Nothing changed since the last commit
+    service.shared.interval = 0
+    service.shared.flush()
+
+    assert service.shared.generation == first + 1
+    reader = SharedCatalog(shared_dir(service))
+    assert reader.get_event_by_id(3).attendees.to_list() == ["alice", "bob"]
+
+
+def test_writers_never_reuse_a_generation(events_file):
+    service = shared_service(events_file)
+    service.shared.flush()
+    other = SharedCatalogWriter(shared_dir(service))
+
+    generations = [other.publish(service.events)]
+    service.register_attendee(1, "alice")
+    service.shared.flush()
+    generations.append(service.shared.generation)
+    generations.append(other.publish(service.events))
+
+    assert generations == sorted(set(generations))
+    assert SharedCatalog(shared_dir(service)).generation == generations[-1]
+
+
+def test_publish_waits_for_the_lock(events_file):
+    service = shared_service(events_file)
+    service.shared.flush()
+    writer = SharedCatalogWriter(shared_dir(service))
+    writer._lock_file.timeout = 0.05
+
+    with service.shared._lock_file:
+        with pytest.raises(TimeoutError):
+            writer.publish(service.events)
+
+
+def test_lazy_mode_publishes_without_materializing(events_file):
+    EventService(events_file).register_attendee(4, "alice")
+    service = shared_service(events_file, lazy=True)
+    service.register_attendee(5, "bob")
+
+    assert service.catalog.materialized_count() == 1
+    reader = SharedCatalog(shared_dir(service))
+    assert reader.has_attendee(4, "alice") and reader.has_attendee(5, "bob")
+
+
+def test_reader_in_another_process(events_file):
+    service = shared_service(events_file)
+    service.register_attendee(1, "alice")
+    service.shared.flush()
+    code = (
+        "import sys; from services.shared_catalog import SharedCatalog; "
+        "c = SharedCatalog(sys.argv[1]); "
+        "print(len(c), c.get_event_by_id(1).attendees.to_list())"
+    )
+
+    result = subprocess.run(
+        [sys.executable, "-c", code, shared_dir(service)],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.split("\n")[0] == "5 ['alice']"
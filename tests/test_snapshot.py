@@ -0,0 +1,88 @@
+import json
+
+import pytest
+
+from models.event import Event
+from models.user import User
+from services.event_service import EventService
+from services.snapshot import (
+    load_events_snapshot,
+    load_users_snapshot,
+    save_events_snapshot,
+    save_users_snapshot,
+    write_snapshot,
+)
+from services.user_service import UserService
+
+
+def write_events_json(path, count):
+    events = [
+        {"id": i, "name": f"Event {i}", "date": "2030-01-01", "capacity": 5}
+        for i in range(1, count + 1)
+    ]
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(events, f)
+
+
+def test_events_round_trip_with_waitlist(tmp_path):
+    event = Event(1, "Talk", "2030-05-01", 1, "Hall", "About things", "org")
+    event.add_attendee("alice")
+    event.join_waitlist("bob", priority=2)
+    event.join_waitlist("carol")
+    path = str(tmp_path / "events.snap")
+
+    save_events_snapshot(path, [event, Event(2, "Empty", "2030-05-02", 3)])
+    loaded = load_events_snapshot(path)
+
+    assert [e.to_dict() for e in loaded] == [
+        event.to_dict(),
+        Event(2, "Empty", "2030-05-02", 3).to_dict(),
+    ]
+
+
+def test_users_round_trip(tmp_path):
+    user = User("alice", "secret", "Student", "a@example.com", "Alice")
+    user.registered_events = [3, 1]
+    path = str(tmp_path / "users.snap")
+
+    save_users_snapshot(path, [user])
+    (loaded,) = load_users_snapshot(path)
+
+    assert loaded.to_dict() == user.to_dict()
+
+
+def test_section_names_must_fit(tmp_path):
+    with pytest.raises(ValueError):
+        write_snapshot(str(tmp_path / "x.snap"), {"a_very_long_section": b""})
+
+
+def test_corrupt_event_snapshot_is_not_replaced_by_older_json(tmp_path):
+    data_file = str(tmp_path / "events.json")
+    write_events_json(data_file, 3)
+    service = EventService(data_file, storage="snapshot")
+    service.create_event("Only in the snapshot", "2030-02-02", 5)
+
+    with open(service.snapshot_file, "r+b") as f:
+        f.write(b"garbage!")
+    corrupt = open(service.snapshot_file, "rb").read()
+
+    for options in ({"storage": "snapshot"}, {"lazy": True}):
+        with pytest.raises(ValueError):
+            EventService(data_file, **options)
+        assert open(service.snapshot_file, "rb").read() == corrupt
+
+
+def test_corrupt_user_snapshot_is_not_replaced_by_older_json(tmp_path):
+    data_file = str(tmp_path / "users.json")
+    with open(data_file, "w", encoding="utf-8") as f:
+        json.dump([], f)
+    service = UserService(data_file, storage="snapshot")
+    service.create_user("alice", "pw", "Student")
+
+    with open(service.snapshot_file, "r+b") as f:
+        f.write(b"garbage!")
+    corrupt = open(service.snapshot_file, "rb").read()
+
+    with pytest.raises(ValueError):
+        UserService(data_file, storage="snapshot")
+    assert open(service.snapshot_file, "rb").read() == corrupt
@@ -0,0 +1,35 @@
+import json
+
+from models.event import Event
+from models.symbols import NameList, SymbolTable
+
+
+def test_name_list_behaves_like_a_list_of_names():
+    names = NameList(["alice", "bob", "alice"], SymbolTable())
+
+    assert names == ["alice", "bob", "alice"]
+    assert "bob" in names and "carol" not in names
+    assert names[1] == "bob" and names.count("alice") == 2
+    names.remove("alice")
+    names.append("carol")
+    assert names.to_list() == ["bob", "alice", "carol"]
+    assert json.loads(json.dumps(names.to_list())) == ["bob", "alice", "carol"]
+
+
+def test_events_share_one_id_per_username():
+    symbols = SymbolTable()
+    first = NameList(["alice", "bob"], symbols)
+    second = NameList(["bob", "alice"], symbols)
+
+    assert len(symbols) == 2
+    assert list(first.ids) == list(reversed(second.ids))
+
+
+def test_event_dicts_hold_plain_usernames():
+    event = Event(1, "Talk", "2030-01-01", 5)
+    event.add_attendee("alice")
+    copy = event.copy()
+    copy.add_attendee("bob")
+
+    assert event.to_dict()["attendees"] == ["alice"]
+    assert Event.from_dict(copy.to_dict()).attendees == ["alice", "bob"]
@@ -0,0 +1,109 @@
+import pytest
+
+from services.event_service import EventService
+from services.registration_batcher import RegistrationBatcher
+from services.user_service import UserService
+
+
+def full_event(events_file, users_file):
+    """Event 1 with alice and bob registered and carol, dave waitlisted"""
+    events = EventService(events_file)
+    users = UserService(users_file)
+    events.set_user_service(users)
+    for name in ("alice", "bob"):
+        events.register_attendee(1, name)
+        users.register_event(name, 1)
+    events.join_waitlist(1, "carol")
+    events.join_waitlist(1, "dave", priority=-1)  # Lower value goes first
+    return events, users
+
+
+def test_promoted_user_is_registered_without_a_ui(events_file, users_file):
+    events, users = full_event(events_file, users_file)
+    heard = []
+    events.add_promotion_listener(lambda event_id, name: heard.append(name))
+
+    events.unregister_attendee(1, "alice")
+
+    assert events.get_event_by_id(1).attendees.to_list() == ["bob", "dave"]
+    assert list(UserService(users_file).get_user("dave").registered_events) == [1]
+    assert heard == ["dave"]
+
+
+def test_capacity_increase_registers_promoted_users(events_file, users_file):
+    events, users = full_event(events_file, users_file)
+
+    events.update_event(1, capacity=4)
+
+    reloaded = UserService(users_file)
+    assert list(reloaded.get_user("carol").registered_events) == [1]
+    assert list(reloaded.get_user("dave").registered_events) == [1]
+
+
+def test_batcher_promotions_are_saved_with_the_batch(
+    events_file, users_file, monkeypatch
+):
+    events, users = full_event(events_file, users_file)
+    saves = []
+    save_users = users.save_users
+    monkeypatch.setattr(users, "save_users", lambda: saves.append(save_users()))
+    batcher = RegistrationBatcher(events, users, window=None)
+
+    batcher.unregister(1, "alice")
+    batcher.unregister(1, "bob")
+    batcher.flush()
+
+    assert len(saves) == 1
+    reloaded = UserService(users_file)
+    assert list(reloaded.get_user("carol").registered_events) == [1]
+    assert list(reloaded.get_user("alice").registered_events) == []
+
+
+def test_failed_batch_save_keeps_the_waitlist(events_file, users_file, monkeypatch):
+    events, users = full_event(events_file, users_file)
+    heard = []
+    events.add_promotion_listener(lambda event_id, name: heard.append(name))
+    batcher = RegistrationBatcher(events, users, window=None)
+
+    def broken_save():
+        raise OSError("disk full")
+
+    monkeypatch.setattr(users, "save_users", broken_save)
+    batcher.unregister(1, "alice")
+    with pytest.raises(OSError):
+        batcher.flush()
+
+    event = events.get_event_by_id(1)
+    assert event.attendees.to_list() == ["alice", "bob"]
+    assert event.waitlist_position("dave") == 1
+    assert list(users.get_user("dave").registered_events) == []
+    assert heard == []
+    assert EventService(events_file).get_event_by_id(1).attendees == ["alice", "bob"]
+
+
+def test_bulk_removal_saves_users_once(events_file, users_file, monkeypatch):
+    events, users = full_event(events_file, users_file)
+    saves = []
+    save_users = users.save_users
+    monkeypatch.setattr(users, "save_users", lambda: saves.append(save_users()))
+
+    removed = events.unregister_attendees(1, ["alice", "bob"])
+
+    assert removed == ["alice", "bob"]
+    assert len(saves) == 1
+    reloaded = UserService(users_file)
+    registered = {u.username: list(u.registered_events) for u in reloaded.users}
+    assert registered == {"alice": [], "bob": [], "carol": [1], "dave": [1]}
+
+
+def test_bulk_enrollment_saves_users_once(events_file, users_file, monkeypatch):
+    events = EventService(events_file)
+    users = UserService(users_file)
+    events.set_user_service(users)
+    saves = []
+    save_users = users.save_users
+    monkeypatch.setattr(users, "save_users", lambda: saves.append(save_users()))
+
+    assert events.register_attendees(2, ["alice", "bob"]) == ["alice", "bob"]
+    assert len(saves) == 1
+    assert list(UserService(users_file).get_user("bob").registered_events) == [2]
@@ -0,0 +1,43 @@
+import time
+
+from ui import callbacks
+from ui.watchdog import Watchdog
+
+
+class FakeRoot:
+    """Stands in for a Tk root whose event loop runs only on run()"""
+
+    def __init__(self):
+        self.pending = []
+
+    def after(self, ms, func):
+        self.pending.append(func)
+
+    def run(self):
+        pending, self.pending = self.pending, []
+        for func in pending:
+            func()
+
+
+def wait_for_stalls(watchdog, count, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while watchdog.recent_stalls()[0] < count and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def test_stall_count_grows_after_the_list_is_full():
+    watchdog = Watchdog(interval=0.01, threshold=0.03, log_file=None, keep=2)
+    root = FakeRoot()
+    watchdog.start(root)
+    try:
+        for count in range(1, 4):
+            wait_for_stalls(watchdog, count)
+            root.run()  # The loop runs again and ends the stall
+    finally:
+        watchdog.stop()
+        callbacks.uninstall()
+
+    count, recent = watchdog.recent_stalls()
+    assert count == 3
+    assert len(recent) == 2
+    assert all(stall.duration is not None for stall in recent)
@@ -1,18 +1,38 @@
+import time
 import tkinter as tk
 from tkinter import messagebox, ttk, simpledialog
 from services.event_service import EventService
 from services.user_service import UserService
+from ui import watchdog
+from ui.live_search import LiveSearch, TreeFiller
+from ui.preloader import DEFAULT_EVENT_OPTIONS
 
 
 class AdminWindow:
-    def __init__(self, root, user):
+    def __init__(
+        self,
+        root,
+        user,
+        event_service=None,
+        user_service=None,
+        event_options=None,
+        user_options=None,
+    ):
         self.root = root
         self.user = user
+        # Configured service options, reused when logging in again
+        self.event_options = dict(
+            DEFAULT_EVENT_OPTIONS if event_options is None else event_options
+        )
+        self.user_options = dict(user_options or {})
         self.root.title(f"Admin Dashboard - {user.username}")
         self.root.geometry("1000x700")
+        watchdog.attach(root)
 
-        self.event_service = EventService()
-        self.user_service = UserService()
+        # Services may be handed over already loaded by the login preloader
+        self.event_service = event_service or EventService(**self.event_options)
+        self.user_service = user_service or UserService(**self.user_options)
+        self.event_service.set_user_service(self.user_service)
 
         # Header
         header_frame = tk.Frame(root, bg="#2c3e50", height=60)
@@ -65,7 +85,7 @@ class AdminWindow:
         tk.Button(
             search_frame,
             text="Clear",
-            command=self.populate_table,
+            command=self.clear_search,
             bg="#95a5a6",
             fg="white",
         ).pack(side=tk.LEFT)
@@ -110,6 +130,12 @@ class AdminWindow:
         self.tree.pack(fill=tk.BOTH, expand=True)
         self.tree.bind("<Double-1>", self.view_event_details)
 
+        # Search as you type, refining the previous result while it narrows
+        self.filler = TreeFiller(self.tree, self.event_row)
+        self.live_search = LiveSearch(
+            self.search_entry, self.find_events, self.filler.show
+        ).bind()
+
         # Right panel - Actions
         right_frame = tk.Frame(main_frame, width=300)
         right_frame.pack(side=tk.RIGHT, fill=tk.Y)
@@ -205,6 +231,16 @@ class AdminWindow:
             fg="white",
             font=("Arial", 9, "bold"),
             width=30,
+        ).pack(padx=10, pady=5)
+
+        tk.Button(
+            actions_frame,
+            text="Diagnostics",
+            command=self.show_diagnostics,
+            bg="#7f8c8d",
+            fg="white",
+            font=("Arial", 9, "bold"),
+            width=30,
         ).pack(padx=10, pady=(5, 10))
 
         # Statistics
@@ -218,58 +254,46 @@ class AdminWindow:
         )
         self.stats_label.pack(padx=10, pady=10, fill=tk.BOTH, expand=True)
 
-        # Load data
-        self.populate_table()
-        self.update_statistics()
+        # Load data once the window has been drawn
+        self.root.after_idle(self.load_data)
 
-    def populate_table(self):
-        """Load and display all events"""
-        for i in self.tree.get_children():
-            self.tree.delete(i)
-
-        events = self.event_service.get_all_events()
-        for event in events:
-            self.tree.insert(
-                "",
-                "end",
-                values=(
-                    event.id,
-                    event.name,
-                    event.date,
-                    event.location or "-",
-                    event.capacity,
-                    len(event.attendees),
-                    event.available_slots(),
-                ),
-            )
+    def load_data(self):
+        """Fill the window from the events already in memory"""
+        self.root.update_idletasks()
+        self.populate_table(reload=False)
 
+    def populate_table(self, reload=True):
+        """Load and display all events matching the search box"""
+        if reload:
+            self.event_service.get_all_events()
+        self.live_search.reset(clear_entry=False)
+        self.live_search.run()
         self.update_statistics()
 
+    def event_row(self, event):
+        """Return the table values of an event"""
+        return (
+            event.id,
+            event.name,
+            event.date,
+            event.location or "-",
+            event.capacity,
+            event.attendee_count(),
+            event.available_slots(),
+        )
+
+    def find_events(self, keyword, candidates):
+        """Search the catalog, or only candidates when refining a search"""
+        return self.event_service.search_events(keyword=keyword, within=candidates)
+
     def search_events(self):
         """Search events by keyword"""
-        keyword = self.search_entry.get().strip()
-        if not keyword:
-            self.populate_table()
-            return
+        self.live_search.run()
 
-        for i in self.tree.get_children():
-            self.tree.delete(i)
-
-        events = self.event_service.search_events(keyword=keyword)
-        for event in events:
-            self.tree.insert(
-                "",
-                "end",
-                values=(
-                    event.id,
-                    event.name,
-                    event.date,
-                    event.location or "-",
-                    event.capacity,
-                    len(event.attendees),
-                    event.available_slots(),
-                ),
-            )
+    def clear_search(self):
+        """Clear the search box and show all events"""
+        self.live_search.reset()
+        self.populate_table()
 
     def add_event(self):
         """Add a new event"""
@@ -380,7 +404,7 @@ class AdminWindow:
             "Confirm Delete", f"Are you sure you want to delete '{event_name}'?"
         ):
             try:
-                self.event_service.delete_event(event_id)
+                self.event_service.delete_event(event_id, self.user_service)
                 messagebox.showinfo("Success", "Event deleted successfully!")
                 self.populate_table()
             except ValueError as e:
@@ -405,6 +429,7 @@ Location: {event.location or 'Not specified'}
 Capacity: {event.capacity}
 Registered: {len(event.attendees)}
 Available: {event.available_slots()}
+Waitlist: {len(event.waitlist)}
 Organizer: {event.organizer or 'N/A'}
 
 Description:
@@ -464,20 +489,102 @@ Attendees:
     def export_csv(self):
         """Export events to CSV"""
         try:
-            filename = self.event_service.export_to_csv()
+            filename = self.event_service.export_to_csv(include_archive=True)
             messagebox.showinfo("Success", f"Report exported to:\n{filename}")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to export: {str(e)}")
 
+    def show_diagnostics(self):
+        """Show UI stalls recorded by the watchdog"""
+        monitor = watchdog.active
+        if monitor is None:
+            messagebox.showinfo(
+                "Diagnostics", "The UI watchdog is not running (--no-watchdog)."
+            )
+            return
+
+        diag_win = tk.Toplevel(self.root)
+        diag_win.title("Diagnostics - UI Responsiveness")
+        diag_win.geometry("700x500")
+        diag_win.transient(self.root)
+
+        lag_label = tk.Label(diag_win, text="", font=("Arial", 10), justify=tk.LEFT)
+        lag_label.pack(anchor="w", padx=10, pady=10)
+
+        columns = ("Time", "Duration", "Action")
+        stall_tree = ttk.Treeview(diag_win, columns=columns, show="headings", height=8)
+        stall_tree.heading("Time", text="Time")
+        stall_tree.heading("Duration", text="Duration (ms)")
+        stall_tree.heading("Action", text="Callback")
+        stall_tree.column("Time", width=150, anchor="center")
+        stall_tree.column("Duration", width=100, anchor="center")
+        stall_tree.column("Action", width=400)
+        stall_tree.pack(fill=tk.X, padx=10)
+
+        stack_text = tk.Text(diag_win, font=("Courier", 8), height=14)
+        stack_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+
+        tk.Label(
+            diag_win,
+            text=f"Log file: {monitor.log_file or 'disabled'}",
+            font=("Arial", 9),
+            fg="#7f8c8d",
+        ).pack(anchor="w", padx=10, pady=(0, 10))
+
+        stalls = []
+        shown = {"count": -1}  # Stall count when the table was last filled
+
+        def show_stack(event=None):
+            selected = stall_tree.selection()
+            stack_text.delete("1.0", tk.END)
+            if selected:
+                stack_text.insert(tk.END, stalls[int(selected[0])].stack)
+
+        def refresh():
+            if not diag_win.winfo_exists():
+                return
+            count, recent = monitor.recent_stalls()
+            lag_label.config(
+                text=f"Event loop lag: {monitor.average_lag() * 1000:.0f} ms average, "
+                f"{monitor.max_lag * 1000:.0f} ms max\n"
+                f"Stalls over {monitor.threshold * 1000:.0f} ms: {count}"
+            )
+            if count != shown["count"] or any(s.duration is None for s in stalls):
+                shown["count"] = count
+                stalls[:] = reversed(recent)
+                for i in stall_tree.get_children():
+                    stall_tree.delete(i)
+                for index, stall in enumerate(stalls):
+                    if stall.duration is None:
+                        duration = "blocked"
+                    else:
+                        duration = f"{stall.duration * 1000:.0f}"
+                    stall_tree.insert(
+                        "",
+                        "end",
+                        iid=str(index),
+                        values=(
+                            time.strftime("%H:%M:%S", time.localtime(stall.started)),
+                            duration,
+                            stall.action,
+                        ),
+                    )
+            diag_win.after(1000, refresh)
+
+        stall_tree.bind("<<TreeviewSelect>>", show_stack)
+        refresh()
+
     def update_statistics(self):
         """Update statistics display"""
         stats = self.event_service.get_statistics()
+        almost_full = len(self.event_service.get_almost_full_events())
 
         stats_text = f"""
 Total Events: {stats['total_events']}
 Total Attendees: {stats['total_attendees']}
 Avg Attendance: {stats['average_attendance']:.1f}
 Full Events: {stats['full_events']}
+Almost Full: {almost_full}
 
 Highest Attendance:
   {stats['highest_attendance']['name'] if stats['highest_attendance'] else 'N/A'}
@@ -496,5 +603,5 @@ Lowest Attendance:
             root = tk.Tk()
             from ui.login_ui import LoginWindow
 
-            LoginWindow(root)
+            LoginWindow(root, None, self.event_options, self.user_options)
             root.mainloop()
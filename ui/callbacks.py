@@ -0,0 +1,80 @@
+"""
+Callback Tracking - Names the Tk callback that is running on the main thread
+
+Tk calls every Python command, event binding and after() callback through
+tkinter.CallWrapper. install() swaps in a subclass that keeps a stack of
+running callback names (dialogs and dashboards start nested event loops)
+and tells listeners when a callback starts and ends. Tools such as the
+profiler read current_action() from another thread.
+"""
+
+import tkinter
+
+_actions = []  # Names of running callbacks, innermost last
+_listeners = []  # Called as listener("start" | "end", action)
+_original = tkinter.CallWrapper
+
+
+def action_name(func):
+    """Return a readable name for a callback, e.g. AdminWindow.populate_table"""
+    owner = getattr(func, "__self__", None)
+    if owner is not None:
+        return f"{type(owner).__name__}.{func.__name__}"
+    name = getattr(func, "__qualname__", None) or getattr(
+        func, "__name__", type(func).__name__
+    )
+    # after() wraps callbacks in a local function renamed after the callback
+    if ".after.<locals>." in name:
+        return func.__name__
+    return name.replace(".<locals>", "")
+
+
+class TrackedCallWrapper(_original):
+    """CallWrapper that records which callback is running"""
+
+    def __init__(self, func, subst, widget):
+        super().__init__(func, subst, widget)
+        self.action = action_name(func)
+
+    def __call__(self, *args):
+        _actions.append(self.action)
+        for listener in _listeners:
+            listener("start", self.action)
+        try:
+            return super().__call__(*args)
+        finally:
+            _actions.pop()
+            for listener in _listeners:
+                listener("end", self.action)
+
+
+def install():
+    """Track callbacks registered from now on (call before creating widgets)"""
+    tkinter.CallWrapper = TrackedCallWrapper
+
+
+def uninstall():
+    """Stop tracking callbacks registered from now on"""
+    tkinter.CallWrapper = _original
+
+
+def is_installed():
+    """Check if callback tracking is active"""
+    return tkinter.CallWrapper is TrackedCallWrapper
+
+
+def current_action():
+    """Return the name of the innermost running callback, or None"""
+    actions = _actions[:]
+    return actions[-1] if actions else None
+
+
+def add_listener(listener):
+    """Register listener(event, action) for callback start and end"""
+    _listeners.append(listener)
+
+
+def remove_listener(listener):
+    """Unregister a callback listener"""
+    if listener in _listeners:
+        _listeners.remove(listener)
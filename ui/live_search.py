@@ -0,0 +1,120 @@
+"""
+Live Search - Search-as-you-type helpers for the dashboards
+"""
+
+import tkinter as tk
+
+
+class TreeFiller:
+    """
+    Fills a Treeview with events in chunks so large lists keep the UI responsive.
+
+    Rows use the event ID as item id. row(event) returns the row values, or
+    None to leave an event out. A new show() cancels any unfinished fill.
+    """
+
+    def __init__(self, tree, row, chunk=500):
+        self.tree = tree
+        self.row = row
+        self.chunk = chunk
+        self._job = None
+        self._pending = []
+
+    def cancel(self):
+        """Stop inserting the remaining rows"""
+        if self._job is not None:
+            self.tree.after_cancel(self._job)
+            self._job = None
+        self._pending = []
+
+    def show(self, events, refine=False):
+        """
+        Display events in order.
+
+        With refine=True events must be a subset of what was shown last, in
+        the same order: rows that dropped out are deleted and the rest stay.
+        """
+        self.cancel()
+        if refine:
+            wanted = {str(e.id) for e in events}
+            shown = self.tree.get_children()
+            dropped = [iid for iid in shown if iid not in wanted]
+            if dropped:
+                self.tree.delete(*dropped)
+            # Rows of an unfinished fill may still be missing
+            shown = set(shown) - set(dropped)
+            events = [e for e in events if str(e.id) not in shown]
+        else:
+            self.tree.delete(*self.tree.get_children())
+
+        self._pending = events
+        self._insert_chunk(0)
+
+    def _insert_chunk(self, start):
+        self._job = None
+        end = start + self.chunk
+        for event in self._pending[start:end]:
+            values = self.row(event)
+            if values is not None:
+                self.tree.insert("", "end", iid=str(event.id), values=values)
+        if end < len(self._pending):
+            self._job = self.tree.after_idle(self._insert_chunk, end)
+        else:
+            self._pending = []
+
+
+class LiveSearch:
+    """
+    Runs a search shortly after the user stops typing in an entry.
+
+    search(query, candidates) returns the matching events; candidates is
+    the previous result when the new query only extends the old one, or
+    None to scan the whole catalog. show(events, refined) displays them.
+    """
+
+    def __init__(self, entry, search, show, delay=150):
+        self.entry = entry
+        self.search = search
+        self.show = show
+        self.delay = delay
+        self._job = None
+        self.query = ""
+        self.results = None
+
+    def bind(self):
+        """Start reacting to keystrokes"""
+        self.entry.bind("<KeyRelease>", self.on_key)
+        return self
+
+    def on_key(self, event=None):
+        """Restart the debounce timer"""
+        if self._job is not None:
+            self.entry.after_cancel(self._job)
+        self._job = self.entry.after(self.delay, self.run)
+
+    def run(self):
+        """Search for the current entry text now"""
+        if self._job is not None:
+            self.entry.after_cancel(self._job)
+            self._job = None
+
+        query = self.entry.get().strip().lower()
+        if query == self.query and self.results is not None:
+            return
+
+        refined = bool(self.query) and query.startswith(self.query) and (
+            self.results is not None
+        )
+        self.results = self.search(query, self.results if refined else None)
+        self.query = query
+        self.show(self.results, refined)
+
+    def reset(self, clear_entry=True):
+        """Forget the previous result so the next search scans everything"""
+        if self._job is not None:
+            self.entry.after_cancel(self._job)
+            self._job = None
+        if clear_entry:
+            self.entry.delete(0, tk.END)
+        self.query = ""
+        self.results = None
@@ -1,14 +1,16 @@
 import tkinter as tk
 from tkinter import messagebox
-from services.user_service import UserService
+from ui import watchdog
+from ui.preloader import Preloader
 
 
 class LoginWindow:
-    def __init__(self, root):
+    def __init__(self, root, preloader=None, event_options=None, user_options=None):
         self.root = root
         self.root.title("Campus Event Management - Login")
         self.root.geometry("400x300")
         self.root.resizable(False, False)
+        watchdog.attach(root)
 
         # Center window
         self.root.update_idletasks()
@@ -16,7 +18,11 @@ class LoginWindow:
         y = (self.root.winfo_screenheight() // 2) - (300 // 2)
         self.root.geometry(f"400x300+{x}+{y}")
 
-        self.user_service = UserService()
+        # Services load in the background while the form is shown
+        self.preloader = (preloader or Preloader(event_options, user_options)).start()
+        self.user_service = None
+        self._opening = None  # User whose dashboard waits for the events
+        self._login_job = None  # Login retried once the users are loaded
 
         # Header
         header = tk.Label(
@@ -47,7 +53,7 @@ class LoginWindow:
         self.password_entry.grid(row=1, column=1, pady=12)
 
         # Login button
-        login_btn = tk.Button(
+        self.login_btn = tk.Button(
             root,
             text="Login",
             command=self.login,
@@ -58,11 +64,27 @@ class LoginWindow:
             height=1,
             cursor="hand2",
         )
-        login_btn.pack(pady=15)
+        self.login_btn.pack(pady=15)
+
+        self.status_label = tk.Label(
+            root, text="Loading data...", font=("Arial", 9), fg="#7f8c8d"
+        )
+        self.status_label.pack()
+        self.root.after(50, self.check_ready)
 
         # Bind Enter key
         self.root.bind("<Return>", lambda e: self.login())
 
+    def check_ready(self):
+        """Show what is still loading and clear the note once everything is"""
+        if not self.preloader.is_ready("user_service"):
+            self.root.after(50, self.check_ready)
+        elif not self.preloader.is_ready("event_service"):
+            self.status_label.config(text="Loading events...")
+            self.root.after(50, self.check_ready)
+        elif self._opening is None:
+            self.status_label.config(text="")
+
     def login(self):
         username = self.username_entry.get().strip()
         password = self.password_entry.get()
@@ -73,6 +95,19 @@ class LoginWindow:
             )
             return
 
+        if self._opening is not None:
+            return  # A dashboard is about to open
+        if not self.preloader.is_ready("user_service"):
+            # Try again once the users are loaded, without blocking Tk
+            if self._login_job is None:
+                self._login_job = self.root.after(50, self._retry_login)
+            return
+        if self.user_service is None:
+            self.user_service = self.preloader.get("user_service")
+        if self.user_service is None:
+            messagebox.showerror("Error", "User data could not be loaded!")
+            return
+
         # Authenticate without role - let the system determine the role
         user = self.user_service.authenticate_without_role(username, password)
 
@@ -80,27 +115,50 @@ class LoginWindow:
             messagebox.showinfo(
                 "Success", f"Welcome {username}!\nLogged in as: {user.role}"
             )
-            self.open_dashboard(user)
+            self.open_when_ready(user)
         else:
             messagebox.showerror("Login Failed", "Invalid username or password!")
 
+    def _retry_login(self):
+        self._login_job = None
+        self.login()
+
+    def open_when_ready(self, user):
+        """Open the dashboard once events are loaded, keeping the window live"""
+        if self.preloader.is_ready("event_service"):
+            self._opening = None
+            self.open_dashboard(user)
+            return
+        if self._opening is None:
+            self._opening = user
+            self.login_btn.config(state=tk.DISABLED)
+            self.status_label.config(text="Loading events...")
+        self.root.after(50, self.open_when_ready, user)
+
     def open_dashboard(self, user):
         """Open the appropriate dashboard based on user role"""
+        self.create_dashboard(user).mainloop()
+
+    def create_dashboard(self, user):
+        """Replace the login window with the dashboard and return its root"""
+        event_service = self.preloader.take("event_service")
+        options = (self.preloader.event_options, self.preloader.user_options)
         self.root.destroy()
 
         new_root = tk.Tk()
 
+        # Dashboard modules were imported by the preloader, so this is cheap
         if user.role == "Admin":
             from ui.admin_ui import AdminWindow
 
-            AdminWindow(new_root, user)
+            AdminWindow(new_root, user, event_service, self.user_service, *options)
         elif user.role == "Organizer":
             from ui.organizer_ui import OrganizerWindow
 
-            OrganizerWindow(new_root, user)
+            OrganizerWindow(new_root, user, event_service, self.user_service, *options)
         else:  # Student or Visitor
             from ui.student_ui import StudentWindow
 
-            StudentWindow(new_root, user)
+            StudentWindow(new_root, user, event_service, self.user_service, *options)
 
-        new_root.mainloop()
+        return new_root
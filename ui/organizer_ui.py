@@ -6,17 +6,35 @@ import tkinter as tk
 from tkinter import messagebox, ttk
 from services.event_service import EventService
 from services.user_service import UserService
+from ui import watchdog
+from ui.preloader import DEFAULT_EVENT_OPTIONS
 
 
 class OrganizerWindow:
-    def __init__(self, root, user):
+    def __init__(
+        self,
+        root,
+        user,
+        event_service=None,
+        user_service=None,
+        event_options=None,
+        user_options=None,
+    ):
         self.root = root
         self.user = user
+        # Configured service options, reused when logging in again
+        self.event_options = dict(
+            DEFAULT_EVENT_OPTIONS if event_options is None else event_options
+        )
+        self.user_options = dict(user_options or {})
         self.root.title(f"Organizer Dashboard - {user.username}")
         self.root.geometry("900x600")
+        watchdog.attach(root)
 
-        self.event_service = EventService()
-        self.user_service = UserService()
+        # Services may be handed over already loaded by the login preloader
+        self.event_service = event_service or EventService(**self.event_options)
+        self.user_service = user_service or UserService(**self.user_options)
+        self.event_service.set_user_service(self.user_service)
 
         # Header
         header_frame = tk.Frame(root, bg="#16a085", height=60)
@@ -124,7 +142,12 @@ class OrganizerWindow:
             width=18,
         ).pack(side=tk.LEFT, padx=5)
 
-        # Load data
+        # Load data once the window has been drawn
+        self.root.after_idle(self.load_data)
+
+    def load_data(self):
+        """Fill the window after the first frame"""
+        self.root.update_idletasks()
         self.populate_table()
 
     def populate_table(self):
@@ -143,7 +166,7 @@ class OrganizerWindow:
                     event.date,
                     event.location or "-",
                     event.capacity,
-                    len(event.attendees),
+                    event.attendee_count(),
                     event.available_slots(),
                 ),
             )
@@ -177,6 +200,7 @@ Location: {event.location or 'Not specified'}
 Capacity: {event.capacity}
 Registered: {len(event.attendees)}
 Available: {event.available_slots()}
+Waitlist: {len(event.waitlist)}
 
 Description:
 {event.description or 'No description provided'}
@@ -254,18 +278,18 @@ Attendees ({len(event.attendees)}):
         # Create management window
         manage_win = tk.Toplevel(self.root)
         manage_win.title(f"Manage Registrations - {event.name}")
-        manage_win.geometry("500x500")
+        manage_win.geometry("500x560")
         manage_win.transient(self.root)
 
         tk.Label(
             manage_win, text=f"Manage: {event.name}", font=("Arial", 12, "bold")
         ).pack(pady=10)
 
-        tk.Label(
-            manage_win,
-            text=f"Registered: {len(event.attendees)} / {event.capacity}",
-            font=("Arial", 10),
-        ).pack()
+        registered_label = tk.Label(manage_win, font=("Arial", 10))
+        registered_label.pack()
+
+        waitlist_label = tk.Label(manage_win, font=("Arial", 10))
+        waitlist_label.pack()
 
         # Attendee list
         list_frame = tk.LabelFrame(
@@ -276,8 +300,12 @@ Attendees ({len(event.attendees)}):
         scrollbar = tk.Scrollbar(list_frame)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
+        # Extended selection: Ctrl/Shift-click to pick several attendees
         listbox = tk.Listbox(
-            list_frame, font=("Arial", 10), yscrollcommand=scrollbar.set
+            list_frame,
+            font=("Arial", 10),
+            selectmode=tk.EXTENDED,
+            yscrollcommand=scrollbar.set,
         )
         listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=5, pady=5)
         scrollbar.config(command=listbox.yview)
@@ -285,9 +313,14 @@ Attendees ({len(event.attendees)}):
         def refresh_list():
             listbox.delete(0, tk.END)
             event = self.event_service.get_event_by_id(event_id)
-            if event and event.attendees:
-                for attendee in event.attendees:
-                    listbox.insert(tk.END, attendee)
+            if not event:
+                return
+            registered_label.config(
+                text=f"Registered: {len(event.attendees)} / {event.capacity}"
+            )
+            waitlist_label.config(text=f"Waitlist: {len(event.waitlist)}")
+            if event.attendees:
+                listbox.insert(tk.END, *event.attendees)
 
         refresh_list()
 
@@ -295,36 +328,54 @@ Attendees ({len(event.attendees)}):
         btn_frame = tk.Frame(manage_win)
         btn_frame.pack(pady=10)
 
-        def remove_attendee():
+        def remove_attendees():
             selection = listbox.curselection()
             if not selection:
-                messagebox.showwarning(
-                    "Warning", "Please select an attendee to remove."
-                )
+                messagebox.showwarning("Warning", "Please select attendees to remove.")
                 return
 
-            username = listbox.get(selection[0])
+            usernames = [listbox.get(index) for index in selection]
+            if len(usernames) == 1:
+                question = f"Remove {usernames[0]} from this event?"
+            else:
+                question = f"Remove {len(usernames)} attendees from this event?"
 
-            if messagebox.askyesno("Confirm", f"Remove {username} from this event?"):
+            if messagebox.askyesno("Confirm", question, parent=manage_win):
                 try:
-                    self.event_service.unregister_attendee(event_id, username)
-                    self.user_service.unregister_event(username, event_id)
-                    messagebox.showinfo("Success", "Attendee removed successfully!")
+                    # Also updates the removed and promoted users
+                    removed = self.event_service.unregister_attendees(
+                        event_id, usernames
+                    )
+                    messagebox.showinfo(
+                        "Success",
+                        f"{len(removed)} attendee(s) removed successfully!",
+                        parent=manage_win,
+                    )
                     refresh_list()
                     self.populate_table()
                 except ValueError as e:
-                    messagebox.showerror("Error", str(e))
+                    messagebox.showerror("Error", str(e), parent=manage_win)
 
         tk.Button(
             btn_frame,
-            text="Remove Selected Attendee",
-            command=remove_attendee,
+            text="Remove Selected Attendees",
+            command=remove_attendees,
             bg="#e74c3c",
             fg="white",
             font=("Arial", 10, "bold"),
             width=25,
         ).pack(pady=5)
 
+        tk.Button(
+            btn_frame,
+            text="Enroll Users...",
+            command=lambda: self.enroll_users(event_id, manage_win, refresh_list),
+            bg="#27ae60",
+            fg="white",
+            font=("Arial", 10, "bold"),
+            width=25,
+        ).pack(pady=5)
+
         tk.Button(
             btn_frame,
             text="Close",
@@ -335,6 +386,72 @@ Attendees ({len(event.attendees)}):
             width=25,
         ).pack(pady=5)
 
+    def enroll_users(self, event_id, parent, on_done=None):
+        """Register a list of usernames, e.g. a whole class, in one step"""
+        event = self.event_service.get_event_by_id(event_id)
+        if not event:
+            messagebox.showerror("Error", "Event not found!", parent=parent)
+            return
+
+        enroll_win = tk.Toplevel(parent)
+        enroll_win.title(f"Enroll Users - {event.name}")
+        enroll_win.geometry("400x400")
+        enroll_win.transient(parent)
+
+        tk.Label(
+            enroll_win,
+            text="Usernames (one per line, or separated by commas):",
+            font=("Arial", 10),
+        ).pack(pady=10)
+
+        text = tk.Text(enroll_win, font=("Arial", 10), height=15)
+        text.pack(fill=tk.BOTH, expand=True, padx=20)
+        text.focus()
+
+        def enroll():
+            usernames = text.get("1.0", tk.END).replace(",", " ").split()
+            if not usernames:
+                messagebox.showwarning(
+                    "Warning", "Please enter at least one username.", parent=enroll_win
+                )
+                return
+
+            unknown = [u for u in usernames if not self.user_service.get_user(u)]
+            if unknown:
+                messagebox.showerror(
+                    "Error",
+                    f"Unknown users: {', '.join(unknown[:10])}"
+                    + (" ..." if len(unknown) > 10 else ""),
+                    parent=enroll_win,
+                )
+                return
+
+            try:
+                added = self.event_service.register_attendees(event_id, usernames)
+            except ValueError as e:
+                messagebox.showerror("Error", str(e), parent=enroll_win)
+                return
+
+            skipped = len(set(usernames)) - len(added)
+            message = f"{len(added)} user(s) enrolled."
+            if skipped:
+                message += f" {skipped} already registered."
+            messagebox.showinfo("Success", message, parent=enroll_win)
+            enroll_win.destroy()
+            if on_done:
+                on_done()
+            self.populate_table()
+
+        tk.Button(
+            enroll_win,
+            text="Enroll",
+            command=enroll,
+            bg="#27ae60",
+            fg="white",
+            font=("Arial", 10, "bold"),
+            width=20,
+        ).pack(pady=10)
+
     def logout(self):
         """Logout and return to login screen"""
         if messagebox.askyesno("Logout", "Are you sure you want to logout?"):
@@ -342,5 +459,5 @@ Attendees ({len(event.attendees)}):
             root = tk.Tk()
             from ui.login_ui import LoginWindow
 
-            LoginWindow(root)
+            LoginWindow(root, None, self.event_options, self.user_options)
             root.mainloop()
@@ -0,0 +1,83 @@
+"""
+Preloader - Warms up services and dashboard modules on a background thread
+"""
+
+import importlib
+import threading
+
+# Dashboards are imported ahead of time so opening one after login is instant
+DASHBOARD_MODULES = ("ui.admin_ui", "ui.organizer_ui", "ui.student_ui")
+# EventService options when none are configured
+DEFAULT_EVENT_OPTIONS = {"columnar": True}
+
+
+class Preloader:
+    """
+    Loads the user and event services while the login window is shown.
+
+    The services are built off the Tk thread and handed over through
+    get()/take(), which wait until the background work has finished.
+    Tk widgets must never be touched from the loader thread.
+    event_options and user_options are passed to EventService and
+    UserService, so the preloaded services use the configured storage.
+    """
+
+    def __init__(self, event_options=None, user_options=None):
+        self.event_options = dict(
+            DEFAULT_EVENT_OPTIONS if event_options is None else event_options
+        )
+        self.user_options = dict(user_options or {})
+        self._results = {}
+        self._ready = {
+            name: threading.Event() for name in ("user_service", "event_service")
+        }
+        self._thread = None
+
+    def start(self):
+        """Start loading in the background"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+        return self
+
+    def _run(self):
+        self._load(
+            "user_service", "services.user_service", "UserService", self.user_options
+        )
+        for module in DASHBOARD_MODULES:
+            try:
+                importlib.import_module(module)
+            except Exception as e:
+                print(f"Error preloading {module}: {e}")
+        self._load(
+            "event_service",
+            "services.event_service",
+            "EventService",
+            self.event_options,
+        )
+
+    def _load(self, name, module, factory, kwargs):
+        try:
+            service_class = getattr(importlib.import_module(module), factory)
+            self._results[name] = service_class(**kwargs)
+        except Exception as e:
+            print(f"Error preloading {name}: {e}")
+            self._results[name] = None
+        finally:
+            self._ready[name].set()
+
+    def is_ready(self, name):
+        """Check if a service has finished loading"""
+        return self._ready[name].is_set()
+
+    def get(self, name, timeout=None):
+        """Wait for a service and return it (None if loading failed)"""
+        self.start()
+        self._ready[name].wait(timeout)
+        return self._results.get(name)
+
+    def take(self, name, timeout=None):
+        """Wait for a service and hand it over, so it is only used once"""
+        service = self.get(name, timeout)
+        self._results.pop(name, None)
+        return service
@@ -0,0 +1,121 @@
+"""
+UI Profiler - Samples the Tk main thread and groups stacks by UI action
+
+Every few milliseconds a background thread captures the main thread's
+Python stack and files it under the callback that is running (see
+ui.callbacks). Samples taken while Tk is idle in its event loop are only
+counted. write() produces one collapsed-stack file per action, the input
+format of flamegraph.pl, speedscope and similar tools.
+"""
+
+import os
+import re
+import sys
+import threading
+import time
+
+from ui import callbacks
+
+# Action name for code that runs outside any Tk callback
+STARTUP = "startup"
+
+
+def frame_label(frame):
+    """Return module:function for a stack frame"""
+    code = frame.f_code
+    module = os.path.splitext(os.path.basename(code.co_filename))[0]
+    if module == "__init__":
+        module = os.path.basename(os.path.dirname(code.co_filename))
+    return f"{module}:{code.co_name}"
+
+
+def collapse(frame):
+    """Return a stack as a root-first ';'-joined string"""
+    labels = []
+    while frame is not None:
+        labels.append(frame_label(frame))
+        frame = frame.f_back
+    return ";".join(reversed(labels))
+
+
+def is_idle(frame):
+    """Check if the innermost frame is Tk waiting in mainloop"""
+    return frame.f_code.co_name == "mainloop" and "tkinter" in frame.f_code.co_filename
+
+
+class SamplingProfiler:
+    """Statistical profiler of the main thread, tagged by UI action"""
+
+    def __init__(self, interval=0.005):
+        self.interval = interval
+        self.samples = {}  # Action -> {collapsed stack: count}
+        self.idle_samples = 0
+        self.started = None
+        self.elapsed = 0.0
+        self._thread_id = threading.main_thread().ident
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Start sampling in the background"""
+        self.started = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop sampling"""
+        if self._thread is None:
+            return
+        self._stopped.set()
+        self._thread.join()
+        self._thread = None
+        self.elapsed = time.perf_counter() - self.started
+
+    def _run(self):
+        while not self._stopped.wait(self.interval):
+            self.sample()
+
+    def sample(self):
+        """Take one sample of the main thread"""
+        frame = sys._current_frames().get(self._thread_id)
+        if frame is None:
+            return
+        if is_idle(frame):
+            self.idle_samples += 1
+            return
+        action = callbacks.current_action() or STARTUP
+        stacks = self.samples.get(action)
+        if stacks is None:
+            stacks = self.samples[action] = {}
+        stack = collapse(frame)
+        stacks[stack] = stacks.get(stack, 0) + 1
+
+    def totals(self):
+        """Return {action: sample count}, busiest first"""
+        totals = {
+            action: sum(stacks.values()) for action, stacks in self.samples.items()
+        }
+        return dict(sorted(totals.items(), key=lambda item: -item[1]))
+
+    def write(self, directory):
+        """Write <action>.folded files and return their paths"""
+        os.makedirs(directory, exist_ok=True)
+        paths = []
+        for action, stacks in self.samples.items():
+            filename = re.sub(r"[^\w.-]+", "_", action) + ".folded"
+            path = os.path.join(directory, filename)
+            with open(path, "w", encoding="utf-8") as f:
+                for stack, count in sorted(stacks.items()):
+                    f.write(f"{stack} {count}\n")
+            paths.append(path)
+        return paths
+
+    def summary(self):
+        """Return a text table of time per action"""
+        lines = [f"{'Action':<50} {'Samples':>8} {'~ms':>8}"]
+        for action, count in self.totals().items():
+            milliseconds = count * self.interval * 1000
+            lines.append(f"{action:<50} {count:>8} {milliseconds:>8.0f}")
+        lines.append(f"{'(idle in event loop)':<50} {self.idle_samples:>8}")
+        return "\n".join(lines)
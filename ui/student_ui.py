@@ -6,17 +6,36 @@ import tkinter as tk
 from tkinter import messagebox, ttk
 from services.event_service import EventService
 from services.user_service import UserService
+from ui import watchdog
+from ui.live_search import LiveSearch, TreeFiller
+from ui.preloader import DEFAULT_EVENT_OPTIONS
 
 
 class StudentWindow:
-    def __init__(self, root, user):
+    def __init__(
+        self,
+        root,
+        user,
+        event_service=None,
+        user_service=None,
+        event_options=None,
+        user_options=None,
+    ):
         self.root = root
         self.user = user
+        # Configured service options, reused when logging in again
+        self.event_options = dict(
+            DEFAULT_EVENT_OPTIONS if event_options is None else event_options
+        )
+        self.user_options = dict(user_options or {})
         self.root.title(f"Student Dashboard - {user.username}")
         self.root.geometry("1000x650")
+        watchdog.attach(root)
 
-        self.event_service = EventService()
-        self.user_service = UserService()
+        # Services may be handed over already loaded by the login preloader
+        self.event_service = event_service or EventService(**self.event_options)
+        self.user_service = user_service or UserService(**self.user_options)
+        self.event_service.set_user_service(self.user_service)
 
         # Header
         header_frame = tk.Frame(root, bg="#3498db", height=60)
@@ -69,10 +88,17 @@ class StudentWindow:
         tk.Button(
             search_frame,
             text="Clear",
-            command=self.load_all_events,
+            command=self.clear_search,
             bg="#95a5a6",
             fg="white",
         ).pack(side=tk.LEFT, padx=2)
+        self.show_full_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(
+            search_frame,
+            text="Show full",
+            variable=self.show_full_var,
+            command=lambda: self.load_all_events(reload=False),
+        ).pack(side=tk.LEFT, padx=2)
 
         # All events treeview
         tree_frame = tk.Frame(left_frame)
@@ -97,11 +123,17 @@ class StudentWindow:
         self.all_events_tree.column("Name", width=200)
         self.all_events_tree.column("Date", width=100, anchor="center")
         self.all_events_tree.column("Location", width=120)
-        self.all_events_tree.column("Available", width=100, anchor="center")
+        self.all_events_tree.column("Available", width=140, anchor="center")
 
         self.all_events_tree.pack(fill=tk.BOTH, expand=True)
         self.all_events_tree.bind("<Double-1>", self.view_event_details)
 
+        # Search as you type, refining the previous result while it narrows
+        self.filler = TreeFiller(self.all_events_tree, self.event_row)
+        self.live_search = LiveSearch(
+            self.search_entry, self.find_events, self.filler.show
+        ).bind()
+
         # Action buttons
         btn_frame = tk.Frame(left_frame)
         btn_frame.pack(fill=tk.X, padx=10, pady=(0, 10))
@@ -139,7 +171,7 @@ class StudentWindow:
         my_scrollbar = tk.Scrollbar(my_tree_frame)
         my_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
-        my_columns = ("ID", "Name", "Date", "Location")
+        my_columns = ("ID", "Name", "Date", "Location", "Status")
         self.my_events_tree = ttk.Treeview(
             my_tree_frame,
             columns=my_columns,
@@ -152,11 +184,13 @@ class StudentWindow:
         self.my_events_tree.heading("Name", text="Event Name")
         self.my_events_tree.heading("Date", text="Date")
         self.my_events_tree.heading("Location", text="Location")
+        self.my_events_tree.heading("Status", text="Status")
 
         self.my_events_tree.column("ID", width=40, anchor="center")
         self.my_events_tree.column("Name", width=150)
         self.my_events_tree.column("Date", width=90, anchor="center")
         self.my_events_tree.column("Location", width=100)
+        self.my_events_tree.column("Status", width=90, anchor="center")
 
         self.my_events_tree.pack(fill=tk.BOTH, expand=True)
 
@@ -184,55 +218,59 @@ class StudentWindow:
             width=18,
         ).pack(side=tk.LEFT, padx=5)
 
-        # Load data
-        self.load_all_events()
-        self.load_my_events()
+        # Load data once the window has been drawn
+        self.root.after_idle(self.load_data)
 
-    def load_all_events(self):
-        """Load and display all available events"""
-        for i in self.all_events_tree.get_children():
-            self.all_events_tree.delete(i)
+    def load_data(self):
+        """Fill the window from the events already in memory"""
+        self.root.update_idletasks()
+        self.load_all_events(reload=False)
+        self.load_my_events()
 
-        events = self.event_service.get_all_events()
-        for event in events:
-            # Only show events with available slots
-            if event.available_slots() > 0:
-                self.all_events_tree.insert(
-                    "",
-                    "end",
-                    values=(
-                        event.id,
-                        event.name,
-                        event.date,
-                        event.location or "-",
-                        f"{event.available_slots()} / {event.capacity}",
-                    ),
-                )
+    def load_all_events(self, reload=True):
+        """Load and display available events matching the search box"""
+        if reload:
+            self.event_service.get_all_events()
+        self.live_search.reset(clear_entry=False)
+        self.live_search.run()
+
+    def find_events(self, keyword, candidates):
+        """Search the catalog, or only candidates when refining a search"""
+        # Without "Show full" only events with free seats are listed, by date
+        return self.event_service.search_events(
+            keyword=keyword,
+            within=candidates,
+            open_only=not self.show_full_var.get(),
+        )
 
     def search_events(self):
         """Search events by keyword"""
-        keyword = self.search_entry.get().strip()
-        if not keyword:
-            self.load_all_events()
-            return
+        self.live_search.run()
 
-        for i in self.all_events_tree.get_children():
-            self.all_events_tree.delete(i)
+    def clear_search(self):
+        """Clear the search box and show all available events"""
+        self.live_search.reset()
+        self.load_all_events()
 
-        events = self.event_service.search_events(keyword=keyword)
-        for event in events:
-            if event.available_slots() > 0:
-                self.all_events_tree.insert(
-                    "",
-                    "end",
-                    values=(
-                        event.id,
-                        event.name,
-                        event.date,
-                        event.location or "-",
-                        f"{event.available_slots()} / {event.capacity}",
-                    ),
-                )
+    def event_row(self, event):
+        """Return the available events row of an event, None to hide it"""
+        # Only show events with available slots unless asked for full ones
+        if event.is_almost_full():
+            available = f"{event.available_slots()} / {event.capacity} (almost full)"
+        elif event.available_slots() > 0:
+            available = f"{event.available_slots()} / {event.capacity}"
+        elif self.show_full_var.get():
+            available = f"Full ({len(event.waitlist)} waiting)"
+        else:
+            return None
+
+        return (
+            event.id,
+            event.name,
+            event.date,
+            event.location or "-",
+            available,
+        )
 
     def load_my_events(self):
         """Load and display user's registered events"""
@@ -244,7 +282,28 @@ class StudentWindow:
             self.my_events_tree.insert(
                 "",
                 "end",
-                values=(event.id, event.name, event.date, event.location or "-"),
+                values=(
+                    event.id,
+                    event.name,
+                    event.date,
+                    event.location or "-",
+                    "Registered",
+                ),
+            )
+
+        waitlisted = self.event_service.get_user_waitlisted_events(self.user.username)
+        for event in waitlisted:
+            position = event.waitlist_position(self.user.username)
+            self.my_events_tree.insert(
+                "",
+                "end",
+                values=(
+                    event.id,
+                    event.name,
+                    event.date,
+                    event.location or "-",
+                    f"Waitlist #{position}",
+                ),
             )
 
     def register_event(self):
@@ -258,6 +317,11 @@ class StudentWindow:
         event_id = item["values"][0]
         event_name = item["values"][1]
 
+        event = self.event_service.get_event_by_id(event_id)
+        if event and event.is_full():
+            self.join_waitlist(event_id, event_name)
+            return
+
         if messagebox.askyesno(
             "Confirm Registration", f"Do you want to register for '{event_name}'?"
         ):
@@ -283,6 +347,10 @@ class StudentWindow:
         event_id = item["values"][0]
         event_name = item["values"][1]
 
+        if str(item["values"][4]).startswith("Waitlist"):
+            self.leave_waitlist(event_id, event_name)
+            return
+
         if messagebox.askyesno(
             "Confirm Unregistration", f"Do you want to unregister from '{event_name}'?"
         ):
@@ -393,6 +461,14 @@ class StudentWindow:
                 font=("Arial", 10, "bold"),
                 fg="#27ae60",
             ).pack(side=tk.LEFT, padx=5)
+        elif event.is_waitlisted(self.user.username):
+            position = event.waitlist_position(self.user.username)
+            tk.Label(
+                btn_frame,
+                text=f"⏳ Waitlist position #{position}",
+                font=("Arial", 10, "bold"),
+                fg="#e67e22",
+            ).pack(side=tk.LEFT, padx=5)
         else:
             tk.Label(
                 btn_frame,
@@ -400,6 +476,15 @@ class StudentWindow:
                 font=("Arial", 10, "bold"),
                 fg="#e74c3c",
             ).pack(side=tk.LEFT, padx=5)
+            tk.Button(
+                btn_frame,
+                text="Join Waitlist",
+                command=lambda: self.join_waitlist(event_id, event.name, details_win),
+                bg="#e67e22",
+                fg="white",
+                font=("Arial", 10, "bold"),
+                width=15,
+            ).pack(side=tk.LEFT, padx=5)
 
         tk.Button(
             btn_frame,
@@ -425,6 +510,38 @@ class StudentWindow:
         except ValueError as e:
             messagebox.showerror("Error", str(e))
 
+    def join_waitlist(self, event_id, event_name, window=None):
+        """Join the waitlist of a full event"""
+        if not messagebox.askyesno(
+            "Event Full",
+            f"'{event_name}' is full. Do you want to join the waitlist?",
+        ):
+            return
+
+        try:
+            position = self.event_service.join_waitlist(event_id, self.user.username)
+            messagebox.showinfo(
+                "Waitlist",
+                f"You are #{position} on the waitlist for '{event_name}'.\n"
+                "You will be registered automatically when a seat frees up.",
+            )
+            if window:
+                window.destroy()
+            self.load_my_events()
+        except ValueError as e:
+            messagebox.showerror("Error", str(e))
+
+    def leave_waitlist(self, event_id, event_name):
+        """Leave the waitlist of an event"""
+        if messagebox.askyesno(
+            "Leave Waitlist", f"Do you want to leave the waitlist for '{event_name}'?"
+        ):
+            try:
+                self.event_service.leave_waitlist(event_id, self.user.username)
+                self.load_my_events()
+            except ValueError as e:
+                messagebox.showerror("Error", str(e))
+
     def logout(self):
         """Logout and return to login screen"""
         if messagebox.askyesno("Logout", "Are you sure you want to logout?"):
@@ -432,5 +549,5 @@ class StudentWindow:
             root = tk.Tk()
             from ui.login_ui import LoginWindow
 
-            LoginWindow(root)
+            LoginWindow(root, None, self.event_options, self.user_options)
             root.mainloop()
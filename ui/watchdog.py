@@ -0,0 +1,165 @@
+"""
+UI Watchdog - Detects stalls of the Tk event loop
+
+A heartbeat scheduled with root.after() measures how late the event loop
+runs it. A monitor thread notices when the heartbeat stops and captures
+the main thread's stack and the running callback (see ui.callbacks)
+while the loop is still blocked. Each stall over the threshold is kept in
+memory for the admin diagnostics panel and written to a log file.
+"""
+
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+
+from ui import callbacks
+
+active = None  # Running Watchdog, if any
+
+
+class Stall:
+    """One period where the event loop did not run"""
+
+    def __init__(self, started, action, stack):
+        self.started = started  # Wall clock time the stall was detected
+        self.action = action or "(no callback)"
+        self.stack = stack
+        self.duration = None  # Seconds, set once the loop runs again
+
+    def describe(self):
+        """Return a one-line summary"""
+        when = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(self.started))
+        if self.duration is None:
+            return f"{when} stalled in {self.action} (still blocked)"
+        return f"{when} stalled {self.duration * 1000:.0f} ms in {self.action}"
+
+
+class Watchdog:
+    """
+    Measures event-loop lag and records stalls with their stacks.
+
+    interval is the heartbeat period and threshold the lag that counts as
+    a stall, both in seconds. Windows created later call attach() so the
+    heartbeat follows the current Tk root.
+    """
+
+    def __init__(
+        self, interval=0.1, threshold=0.25, log_file="logs/ui_stalls.log", keep=100
+    ):
+        if threshold <= interval:
+            raise ValueError("threshold must be larger than interval")
+
+        self.interval = interval
+        self.threshold = threshold
+        self.log_file = log_file
+        self.stalls = deque(maxlen=keep)  # Appended by the monitor thread
+        self.stall_count = 0  # Stalls detected so far, including dropped ones
+        self.lags = deque(maxlen=50)  # Recent heartbeat delays in seconds
+        self.max_lag = 0.0
+        self.root = None
+        self._generation = 0
+        self._last_beat = None
+        self._current = None  # Stall being captured
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread_id = threading.main_thread().ident
+        self._thread = None
+
+    def start(self, root=None):
+        """Start monitoring (installs callback tracking)"""
+        global active
+        callbacks.install()
+        active = self
+        self._thread = threading.Thread(target=self._monitor, daemon=True)
+        self._thread.start()
+        if root is not None:
+            self.attach(root)
+        return self
+
+    def stop(self):
+        """Stop monitoring"""
+        global active
+        self._stopped.set()
+        self._generation += 1
+        if active is self:
+            active = None
+
+    def attach(self, root):
+        """Send heartbeats through a (new) Tk root"""
+        self._generation += 1
+        self.root = root
+        self._schedule(self._generation)
+
+    def _schedule(self, generation):
+        scheduled = time.perf_counter()
+        with self._lock:
+            self._last_beat = scheduled
+        self.root.after(
+            int(self.interval * 1000), lambda: self._beat(generation, scheduled)
+        )
+
+    def _beat(self, generation, scheduled):
+        if generation != self._generation:
+            return  # A newer root took over
+        lag = max(0.0, time.perf_counter() - scheduled - self.interval)
+        self.lags.append(lag)
+        self.max_lag = max(self.max_lag, lag)
+
+        with self._lock:
+            stall, self._current = self._current, None
+        if stall is not None:
+            stall.duration = lag
+            self._write(f"{stall.describe()}\n")
+        self._schedule(generation)
+
+    def _monitor(self):
+        """Capture the main thread while the heartbeat is overdue"""
+        while not self._stopped.wait(self.interval / 2):
+            with self._lock:
+                last_beat = self._last_beat
+                stalled = self._current is not None
+            if last_beat is None or stalled:
+                continue
+            if time.perf_counter() - last_beat < self.threshold + self.interval:
+                continue
+
+            frame = sys._current_frames().get(self._thread_id)
+            stack = "".join(traceback.format_stack(frame)) if frame else ""
+            stall = Stall(time.time(), callbacks.current_action(), stack)
+            with self._lock:
+                if self._last_beat != last_beat:
+                    continue  # The loop recovered while capturing
+                self._current = stall
+                self.stalls.append(stall)
+                self.stall_count += 1
+            self._write(f"{stall.describe()}\n{stack}\n")
+
+    def _write(self, text):
+        if not self.log_file:
+            return
+        try:
+            folder = os.path.dirname(self.log_file)
+            if folder:
+                os.makedirs(folder, exist_ok=True)
+            with open(self.log_file, "a", encoding="utf-8") as f:
+                f.write(text)
+        except OSError as e:
+            print(f"Error writing stall log: {e}")
+
+    def recent_stalls(self):
+        """Return the stall count and a copy of the kept stalls, oldest first"""
+        with self._lock:
+            return self.stall_count, list(self.stalls)
+
+    def average_lag(self):
+        """Return the mean of recent heartbeat delays in seconds"""
+        return sum(self.lags) / len(self.lags) if self.lags else 0.0
+
+
+def attach(root):
+    """Point the running watchdog at a new Tk root, if one is running"""
+    if active is not None:
+        active.attach(root)